@@ -3,107 +3,318 @@
 Valtheron CLI - Command Line Interface for the Agentic Workspace.
 Provides commands for managing agents, executing tasks, and running workflows.
 """
-import argparse
-import json
 import os
 import sys
 from pathlib import Path
-from typing import Optional
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-
-class Colors:
-    """ANSI color codes for terminal output."""
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-    RESET = '\033[0m'
-    
-    @classmethod
-    def disable(cls):
-        """Disable colors (for non-TTY output)."""
-        cls.HEADER = ''
-        cls.BLUE = ''
-        cls.CYAN = ''
-        cls.GREEN = ''
-        cls.YELLOW = ''
-        cls.RED = ''
-        cls.BOLD = ''
-        cls.DIM = ''
-        cls.RESET = ''
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import argparse
+
+# Make the workspace packages importable when running from a source checkout.
+# An installed package already has its root on sys.path, so skip the insert.
+_WORKSPACE_ROOT = os.path.dirname(os.path.dirname(__file__))
+if _WORKSPACE_ROOT not in sys.path:
+    sys.path.insert(0, _WORKSPACE_ROOT)
+
+
+# ANSI color codes for terminal output.
+_ANSI = {
+    'HEADER': '\033[95m',
+    'BLUE': '\033[94m',
+    'CYAN': '\033[96m',
+    'GREEN': '\033[92m',
+    'YELLOW': '\033[93m',
+    'RED': '\033[91m',
+    'BOLD': '\033[1m',
+    'DIM': '\033[2m',
+    'RESET': '\033[0m',
+}
+_PLAIN = dict.fromkeys(_ANSI, '')
+
+
+def _build_templates(c: dict) -> dict:
+    """Precompute the styled fragments used by the print_* helpers."""
+    bar = f"{c['BOLD']}{c['CYAN']}{'═' * 60}{c['RESET']}"
+    return {
+        'header_open': f"\n{bar}\n{c['BOLD']}{c['CYAN']}  ",
+        'header_close': f"{c['RESET']}\n{bar}\n\n",
+        'success': f"{c['GREEN']}✓{c['RESET']} ",
+        'error': f"{c['RED']}✗{c['RESET']} ",
+        'warning': f"{c['YELLOW']}⚠{c['RESET']} ",
+        'info': f"{c['BLUE']}ℹ{c['RESET']} ",
+    }
+
+
+_TEMPLATES_ON = _build_templates(_ANSI)
+_TEMPLATES_OFF: Optional[dict] = None  # built on first set_colors(False)
+
+# Active palette and templates, swapped together by set_colors().
+C = _ANSI
+_T = _TEMPLATES_ON
+
+
+def set_colors(enabled: bool) -> None:
+    """Enable or disable colored output (disable for non-TTY output)."""
+    global C, _T, _TEMPLATES_OFF
+    if enabled:
+        C, _T = _ANSI, _TEMPLATES_ON
+    else:
+        if _TEMPLATES_OFF is None:
+            _TEMPLATES_OFF = _build_templates(_PLAIN)
+        C, _T = _PLAIN, _TEMPLATES_OFF
+
+
+def __getattr__(name: str) -> str:
+    """
+    Resolve color names (``valtheron.GREEN``) against the active palette.
+    
+    Values are not cached on the module because set_colors() can switch
+    palettes after first access.
+    """
+    try:
+        return C[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
 
 def print_header(text: str):
     """Print a styled header."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'═' * 60}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}  {text}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'═' * 60}{Colors.RESET}\n")
+    sys.stdout.write(_T['header_open'] + text + _T['header_close'])
 
 
 def print_success(text: str):
     """Print success message."""
-    print(f"{Colors.GREEN}✓{Colors.RESET} {text}")
+    print(_T['success'] + text)
 
 
 def print_error(text: str):
     """Print error message."""
-    print(f"{Colors.RED}✗{Colors.RESET} {text}")
+    print(_T['error'] + text)
 
 
 def print_warning(text: str):
     """Print warning message."""
-    print(f"{Colors.YELLOW}⚠{Colors.RESET} {text}")
+    print(_T['warning'] + text)
 
 
 def print_info(text: str):
     """Print info message."""
-    print(f"{Colors.BLUE}ℹ{Colors.RESET} {text}")
+    print(_T['info'] + text)
 
 
 def print_json(data: dict, indent: int = 2):
-    """Print formatted JSON."""
+    """Print formatted JSON (serialized with orjson when it is installed)."""
+    if indent == 2:
+        try:
+            import orjson
+            print(orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8"))
+            return
+        except (ImportError, TypeError):
+            # orjson missing, or data it cannot encode: use the stdlib path
+            pass
+    import json
     print(json.dumps(data, indent=indent, default=str))
 
 
+# Number of streamed chunks buffered between explicit stdout flushes.
+_STREAM_FLUSH_EVERY = 8
+
+
+def _cache_dir() -> str:
+    """Return the on-disk cache directory for parsed workspace files."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "valtheron")
+
+
+def _cached_json_load(path: str):
+    """
+    Load a JSON file through an mtime-keyed on-disk cache.
+    
+    The parsed document is stored as a marshal blob named after the source
+    file's path, so each source has exactly one cache file, overwritten in
+    place when the file or the interpreter version changes. The blob records
+    the source's mtime and size, and repeated CLI invocations over an
+    unchanged workspace skip JSON parsing. Cache failures fall back to a
+    plain load.
+    """
+    import hashlib
+    import json
+    import marshal
+    
+    st = os.stat(path)
+    # marshal's format is specific to the interpreter version
+    stamp = (tuple(sys.version_info[:2]), st.st_mtime_ns, st.st_size)
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    cache_dir = _cache_dir()
+    cache_path = os.path.join(cache_dir, f"{digest}.bin")
+    
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, data = marshal.load(f)
+        if cached_stamp == stamp:
+            return data
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    
+    with open(path) as f:
+        data = json.load(f)
+    
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump((stamp, data), f)
+        os.replace(tmp_path, cache_path)
+        _prune_cache(cache_dir)
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    
+    return data
+
+
+# Most cached files kept; entries for deleted or moved sources age out
+_CACHE_MAX_ENTRIES = 256
+
+
+def _prune_cache(cache_dir: str) -> None:
+    """Remove the least recently written cache files beyond _CACHE_MAX_ENTRIES."""
+    with os.scandir(cache_dir) as it:
+        entries = [e for e in it if e.name.endswith(".bin")]
+    if len(entries) <= _CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime_ns)
+    for entry in entries[:len(entries) - _CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _json_loads(text):
+    """Decode JSON text or bytes, preferring orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(text)
+    return orjson.loads(text)
+
+
+def _load_yaml(stream):
+    """Parse YAML with the libyaml C loader when PyYAML was built with it."""
+    import yaml
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+# File extension -> language for `analyze` when --language is not given
+_LANG_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.java': 'java',
+    '.go': 'go',
+    '.rs': 'rust'
+}
+
+# (name, description) of the tools shipped with the workspace
+_BUILTIN_TOOLS = (
+    ("code_analyzer", "Analyzes code for complexity, security, and performance"),
+    ("test_runner", "Executes tests using pytest or jest"),
+    ("read", "Read file contents"),
+    ("write", "Write content to files"),
+    ("glob", "Search for files matching patterns"),
+    ("grep", "Search file contents for patterns"),
+    ("edit", "Edit files with search and replace"),
+)
+
+# (display name, module) pairs reported by `version`
+_VERSION_COMPONENTS = (
+    ("Agent Orchestrator", "utils.agent_orchestrator"),
+    ("Workflow Engine", "utils.workflow_engine"),
+    ("Tool System", "tools.implementations"),
+    ("Anthropic Provider", "providers.anthropic_provider"),
+)
+
+# Recognized workflow file extensions, in lookup priority order
+_WORKFLOW_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+
+def _find_workflow_file(workflows_dir: str, name: str) -> Optional[Path]:
+    """
+    Locate a workflow definition by name with a single directory scan.
+    
+    When several extensions exist for the same name, the earliest in
+    _WORKFLOW_EXTENSIONS wins.
+    """
+    priority = {f"{name}{ext}": i for i, ext in enumerate(_WORKFLOW_EXTENSIONS)}
+    best = None
+    try:
+        with os.scandir(workflows_dir) as entries:
+            for entry in entries:
+                rank = priority.get(entry.name)
+                if rank is not None and (best is None or rank < best[0]) and entry.is_file():
+                    best = (rank, entry.path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return Path(best[1]) if best else None
+
+
+# Orchestrators keyed by agents directory, reused across ValtheroCLI
+# instances when the CLI is embedded in a long-running process.
+_orchestrator_cache: dict = {}
+
+
 class ValtheroCLI:
     """Main CLI application class."""
     
     def __init__(self):
-        self.workspace_dir = Path.cwd()
+        self._workspace_dir: Optional[Path] = None
         self.config = None
         self.orchestrator = None
         self.provider = None
     
+    @property
+    def workspace_dir(self) -> Path:
+        """Workspace root, resolved from the current directory on first use."""
+        if self._workspace_dir is None:
+            self._workspace_dir = Path.cwd()
+        return self._workspace_dir
+    
+    @workspace_dir.setter
+    def workspace_dir(self, value) -> None:
+        self._workspace_dir = Path(value)
+    
     def load_config(self) -> bool:
         """Load workspace configuration."""
         config_path = self.workspace_dir / "config" / "workspace.json"
-        if config_path.exists():
-            try:
-                with open(config_path) as f:
-                    self.config = json.load(f)
-                return True
-            except Exception as e:
-                print_error(f"Failed to load config: {e}")
+        try:
+            self.config = _cached_json_load(str(config_path))
+            return True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print_error(f"Failed to load config: {e}")
         return False
     
-    def init_orchestrator(self):
-        """Initialize the agent orchestrator."""
-        if self.orchestrator is not None:
-            return
-        
+    def init_orchestrator(self, names: Optional[list] = None):
+        """Initialize the agent orchestrator, registering only ``names`` if given."""
         try:
-            from utils.agent_orchestrator import AgentOrchestrator
-            
             agents_path = str(self.workspace_dir / "agents")
-            self.orchestrator = AgentOrchestrator(config_dir=agents_path)
-            self.orchestrator.load_agents()
+            if self.orchestrator is None:
+                self.orchestrator = _orchestrator_cache.get(agents_path)
+            if self.orchestrator is None:
+                from utils.agent_orchestrator import AgentOrchestrator
+                self.orchestrator = AgentOrchestrator()
+                _orchestrator_cache[agents_path] = self.orchestrator
+            self.orchestrator.load_agents(agents_path, names=names)
         except ImportError as e:
             print_warning(f"Could not initialize orchestrator: {e}")
         except Exception as e:
@@ -134,6 +345,8 @@ class ValtheroCLI:
         """Initialize a new Valtheron workspace."""
         print_header("Initializing Valtheron Workspace")
         
+        import json
+        
         target_dir = Path(args.directory)
         target_dir.mkdir(parents=True, exist_ok=True)
         
@@ -172,7 +385,7 @@ class ValtheroCLI:
             json.dump(workspace_config, f, indent=2)
         print_success(f"Created workspace configuration")
         
-        print(f"\n{Colors.GREEN}Workspace initialized successfully!{Colors.RESET}")
+        print(f"\n{C['GREEN']}Workspace initialized successfully!{C['RESET']}")
         print(f"\nNext steps:")
         print(f"  1. cd {target_dir}")
         print(f"  2. Set ANTHROPIC_API_KEY environment variable")
@@ -189,24 +402,30 @@ class ValtheroCLI:
             return
         
         found = False
-        for f in agents_dir.glob("*.json"):
-            try:
-                with open(f) as file:
-                    agent = json.load(file)
-                found = True
-                print(f"{Colors.BOLD}{agent.get('name', f.stem)}{Colors.RESET}")
-                print(f"  Type: {agent.get('type', 'N/A')}")
-                model_info = agent.get('model', {})
-                if isinstance(model_info, dict):
-                    print(f"  Model: {model_info.get('name', 'N/A')}")
-                else:
-                    print(f"  Model: {model_info}")
-                caps = agent.get('capabilities', [])
-                if caps:
-                    print(f"  Capabilities: {', '.join(caps)}")
-                print()
-            except Exception as e:
-                continue
+        with os.scandir(agents_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                try:
+                    agent = _cached_json_load(entry.path)
+                    found = True
+                    # Assemble each entry and emit it with a single write
+                    block = [
+                        f"{C['BOLD']}{agent.get('name', entry.name[:-5])}{C['RESET']}",
+                        f"  Type: {agent.get('type', 'N/A')}",
+                    ]
+                    model_info = agent.get('model', {})
+                    if isinstance(model_info, dict):
+                        block.append(f"  Model: {model_info.get('name', 'N/A')}")
+                    else:
+                        block.append(f"  Model: {model_info}")
+                    caps = agent.get('capabilities', [])
+                    if caps:
+                        block.append(f"  Capabilities: {', '.join(caps)}")
+                    block.append("\n")
+                    sys.stdout.write("\n".join(block))
+                except Exception:
+                    continue
         
         if not found:
             print_info("No agent configurations found in ./agents/")
@@ -216,16 +435,23 @@ class ValtheroCLI:
         """Run a task with a specific agent."""
         print_header(f"Running Task: {args.task}")
         
-        # Parse parameters
+        # Parse parameters; only attempt JSON when it can possibly be JSON,
+        # so the common key=value form never pays for a decode error
         params = {}
         if args.params:
-            try:
-                params = json.loads(args.params)
-            except json.JSONDecodeError:
+            raw = args.params.strip()
+            parsed = False
+            if raw[:1] in ('{', '['):
+                try:
+                    params = _json_loads(raw)
+                    parsed = True
+                except ValueError:
+                    pass
+            if not parsed:
                 # Try key=value format
-                for p in args.params.split(','):
-                    if '=' in p:
-                        k, v = p.split('=', 1)
+                for p in raw.split(','):
+                    k, sep, v = p.partition('=')
+                    if sep:
                         params[k.strip()] = v.strip()
         
         print_info(f"Agent: {args.agent or 'auto-select'}")
@@ -234,21 +460,19 @@ class ValtheroCLI:
         print()
         
         # Try to use orchestrator
-        self.init_orchestrator()
+        self.init_orchestrator([args.agent] if args.agent else None)
         
         if self.orchestrator:
             try:
-                result = self.orchestrator.execute_task(
-                    name=args.task,
-                    action=args.task,
-                    params=params,
-                    agent_name=args.agent
-                )
+                if args.agent:
+                    result = self.orchestrator.execute_task(args.agent, args.task, params)
+                else:
+                    result = self.orchestrator.delegate_task(args.task, params)
                 
-                if result.status == "completed":
+                if result.status == "success":
                     print_success("Task completed successfully!")
-                    print(f"\n{Colors.DIM}Result:{Colors.RESET}")
-                    print_json(result.result if result.result else {})
+                    print(f"\n{C['DIM']}Result:{C['RESET']}")
+                    print_json(result.output if result.output else {})
                 else:
                     print_error(f"Task failed: {result.error}")
                     return 1
@@ -282,7 +506,7 @@ class ValtheroCLI:
         
         while True:
             try:
-                user_input = input(f"{Colors.CYAN}You:{Colors.RESET} ").strip()
+                user_input = input(f"{C['CYAN']}You:{C['RESET']} ").strip()
             except (EOFError, KeyboardInterrupt):
                 print("\n")
                 break
@@ -302,16 +526,20 @@ class ValtheroCLI:
                 
                 messages.append(LLMMessage.user(user_input))
                 
-                print(f"\n{Colors.GREEN}Claude:{Colors.RESET} ", end="", flush=True)
+                print(f"\n{C['GREEN']}Claude:{C['RESET']} ", end="", flush=True)
                 
                 if args.stream:
-                    # Stream response
-                    full_response = ""
+                    # Stream response; flush on line breaks or every few
+                    # chunks instead of issuing a write() per token
+                    chunks = []
+                    write = sys.stdout.write
                     for chunk in self.provider.stream(messages):
-                        print(chunk, end="", flush=True)
-                        full_response += chunk
-                    print("\n")
-                    messages.append(LLMMessage.assistant(full_response))
+                        chunks.append(chunk)
+                        write(chunk)
+                        if "\n" in chunk or len(chunks) % _STREAM_FLUSH_EVERY == 0:
+                            sys.stdout.flush()
+                    print("\n", flush=True)
+                    messages.append(LLMMessage.assistant("".join(chunks)))
                 else:
                     # Regular response
                     response = self.provider.complete(messages)
@@ -333,33 +561,32 @@ class ValtheroCLI:
             print_info("No workflows directory found.")
             return
         
+        # One directory pass; dispatch on suffix instead of globbing twice
         found = False
-        for f in workflows_dir.glob("*.json"):
-            try:
-                with open(f) as file:
-                    wf = json.load(file)
-                found = True
-                print(f"{Colors.BOLD}{wf.get('name', f.stem)}{Colors.RESET}")
-                print(f"  Version: {wf.get('version', 'N/A')}")
-                print(f"  Steps: {len(wf.get('steps', []))}")
-                desc = wf.get('description', 'No description')
-                print(f"  Description: {desc[:60]}{'...' if len(desc) > 60 else ''}")
-                print()
-            except Exception:
-                continue
-        
-        for f in workflows_dir.glob("*.yaml"):
-            try:
-                import yaml
-                with open(f) as file:
-                    wf = yaml.safe_load(file)
-                found = True
-                print(f"{Colors.BOLD}{wf.get('name', f.stem)}{Colors.RESET}")
-                print(f"  Version: {wf.get('version', 'N/A')}")
-                print(f"  Steps: {len(wf.get('steps', []))}")
-                print()
-            except Exception:
-                continue
+        with os.scandir(workflows_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext not in ('.json', '.yaml') or not entry.is_file():
+                    continue
+                try:
+                    if ext == '.json':
+                        wf = _cached_json_load(entry.path)
+                    else:
+                        with open(entry.path) as file:
+                            wf = _load_yaml(file)
+                    found = True
+                    block = [
+                        f"{C['BOLD']}{wf.get('name', stem)}{C['RESET']}",
+                        f"  Version: {wf.get('version', 'N/A')}",
+                        f"  Steps: {len(wf.get('steps', []))}",
+                    ]
+                    if ext == '.json':
+                        desc = wf.get('description', 'No description')
+                        block.append(f"  Description: {desc[:60]}{'...' if len(desc) > 60 else ''}")
+                    block.append("\n")
+                    sys.stdout.write("\n".join(block))
+                except Exception:
+                    continue
         
         if not found:
             print_info("No workflows found in ./workflows/")
@@ -370,13 +597,7 @@ class ValtheroCLI:
         
         # Find workflow file
         workflows_dir = self.workspace_dir / "workflows"
-        workflow_path = None
-        
-        for ext in ['.json', '.yaml', '.yml']:
-            candidate = workflows_dir / f"{args.workflow}{ext}"
-            if candidate.exists():
-                workflow_path = candidate
-                break
+        workflow_path = _find_workflow_file(str(workflows_dir), args.workflow)
         
         if not workflow_path:
             print_error(f"Workflow not found: {args.workflow}")
@@ -384,12 +605,11 @@ class ValtheroCLI:
         
         # Load workflow
         try:
-            with open(workflow_path) as f:
-                if workflow_path.suffix in ['.yaml', '.yml']:
-                    import yaml
-                    workflow = yaml.safe_load(f)
-                else:
-                    workflow = json.load(f)
+            if workflow_path.suffix in ['.yaml', '.yml']:
+                with open(workflow_path) as f:
+                    workflow = _load_yaml(f)
+            else:
+                workflow = _json_loads(workflow_path.read_bytes())
         except Exception as e:
             print_error(f"Failed to load workflow: {e}")
             return 1
@@ -398,8 +618,8 @@ class ValtheroCLI:
         inputs = {}
         if args.inputs:
             try:
-                inputs = json.loads(args.inputs)
-            except json.JSONDecodeError:
+                inputs = _json_loads(args.inputs)
+            except ValueError:
                 print_error("Invalid JSON for inputs")
                 return 1
         
@@ -414,7 +634,7 @@ class ValtheroCLI:
             engine = WorkflowEngine()
             result = engine.execute(workflow, inputs, parallel=args.parallel)
             
-            print(f"\n{Colors.BOLD}Results:{Colors.RESET}")
+            print(f"\n{C['BOLD']}Results:{C['RESET']}")
             print(f"  Status: ", end="")
             if result.status.value == "completed":
                 print_success("Completed")
@@ -424,7 +644,7 @@ class ValtheroCLI:
             print(f"  Success Rate: {result.success_rate:.1f}%")
             
             if args.verbose:
-                print(f"\n{Colors.DIM}Step Details:{Colors.RESET}")
+                print(f"\n{C['DIM']}Step Details:{C['RESET']}")
                 for name, step in result.steps.items():
                     status_icon = "✓" if step.status.value == "completed" else "✗"
                     print(f"  {status_icon} {name}: {step.status.value}")
@@ -450,26 +670,16 @@ class ValtheroCLI:
         if definitions_dir.exists():
             for f in definitions_dir.glob("*.json"):
                 try:
-                    with open(f) as file:
-                        tool = json.load(file)
-                    print(f"{Colors.BOLD}{tool['name']}{Colors.RESET}")
+                    tool = _json_loads(f.read_bytes())
+                    print(f"{C['BOLD']}{tool['name']}{C['RESET']}")
                     print(f"  {tool.get('description', 'No description')[:70]}")
                     print()
                 except Exception:
                     continue
         
         # Also list built-in tools
-        print(f"{Colors.BOLD}Built-in Tools:{Colors.RESET}")
-        builtin_tools = [
-            ("code_analyzer", "Analyzes code for complexity, security, and performance"),
-            ("test_runner", "Executes tests using pytest or jest"),
-            ("read", "Read file contents"),
-            ("write", "Write content to files"),
-            ("glob", "Search for files matching patterns"),
-            ("grep", "Search file contents for patterns"),
-            ("edit", "Edit files with search and replace"),
-        ]
-        for name, desc in builtin_tools:
+        print(f"{C['BOLD']}Built-in Tools:{C['RESET']}")
+        for name, desc in _BUILTIN_TOOLS:
             print(f"  • {name}: {desc}")
     
     def cmd_analyze(self, args):
@@ -482,15 +692,7 @@ class ValtheroCLI:
             return 1
         
         # Detect language from extension
-        lang_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.java': 'java',
-            '.go': 'go',
-            '.rs': 'rust'
-        }
-        language = args.language or lang_map.get(file_path.suffix, 'python')
+        language = args.language or _LANG_MAP.get(file_path.suffix, 'python')
         
         try:
             # Try to import the code analyzer
@@ -506,7 +708,7 @@ class ValtheroCLI:
             if result.is_success:
                 data = result.data
                 
-                print(f"{Colors.BOLD}Quality Score: {data['metrics']['quality_score']}/100{Colors.RESET}")
+                print(f"{C['BOLD']}Quality Score: {data['metrics']['quality_score']}/100{C['RESET']}")
                 print(f"Cyclomatic Complexity: {data['metrics']['cyclomatic_complexity']}")
                 
                 loc = data['metrics'].get('loc', {})
@@ -514,20 +716,20 @@ class ValtheroCLI:
                 print(f"Comment Ratio: {loc.get('comment_ratio', 0):.1f}%")
                 
                 if data['issues']:
-                    print(f"\n{Colors.BOLD}Issues Found ({len(data['issues'])}):{Colors.RESET}")
+                    print(f"\n{C['BOLD']}Issues Found ({len(data['issues'])}):{C['RESET']}")
                     for issue in data['issues'][:10]:
                         severity_colors = {
-                            'critical': Colors.RED,
-                            'high': Colors.RED,
-                            'medium': Colors.YELLOW,
-                            'low': Colors.DIM
+                            'critical': C['RED'],
+                            'high': C['RED'],
+                            'medium': C['YELLOW'],
+                            'low': C['DIM']
                         }
                         color = severity_colors.get(issue['severity'], '')
                         line_info = f" (line {issue['line']})" if issue.get('line') else ""
-                        print(f"  {color}[{issue['severity'].upper()}]{Colors.RESET} {issue['message']}{line_info}")
+                        print(f"  {color}[{issue['severity'].upper()}]{C['RESET']} {issue['message']}{line_info}")
                 
                 if data['recommendations']:
-                    print(f"\n{Colors.BOLD}Recommendations:{Colors.RESET}")
+                    print(f"\n{C['BOLD']}Recommendations:{C['RESET']}")
                     for rec in data['recommendations']:
                         print(f"  • {rec}")
             else:
@@ -540,15 +742,19 @@ class ValtheroCLI:
             print_info("Performing basic analysis...")
             
             try:
-                content = file_path.read_text(encoding='utf-8')
-                lines = content.split('\n')
+                import re
+                
+                # Scan the raw bytes; counting lines needs no decoding and
+                # avoids materializing a str per line
+                blob = file_path.read_bytes()
                 
-                total_lines = len(lines)
-                blank_lines = sum(1 for line in lines if not line.strip())
-                comment_lines = sum(1 for line in lines if line.strip().startswith(('#', '//', '/*', '*')))
+                # Whole-buffer scans; [^\S\n] keeps matches within one line
+                total_lines = blob.count(b'\n') + 1
+                blank_lines = len(re.findall(rb'^[^\S\n]*$', blob, re.M))
+                comment_lines = len(re.findall(rb'^[^\S\n]*(?:#|//|/\*|\*)', blob, re.M))
                 code_lines = total_lines - blank_lines - comment_lines
                 
-                print(f"\n{Colors.BOLD}Basic Metrics:{Colors.RESET}")
+                print(f"\n{C['BOLD']}Basic Metrics:{C['RESET']}")
                 print(f"  Total Lines: {total_lines}")
                 print(f"  Code Lines: {code_lines}")
                 print(f"  Blank Lines: {blank_lines}")
@@ -566,99 +772,144 @@ class ValtheroCLI:
     
     def cmd_version(self, args):
         """Show version information."""
-        print(f"{Colors.BOLD}Valtheron{Colors.RESET} v1.0.0")
+        import importlib.util
+        
+        print(f"{C['BOLD']}Valtheron{C['RESET']} v1.0.0")
         print("Agentic Workspace Framework")
         print()
         print("Components:")
         
-        # Check available components
-        components = [
-            ("Agent Orchestrator", "utils.agent_orchestrator"),
-            ("Workflow Engine", "utils.workflow_engine"),
-            ("Tool System", "tools.implementations"),
-            ("Anthropic Provider", "providers.anthropic_provider"),
-        ]
-        
-        for name, module in components:
+        # Check available components. Locate modules without executing
+        # them; importing the full component graph dominates startup.
+        for name, module in _VERSION_COMPONENTS:
             try:
-                __import__(module)
-                print(f"  {Colors.GREEN}✓{Colors.RESET} {name}")
+                available = importlib.util.find_spec(module) is not None
             except ImportError:
-                print(f"  {Colors.RED}✗{Colors.RESET} {name}")
+                available = False
+            if available:
+                print(f"  {C['GREEN']}✓{C['RESET']} {name}")
+            else:
+                print(f"  {C['RED']}✗{C['RESET']} {name}")
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
-    parser = argparse.ArgumentParser(
-        prog='valtheron',
-        description='Valtheron - Agentic Workspace CLI',
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    parser.add_argument('--no-color', action='store_true', help='Disable colored output')
-    
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # init command
+def _build_init(subparsers) -> None:
     init_parser = subparsers.add_parser('init', help='Initialize a new workspace')
     init_parser.add_argument('directory', nargs='?', default='.', help='Target directory')
     init_parser.add_argument('--name', '-n', help='Workspace name')
-    
-    # agent commands
+
+
+def _build_agent(subparsers) -> None:
     agent_parser = subparsers.add_parser('agent', help='Agent management')
     agent_sub = agent_parser.add_subparsers(dest='agent_command')
     
-    agent_list = agent_sub.add_parser('list', help='List agents')
+    agent_sub.add_parser('list', help='List agents')
     
     agent_run = agent_sub.add_parser('run', help='Run a task with an agent')
     agent_run.add_argument('task', help='Task/action to execute')
     agent_run.add_argument('--agent', '-a', help='Specific agent to use')
     agent_run.add_argument('--params', '-p', help='Parameters (JSON or key=value)')
-    
-    # chat command
+
+
+def _build_chat(subparsers) -> None:
     chat_parser = subparsers.add_parser('chat', help='Interactive chat with Claude')
     chat_parser.add_argument('--system', '-s', help='System prompt')
     chat_parser.add_argument('--stream', action='store_true', help='Stream responses')
-    
-    # workflow commands
+
+
+def _build_workflow(subparsers) -> None:
     wf_parser = subparsers.add_parser('workflow', help='Workflow management')
     wf_sub = wf_parser.add_subparsers(dest='workflow_command')
     
-    wf_list = wf_sub.add_parser('list', help='List workflows')
+    wf_sub.add_parser('list', help='List workflows')
     
     wf_run = wf_sub.add_parser('run', help='Run a workflow')
     wf_run.add_argument('workflow', help='Workflow name')
     wf_run.add_argument('--inputs', '-i', help='Input parameters (JSON)')
     wf_run.add_argument('--parallel', action='store_true', help='Enable parallel execution')
     wf_run.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
-    
-    # tool commands
+
+
+def _build_tool(subparsers) -> None:
     tool_parser = subparsers.add_parser('tool', help='Tool management')
     tool_sub = tool_parser.add_subparsers(dest='tool_command')
     
-    tool_list = tool_sub.add_parser('list', help='List tools')
-    
-    # analyze command
+    tool_sub.add_parser('list', help='List tools')
+
+
+def _build_analyze(subparsers) -> None:
     analyze_parser = subparsers.add_parser('analyze', help='Analyze code')
     analyze_parser.add_argument('file', help='File to analyze')
     analyze_parser.add_argument('--language', '-l', help='Programming language')
     analyze_parser.add_argument('--type', '-t', default='all',
                                choices=['all', 'complexity', 'security', 'performance'],
                                help='Analysis type')
+
+
+def _build_version(subparsers) -> None:
+    subparsers.add_parser('version', help='Show version')
+
+
+# Subcommand name -> function adding that subcommand's parser
+_SUBCOMMAND_BUILDERS = {
+    'init': _build_init,
+    'agent': _build_agent,
+    'chat': _build_chat,
+    'workflow': _build_workflow,
+    'tool': _build_tool,
+    'analyze': _build_analyze,
+    'version': _build_version,
+}
+
+
+def _sniff_subcommand(argv: list) -> Optional[str]:
+    """Return the first positional token if it names a known subcommand."""
+    for token in argv:
+        if not token.startswith('-'):
+            return token if token in _SUBCOMMAND_BUILDERS else None
+    return None
+
+
+def create_parser(command: Optional[str] = None) -> "argparse.ArgumentParser":
+    """
+    Create the argument parser.
+    
+    Args:
+        command: If given, only this subcommand's parser is built; the
+                 full tree is built for help output and unknown commands.
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog='valtheron',
+        description='Valtheron - Agentic Workspace CLI',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+    
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # version command
-    version_parser = subparsers.add_parser('version', help='Show version')
+    if command in _SUBCOMMAND_BUILDERS:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
     
     return parser
 
 
 def main():
     """Main entry point."""
-    parser = create_parser()
+    parser = create_parser(_sniff_subcommand(sys.argv[1:]))
     args = parser.parse_args()
     
-    if args.no_color or not sys.stdout.isatty():
-        Colors.disable()
+    # --no-color or NO_COLOR (set to anything) always disables colors, even
+    # with CLICOLOR_FORCE; a non-empty CLICOLOR_FORCE keeps them on when
+    # stdout is not a terminal. Only otherwise is stdout probed with isatty().
+    if args.no_color or 'NO_COLOR' in os.environ:
+        set_colors(False)
+    elif not os.environ.get('CLICOLOR_FORCE') and not sys.stdout.isatty():
+        set_colors(False)
     
     cli = ValtheroCLI()
     
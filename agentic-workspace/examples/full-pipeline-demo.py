@@ -2,27 +2,60 @@
 Comprehensive example demonstrating the full agentic workspace.
 Shows how agents, tools, workflows, and orchestration work together.
 """
+import os
 import sys
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Make the workspace packages importable when running from a source checkout.
+# An installed package already has its root on sys.path, so skip the insert.
+_WORKSPACE_ROOT = os.path.dirname(os.path.dirname(__file__))
+if _WORKSPACE_ROOT not in sys.path:
+    sys.path.insert(0, _WORKSPACE_ROOT)
 
 from utils.config_loader import ConfigLoader
 from utils.logger import AgenticLogger
-from utils.workflow_engine import WorkflowEngine, WorkflowStatus
+from utils.workflow_engine import StepStatus, WorkflowEngine
 from utils.agent_orchestrator import (
     AgentOrchestrator,
     AgentConfig,
     TaskPriority
 )
 
+RULE = "=" * 60
+BANNER = "\n" + RULE + "\n{}\n" + RULE
+TITLE_BANNER = RULE + "\n{}\n" + RULE
+
+# Example agents, built once and reused by every demo run
+DEMO_AGENT_CONFIGS = (
+    AgentConfig(
+        name="task-executor-001",
+        agent_type="task-executor",
+        version="1.0.0",
+        description="General purpose task executor",
+        capabilities=["code-execution", "file-management"],
+        tools=["bash", "read", "write", "edit"]
+    ),
+    AgentConfig(
+        name="researcher-001",
+        agent_type="researcher",
+        version="1.0.0",
+        description="Research and analysis agent",
+        capabilities=["codebase-analysis", "information-gathering"],
+        tools=["read", "glob", "grep", "code_analyzer"]
+    ),
+    AgentConfig(
+        name="planner-001",
+        agent_type="planner",
+        version="1.0.0",
+        description="Task planning agent",
+        capabilities=["task-decomposition", "planning"],
+        tools=[]
+    ),
+)
+
 
 def demo_tool_usage():
     """Demonstrate direct tool usage."""
-    print("\n" + "="*60)
-    print("1. DIRECT TOOL USAGE")
-    print("="*60)
+    print(BANNER.format("1. DIRECT TOOL USAGE"))
     
     try:
         from tools.implementations import CodeAnalyzerTool, FileReadTool
@@ -68,9 +101,7 @@ password = "secret123"  # This should be flagged
 
 def demo_agent_orchestration():
     """Demonstrate agent orchestration."""
-    print("\n" + "="*60)
-    print("2. AGENT ORCHESTRATION")
-    print("="*60)
+    print(BANNER.format("2. AGENT ORCHESTRATION"))
     
     # Initialize logger
     logger = AgenticLogger(log_dir="../logs")
@@ -83,40 +114,15 @@ def demo_agent_orchestration():
     )
     
     # Register agents from example configs
-    task_executor_config = AgentConfig(
-        name="task-executor-001",
-        agent_type="task-executor",
-        version="1.0.0",
-        description="General purpose task executor",
-        capabilities=["code-execution", "file-management"],
-        tools=["bash", "read", "write", "edit"]
-    )
-    
-    researcher_config = AgentConfig(
-        name="researcher-001",
-        agent_type="researcher",
-        version="1.0.0",
-        description="Research and analysis agent",
-        capabilities=["codebase-analysis", "information-gathering"],
-        tools=["read", "glob", "grep", "code_analyzer"]
-    )
-    
-    planner_config = AgentConfig(
-        name="planner-001",
-        agent_type="planner",
-        version="1.0.0",
-        description="Task planning agent",
-        capabilities=["task-decomposition", "planning"],
-        tools=[]
-    )
-    
-    orchestrator.register_agent(task_executor_config)
-    orchestrator.register_agent(researcher_config)
-    orchestrator.register_agent(planner_config)
+    for agent_config in DEMO_AGENT_CONFIGS:
+        orchestrator.register_agent(agent_config)
     
-    print(f"\nRegistered Agents:")
+    # Build the listing first and emit it with a single write
+    lines = ["\nRegistered Agents:"]
     for agent_info in orchestrator.list_agents():
-        print(f"  • {agent_info['name']} ({agent_info['type']}) - {agent_info['status']}")
+        lines.append(f"  • {agent_info['name']} ({agent_info['type']}) - {agent_info['status']}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     
     # Execute a task
     print(f"\nExecuting Task: 'analyze_project'")
@@ -147,9 +153,7 @@ def demo_agent_orchestration():
 
 def demo_workflow_execution():
     """Demonstrate workflow execution."""
-    print("\n" + "="*60)
-    print("3. WORKFLOW EXECUTION")
-    print("="*60)
+    print(BANNER.format("3. WORKFLOW EXECUTION"))
     
     # Initialize
     logger = AgenticLogger(log_dir="../logs")
@@ -235,17 +239,17 @@ def demo_workflow_execution():
     print(f"  Duration: {result.duration_ms:.2f}ms")
     print(f"  Success Rate: {result.success_rate:.1f}%")
     
-    print(f"\n  Step Results:")
+    lines = ["\n  Step Results:"]
     for step_name, step_result in result.steps.items():
-        status_icon = "✓" if step_result.status == WorkflowStatus.COMPLETED else "✗"
-        print(f"    {status_icon} {step_name}: {step_result.status.value}")
+        status_icon = "✓" if step_result.status == StepStatus.COMPLETED else "✗"
+        lines.append(f"    {status_icon} {step_name}: {step_result.status.value}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def demo_full_pipeline():
     """Demonstrate a complete pipeline from configuration to execution."""
-    print("\n" + "="*60)
-    print("4. FULL PIPELINE DEMO")
-    print("="*60)
+    print(BANNER.format("4. FULL PIPELINE DEMO"))
     
     # Load workspace configuration
     try:
@@ -273,9 +277,7 @@ def demo_full_pipeline():
 
 def main():
     """Run all demonstrations."""
-    print("="*60)
-    print("AGENTIC WORKSPACE - COMPREHENSIVE DEMO")
-    print("="*60)
+    print(TITLE_BANNER.format("AGENTIC WORKSPACE - COMPREHENSIVE DEMO"))
     print("\nThis demo shows the key components of the agentic workspace")
     print("working together: tools, agents, workflows, and orchestration.")
     
@@ -284,9 +286,7 @@ def main():
     demo_workflow_execution()
     demo_full_pipeline()
     
-    print("\n" + "="*60)
-    print("DEMO COMPLETE")
-    print("="*60)
+    print(BANNER.format("DEMO COMPLETE"))
     print("\nKey Takeaways:")
     print("  • Tools provide atomic operations (file I/O, analysis, testing)")
     print("  • Agents combine tools with intelligence for specific roles")
@@ -11,11 +11,14 @@ This script demonstrates the complete integration of all components:
 Run from the agentic-workspace directory:
     python examples/integration_example.py
 """
+import os
 import sys
-from pathlib import Path
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Make the workspace packages importable when running from a source checkout.
+# An installed package already has its root on sys.path, so skip the insert.
+_WORKSPACE_ROOT = os.path.dirname(os.path.dirname(__file__))
+if _WORKSPACE_ROOT not in sys.path:
+    sys.path.insert(0, _WORKSPACE_ROOT)
 
 from utils import (
     ConfigLoader,
@@ -26,12 +29,32 @@ from utils import (
     AgentFactory,
 )
 
+TITLE_BANNER = "=" * 60 + "\n{}\n" + "=" * 60
+
+# Example agents, built once and reused by every demo run
+DEMO_AGENT_CONFIGS = (
+    AgentConfig(
+        name="demo-executor",
+        agent_type="task-executor",
+        version="1.0.0",
+        description="Demo task executor",
+        tools=["read", "write", "bash"],
+        capabilities=["code-execution", "file-management"]
+    ),
+    AgentConfig(
+        name="demo-researcher",
+        agent_type="researcher",
+        version="1.0.0",
+        description="Demo researcher",
+        tools=["read", "grep", "glob", "code_analyzer"],
+        capabilities=["codebase-analysis", "pattern-recognition"]
+    ),
+)
+
 
 def main():
     """Demonstrate full workspace integration."""
-    print("=" * 60)
-    print("Valtheron Agentic Workspace - Integration Demo")
-    print("=" * 60)
+    print(TITLE_BANNER.format("Valtheron Agentic Workspace - Integration Demo"))
     print()
     
     # 1. Initialize logging
@@ -72,26 +95,7 @@ def main():
         orchestrator.set_tool_registry(registry)
     
     # Register example agents
-    agent_configs = [
-        AgentConfig(
-            name="demo-executor",
-            agent_type="task-executor",
-            version="1.0.0",
-            description="Demo task executor",
-            tools=["read", "write", "bash"],
-            capabilities=["code-execution", "file-management"]
-        ),
-        AgentConfig(
-            name="demo-researcher",
-            agent_type="researcher",
-            version="1.0.0",
-            description="Demo researcher",
-            tools=["read", "grep", "glob", "code_analyzer"],
-            capabilities=["codebase-analysis", "pattern-recognition"]
-        )
-    ]
-    
-    for agent_config in agent_configs:
+    for agent_config in DEMO_AGENT_CONFIGS:
         if orchestrator.register_from_config(agent_config):
             print(f"    ✓ Registered agent: {agent_config.name}")
     print()
@@ -172,11 +176,12 @@ def main():
     
     workflow_result = workflow_engine.execute(demo_workflow, inputs={})
     
-    print(f"    Status: {workflow_result.status.value}")
+    lines = [f"    Status: {workflow_result.status.value}"]
     for step_name, step_result in workflow_result.steps.items():
         status_icon = "✓" if step_result.status.value == "completed" else "✗"
-        print(f"    {status_icon} Step '{step_name}': {step_result.status.value}")
-    print(f"    Total time: {workflow_result.total_execution_time_ms:.2f}ms")
+        lines.append(f"    {status_icon} Step '{step_name}': {step_result.status.value}")
+    lines.append(f"    Total time: {workflow_result.total_execution_time_ms:.2f}ms")
+    print("\n".join(lines))
     print()
     
     # 9. Show metrics
@@ -193,9 +198,7 @@ def main():
     print("    ✓ Orchestrator shutdown complete")
     print()
     
-    print("=" * 60)
-    print("Integration demo completed successfully!")
-    print("=" * 60)
+    print(TITLE_BANNER.format("Integration demo completed successfully!"))
     
     return 0
 
@@ -1,12 +1,15 @@
 """
 Simple example of loading and using an agent configuration
 """
+import os
 import sys
 import json
-from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Make the workspace packages importable when running from a source checkout.
+# An installed package already has its root on sys.path, so skip the insert.
+_WORKSPACE_ROOT = os.path.dirname(os.path.dirname(__file__))
+if _WORKSPACE_ROOT not in sys.path:
+    sys.path.insert(0, _WORKSPACE_ROOT)
 
 from utils.config_loader import ConfigLoader
 from utils.logger import AgenticLogger
@@ -1,23 +1,31 @@
 """
 Example of loading and executing a workflow
 """
+import os
 import sys
 import json
-from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, Any
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Make the workspace packages importable when running from a source checkout.
+# An installed package already has its root on sys.path, so skip the insert.
+_WORKSPACE_ROOT = os.path.dirname(os.path.dirname(__file__))
+if _WORKSPACE_ROOT not in sys.path:
+    sys.path.insert(0, _WORKSPACE_ROOT)
 
 from utils.config_loader import ConfigLoader
 from utils.logger import AgenticLogger
 
+RULE = "=" * 60
+COMPLETED_BANNER = f"\n{RULE}\nWorkflow completed successfully!\n{RULE}\n"
+
 
 class SimpleWorkflowExecutor:
     """Simple workflow executor for demonstration"""
 
-    def __init__(self, workflow_config: Dict[str, Any]):
+    def __init__(self, workflow_config: Dict[str, Any], max_workers: int = 8):
         self.config = workflow_config
+        self.max_workers = max_workers
         self.logger = AgenticLogger(log_dir="../logs")
         self.results = {}
 
@@ -27,20 +35,18 @@ class SimpleWorkflowExecutor:
 
         self.logger.log_workflow_start(workflow_name, inputs)
 
-        print(f"\n{'='*60}")
-        print(f"Executing Workflow: {workflow_name}")
-        print(f"Version: {self.config['version']}")
-        print(f"Description: {self.config['description']}")
-        print(f"{'='*60}\n")
+        print(
+            f"\n{RULE}\n"
+            f"Executing Workflow: {workflow_name}\n"
+            f"Version: {self.config['version']}\n"
+            f"Description: {self.config['description']}\n"
+            f"{RULE}\n"
+        )
 
         try:
-            # Execute each step
-            for step in self.config['steps']:
-                self._execute_step(step, inputs)
+            self._run_steps(inputs)
 
-            print(f"\n{'='*60}")
-            print(f"Workflow completed successfully!")
-            print(f"{'='*60}\n")
+            print(COMPLETED_BANNER)
 
             self.logger.log_workflow_end(workflow_name, "success", self.results)
             return self.results
@@ -50,19 +56,45 @@ class SimpleWorkflowExecutor:
             self.logger.log_workflow_end(workflow_name, "failed", {"error": str(e)})
             raise
 
+    def _run_steps(self, inputs: Dict[str, Any]):
+        """Run steps as their dependencies complete, overlapping independent ones"""
+        steps = {step['name']: step for step in self.config['steps']}
+        remaining = {name: set(step.get('depends_on', [])) for name, step in steps.items()}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            in_flight = {}
+
+            def submit_ready():
+                for name, deps in list(remaining.items()):
+                    if not deps:
+                        del remaining[name]
+                        in_flight[pool.submit(self._execute_step, steps[name], inputs)] = name
+
+            submit_ready()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = in_flight.pop(future)
+                    future.result()
+                    for deps in remaining.values():
+                        deps.discard(name)
+                submit_ready()
+
+        if remaining:
+            raise Exception(f"Dependency not met: {', '.join(sorted(remaining))}")
+
     def _execute_step(self, step: Dict[str, Any], inputs: Dict[str, Any]):
         """Execute a single workflow step"""
         step_name = step['name']
         agent = step['agent']
         action = step['action']
 
-        print(f"Step: {step_name}")
-        print(f"  Agent: {agent}")
-        print(f"  Action: {action}")
+        # Steps may run concurrently, so each prints its report in one call
+        report = [f"Step: {step_name}", f"  Agent: {agent}", f"  Action: {action}"]
 
         # Check dependencies
         if 'depends_on' in step:
-            print(f"  Dependencies: {', '.join(step['depends_on'])}")
+            report.append(f"  Dependencies: {', '.join(step['depends_on'])}")
             for dep in step['depends_on']:
                 if dep not in self.results:
                     raise Exception(f"Dependency not met: {dep}")
@@ -76,7 +108,6 @@ class SimpleWorkflowExecutor:
 
         # Simulate step execution
         # In a real implementation, this would invoke the actual agent
-        print(f"  Status: Executing...")
 
         # Store mock result
         self.results[step_name] = {
@@ -84,7 +115,8 @@ class SimpleWorkflowExecutor:
             "output": f"Result from {step_name}"
         }
 
-        print(f"  Status: Completed ✓\n")
+        report.append("  Status: Completed ✓\n")
+        print("\n".join(report))
 
         # Log step completion
         self.logger.log_agent_action(
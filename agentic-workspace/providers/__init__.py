@@ -9,9 +9,13 @@ from .base_provider import (
     ToolCall,
     ToolResult,
     ProviderConfig,
-    ProviderRegistry
+    ProviderRegistry,
+    CacheBackend,
+    MemoryCache,
 )
 from .anthropic_provider import AnthropicProvider
+from .batch_scheduler import BatchScheduler
+from .semantic_cache import SemanticCache
 
 __all__ = [
     "BaseLLMProvider",
@@ -21,7 +25,11 @@ __all__ = [
     "ToolResult",
     "ProviderConfig",
     "ProviderRegistry",
+    "CacheBackend",
+    "MemoryCache",
     "AnthropicProvider",
+    "SemanticCache",
+    "BatchScheduler",
 ]
 
 
@@ -29,6 +37,12 @@ def get_provider(name: str, config: dict = None) -> BaseLLMProvider:
     """
     Get a provider instance by name.
     
+    Each call returns a new provider, so per-caller state such as the
+    response caches, batching and the hit/miss counters is never shared.
+    The expensive part, the HTTP connection pool, is shared by all
+    instances of a provider class (see
+    AnthropicProvider.get_shared_http_client).
+    
     Args:
         name: Provider name ('anthropic', 'openai', etc.)
         config: Optional provider configuration
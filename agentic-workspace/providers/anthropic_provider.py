@@ -5,9 +5,15 @@ Connects the agentic workspace to Claude models via the Anthropic API.
 import os
 import json
 import time
-from typing import Any, Dict, List, Optional, Iterator
+import random
+import asyncio
+import threading
+import weakref
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Iterator
 from dataclasses import dataclass
 
+from .batch_scheduler import BatchScheduler
 from .base_provider import (
     BaseLLMProvider,
     LLMResponse,
@@ -16,9 +22,20 @@ from .base_provider import (
     ToolDefinition,
     ProviderConfig,
     ProviderRegistry,
-    MessageRole
+    ROLE_ASSISTANT,
+    ROLE_SYSTEM,
+    ROLE_TOOL,
+    ROLE_USER,
 )
 
+__all__ = [
+    "AnthropicAPIError",
+    "AnthropicProvider",
+    "MessageConverter",
+    "create_claude_client",
+]
+
+
 
 class AnthropicAPIError(Exception):
     """Exception for Anthropic API errors."""
@@ -29,6 +46,220 @@ class AnthropicAPIError(Exception):
         self.response = response
 
 
+_anthropic = None
+
+
+def _import_anthropic():
+    """Import the anthropic SDK on first use and keep the module."""
+    global _anthropic
+    if _anthropic is None:
+        try:
+            import anthropic
+        except ImportError:
+            raise ImportError(
+                "The 'anthropic' package is required. "
+                "Install it with: pip install anthropic"
+            )
+        _anthropic = anthropic
+    return _anthropic
+
+
+@lru_cache(maxsize=1)
+def _cached_env_api_key() -> Optional[str]:
+    """ANTHROPIC_API_KEY from the environment, read once per process."""
+    return os.environ.get("ANTHROPIC_API_KEY")
+
+
+# Connection limits for the shared HTTP connection pools
+HTTP_POOL_LIMITS = {"max_connections": 100, "max_keepalive_connections": 20}
+_HTTP_CLIENT_LOCK = threading.Lock()
+_ENCODER_LOCK = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs httpx's optional h2 dependency."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Upper bound in seconds for a single retry wait
+RETRY_BACKOFF_CAP = 30.0
+
+
+def _batch_chunks(chunks: Iterator[str], interval: float, max_chars: int) -> Iterator[str]:
+    """Coalesce text chunks into size- or time-bounded batches."""
+    if interval <= 0 and max_chars <= 0:
+        yield from chunks
+        return
+    
+    buffer: List[str] = []
+    size = 0
+    deadline = 0.0
+    for text in chunks:
+        if not buffer:
+            deadline = time.monotonic() + interval
+        buffer.append(text)
+        size += len(text)
+        if (max_chars > 0 and size >= max_chars) or time.monotonic() >= deadline:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+async def _abatch_chunks(chunks: AsyncIterator[str], interval: float, max_chars: int) -> AsyncIterator[str]:
+    """
+    Coalesce async text chunks into size- or time-bounded batches.
+    
+    Chunks are pumped through a queue so a pending batch is flushed when
+    its interval expires even if no further chunk arrives.
+    """
+    if interval <= 0 and max_chars <= 0:
+        async for text in chunks:
+            yield text
+        return
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    end = object()
+    
+    async def pump():
+        try:
+            async for text in chunks:
+                await queue.put(text)
+        finally:
+            await queue.put(end)
+    
+    task = asyncio.ensure_future(pump())
+    buffer: List[str] = []
+    size = 0
+    deadline = 0.0
+    try:
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if buffer and interval > 0 else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+                continue
+            if item is end:
+                break
+            if not buffer:
+                deadline = time.monotonic() + interval
+            buffer.append(item)
+            size += len(item)
+            if (max_chars > 0 and size >= max_chars) or (interval > 0 and time.monotonic() >= deadline):
+                yield "".join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+        # Surface any error raised by the underlying stream
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+class MessageConverter:
+    """Converts a growing conversation to Anthropic format incrementally."""
+    
+    def __init__(self):
+        self._source: List[LLMMessage] = []
+        # Payload each source message had when it was converted
+        self._payloads: List[Optional[Dict]] = []
+        self._system: Optional[str] = None
+        self._converted: List[Dict] = []
+    
+    @staticmethod
+    def _system(msg: LLMMessage) -> Dict:
+        # Sent as the top-level system prompt rather than in the message list
+        return {"role": "system", "content": msg.content}
+    
+    @staticmethod
+    def _user(msg: LLMMessage) -> Dict:
+        return {"role": "user", "content": msg.content}
+    
+    @staticmethod
+    def _assistant(msg: LLMMessage) -> Dict:
+        return {"role": "assistant", "content": msg.content}
+    
+    @staticmethod
+    def _tool(msg: LLMMessage) -> Dict:
+        # Tool results in Anthropic format
+        return {
+            "role": "user",
+            "content": [{
+                "type": "tool_result",
+                "tool_use_id": msg.tool_call_id,
+                "content": msg.content
+            }]
+        }
+    
+    _DISPATCH = {
+        ROLE_SYSTEM: _system,
+        ROLE_USER: _user,
+        ROLE_ASSISTANT: _assistant,
+        ROLE_TOOL: _tool,
+    }
+    
+    @classmethod
+    def convert_message(cls, msg: LLMMessage) -> Optional[Dict]:
+        """
+        Convert a single message, caching the payload on it.
+        
+        The cached payload is dropped when any field of ``msg`` is assigned,
+        so an edited message is converted again.
+        """
+        payload = msg._anthropic_payload
+        if payload is None:
+            convert = cls._DISPATCH.get(msg.role)
+            if convert is None:
+                return None
+            payload = msg._anthropic_payload = convert(msg)
+        return payload
+    
+    def _is_prefix(self, messages: List[LLMMessage]) -> bool:
+        """Whether the last call's messages start ``messages`` unchanged."""
+        if len(messages) < len(self._source):
+            return False
+        return all(
+            a is b and b._anthropic_payload is payload
+            for a, b, payload in zip(self._source, messages, self._payloads)
+        )
+    
+    def convert(self, messages: List[LLMMessage]) -> tuple[Optional[str], List[Dict]]:
+        """
+        Convert messages, reusing earlier work when they extend the last call.
+        
+        Payload dicts are shared between calls and must not be modified.
+        
+        Returns:
+            Tuple of (system_prompt, messages_list)
+        """
+        if not self._is_prefix(messages):
+            self._source = []
+            self._payloads = []
+            self._system = None
+            self._converted = []
+        
+        for msg in messages[len(self._source):]:
+            converted = self.convert_message(msg)
+            if msg.role == ROLE_SYSTEM:
+                self._system = converted["content"]
+            elif converted is not None:
+                self._converted.append(converted)
+            self._source.append(msg)
+            self._payloads.append(converted)
+        
+        return self._system, list(self._converted)
+
+
 class AnthropicProvider(BaseLLMProvider):
     """
     Anthropic API provider for Claude models.
@@ -55,29 +286,52 @@ class AnthropicProvider(BaseLLMProvider):
         "haiku": "claude-haiku-4-5-20251001",
     }
     
+    PROVIDER_NAME = "anthropic"
+    
     DEFAULT_API_BASE = "https://api.anthropic.com"
     API_VERSION = "2023-06-01"
     
+    # Connection pools shared by all provider instances
+    _shared_http_client = None
+    _shared_async_http_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+    
+    # Local tokenizer used by count_tokens(); loaded on first use
+    TOKENIZER_ENCODING = "cl100k_base"
+    _encoder = None
+    _encoder_loaded = False
+    
     def __init__(self, config: ProviderConfig):
         """Initialize the Anthropic provider."""
         self._client = None
+        self._async_client = None
+        self._async_client_loop = None
+        # Route acomplete() through a BatchScheduler when enabled
+        self.batching_enabled = False
+        self._batch_scheduler = None
+        self._batch_scheduler_loop = None
+        self._local = threading.local()
         super().__init__(config)
-    
-    @property
-    def name(self) -> str:
-        return "anthropic"
+        # Model after alias resolution in _validate_config
+        self._resolved_model = self.config.model
     
     @property
     def supported_models(self) -> List[str]:
         return self.SUPPORTED_MODELS
     
+    @staticmethod
+    def refresh_env_cache() -> None:
+        """Re-read ANTHROPIC_API_KEY on the next provider construction."""
+        _cached_env_api_key.cache_clear()
+    
     def _validate_config(self) -> None:
         """Validate Anthropic-specific configuration."""
         # Get API key from config or environment
         if not self.config.api_key:
-            self.config.api_key = os.environ.get("ANTHROPIC_API_KEY")
+            self.config.api_key = _cached_env_api_key()
         
         if not self.config.api_key:
+            # Don't remember a missing key; it may be set before the next try
+            _cached_env_api_key.cache_clear()
             raise ValueError(
                 "Anthropic API key required. Set ANTHROPIC_API_KEY environment "
                 "variable or pass api_key in config."
@@ -97,88 +351,131 @@ class AnthropicProvider(BaseLLMProvider):
         if not self.config.api_base:
             self.config.api_base = self.DEFAULT_API_BASE
     
+    @classmethod
+    def get_shared_http_client(cls):
+        """
+        Get the process-wide httpx client used by all sync Anthropic clients.
+        
+        Sharing one connection pool lets provider instances reuse keep-alive
+        connections (and HTTP/2 streams when the h2 package is installed)
+        instead of opening their own.
+        """
+        if cls._shared_http_client is None:
+            with _HTTP_CLIENT_LOCK:
+                if cls._shared_http_client is None:
+                    import httpx
+                    cls._shared_http_client = httpx.Client(
+                        http2=_http2_available(),
+                        limits=httpx.Limits(**HTTP_POOL_LIMITS)
+                    )
+        return cls._shared_http_client
+    
+    @classmethod
+    def get_shared_async_http_client(cls):
+        """
+        Get the httpx async client shared by async Anthropic clients.
+        
+        Async connection pools are bound to an event loop, so one client is
+        kept per running loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = cls._shared_async_http_clients.get(loop)
+        if client is None:
+            import httpx
+            client = httpx.AsyncClient(
+                http2=_http2_available(),
+                limits=httpx.Limits(**HTTP_POOL_LIMITS)
+            )
+            cls._shared_async_http_clients[loop] = client
+        return client
+    
     def _get_client(self):
         """Get or create the Anthropic client."""
         if self._client is None:
-            try:
-                import anthropic
-                self._client = anthropic.Anthropic(
-                    api_key=self.config.api_key,
-                    base_url=self.config.api_base,
-                    timeout=self.config.timeout,
-                    max_retries=self.config.max_retries
-                )
-            except ImportError:
-                raise ImportError(
-                    "The 'anthropic' package is required. "
-                    "Install it with: pip install anthropic"
-                )
+            anthropic = _import_anthropic()
+            self._client = anthropic.Anthropic(
+                api_key=self.config.api_key,
+                base_url=self.config.api_base,
+                timeout=self.config.timeout,
+                max_retries=self.config.max_retries,
+                http_client=self.get_shared_http_client()
+            )
         return self._client
     
+    def _get_async_client(self):
+        """Get or create the async Anthropic client for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            anthropic = _import_anthropic()
+            self._async_client = anthropic.AsyncAnthropic(
+                api_key=self.config.api_key,
+                base_url=self.config.api_base,
+                timeout=self.config.timeout,
+                max_retries=self.config.max_retries,
+                http_client=self.get_shared_async_http_client()
+            )
+            self._async_client_loop = loop
+        return self._async_client
+    
+    def _get_batch_scheduler(self) -> BatchScheduler:
+        """Get or create the request batcher for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._batch_scheduler is None or self._batch_scheduler_loop is not loop:
+            client = self._get_async_client()
+            self._batch_scheduler = BatchScheduler(
+                lambda params: client.messages.create(**params),
+                max_wait_ms=self.config.extra.get("batch_max_wait_ms", 5),
+                max_batch=self.config.extra.get("batch_max_size", 32)
+            )
+            self._batch_scheduler_loop = loop
+        return self._batch_scheduler
+    
     def _convert_messages(self, messages: List[LLMMessage]) -> tuple[Optional[str], List[Dict]]:
         """
         Convert LLMMessage list to Anthropic format.
         
+        Conversion is incremental per thread: when ``messages`` extends the
+        list converted last time (as in a chat() tool loop), only the new
+        tail is converted.
+        
         Returns:
             Tuple of (system_prompt, messages_list)
         """
-        system_prompt = None
-        converted = []
-        
-        for msg in messages:
-            if msg.role == MessageRole.SYSTEM:
-                system_prompt = msg.content
-            elif msg.role == MessageRole.USER:
-                converted.append({
-                    "role": "user",
-                    "content": msg.content
-                })
-            elif msg.role == MessageRole.ASSISTANT:
-                converted.append({
-                    "role": "assistant",
-                    "content": msg.content
-                })
-            elif msg.role == MessageRole.TOOL:
-                # Tool results in Anthropic format
-                converted.append({
-                    "role": "user",
-                    "content": [{
-                        "type": "tool_result",
-                        "tool_use_id": msg.tool_call_id,
-                        "content": msg.content
-                    }]
-                })
-        
-        return system_prompt, converted
+        converter = getattr(self._local, "converter", None)
+        if converter is None:
+            converter = self._local.converter = MessageConverter()
+        return converter.convert(messages)
     
     def _convert_tools(self, tools: List[ToolDefinition]) -> List[Dict]:
-        """Convert tool definitions to Anthropic format."""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.parameters
-            }
-            for tool in tools
-        ]
+        """Convert tool definitions to Anthropic format, reusing the last result."""
+        cached = getattr(self._local, "tools", None)
+        if cached is not None and len(cached[0]) == len(tools) and all(
+            a is b for a, b in zip(cached[0], tools)
+        ):
+            return cached[1]
+        
+        converted = [tool.to_anthropic_dict() for tool in tools]
+        self._local.tools = (tuple(tools), converted)
+        return converted
     
     def _parse_response(self, response) -> LLMResponse:
         """Parse Anthropic API response into LLMResponse."""
-        content_parts = []
-        tool_calls = []
-        
-        for block in response.content:
-            if block.type == "text":
-                content_parts.append(block.text)
-            elif block.type == "tool_use":
-                tool_calls.append(ToolCall(
-                    id=block.id,
-                    name=block.name,
-                    arguments=block.input
-                ))
+        blocks = response.content
+        
+        if len(blocks) == 1 and blocks[0].type == "text":
+            # Common case: a single text block
+            content = blocks[0].text
+            tool_calls = []
+        else:
+            texts = [block.text for block in blocks if block.type == "text"]
+            content = texts[0] if len(texts) == 1 else "\n".join(texts)
+            tool_calls = [
+                ToolCall(id=block.id, name=block.name, arguments=block.input)
+                for block in blocks if block.type == "tool_use"
+            ]
         
         return LLMResponse(
-            content="\n".join(content_parts),
+            content=content,
             model=response.model,
             tool_calls=tool_calls,
             stop_reason=response.stop_reason,
@@ -189,31 +486,37 @@ class AnthropicProvider(BaseLLMProvider):
             raw_response=response
         )
     
-    def complete(
-        self,
-        messages: List[LLMMessage],
-        tools: Optional[List[ToolDefinition]] = None,
-        **kwargs
-    ) -> LLMResponse:
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
         """
-        Generate a completion using Claude.
+        Seconds to wait before retrying after ``error``, or None to give up.
         
-        Args:
-            messages: Conversation messages
-            tools: Optional tools for function calling
-            **kwargs: Additional parameters (temperature, max_tokens, etc.)
-            
-        Returns:
-            LLMResponse with completion
+        The SDK client already retries connection errors, 429s (honouring
+        Retry-After) and 5xx responses with its own backoff, so no API error
+        is retried again here. Other failures back off with full jitter.
         """
-        client = self._get_client()
+        if attempt >= self.config.max_retries - 1:
+            return None
+        
+        # SDK errors can only occur once the SDK has been imported
+        anthropic = _anthropic
+        if anthropic is not None and isinstance(error, anthropic.APIError):
+            return None
         
+        return random.uniform(0, min(RETRY_BACKOFF_CAP, 2 ** attempt))
+    
+    def _build_params(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[ToolDefinition]],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build Messages API request parameters."""
         # Convert messages
         system_prompt, converted_messages = self._convert_messages(messages)
         
         # Build request parameters
         params = {
-            "model": kwargs.get("model", self.config.model),
+            "model": kwargs.get("model", self._resolved_model),
             "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
             "messages": converted_messages,
         }
@@ -230,21 +533,52 @@ class AnthropicProvider(BaseLLMProvider):
         if tools:
             params["tools"] = self._convert_tools(tools)
         
+        return params
+    
+    def complete(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[ToolDefinition]] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate a completion using Claude.
+        
+        Args:
+            messages: Conversation messages
+            tools: Optional tools for function calling
+            **kwargs: Additional parameters (temperature, max_tokens, etc.);
+                cache=True caches the response even when temperature > 0
+            
+        Returns:
+            LLMResponse with completion
+        """
+        client = self._get_client()
+        
+        params = self._build_params(messages, tools, kwargs)
+        
+        cache_ticket, cached = self._cache_lookup(params, kwargs.get("cache", False))
+        if cached is not None:
+            return cached
+        
         # Make API call with retry logic
         last_error = None
-        for attempt in range(self.config.max_retries):
+        for attempt in range(max(1, self.config.max_retries)):
             try:
                 response = client.messages.create(**params)
-                return self._parse_response(response)
+                result = self._parse_response(response)
+                self._cache_store(cache_ticket, result)
+                return result
             except Exception as e:
                 last_error = e
-                if attempt < self.config.max_retries - 1:
-                    # Exponential backoff
-                    time.sleep(2 ** attempt)
-                continue
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    break
+                time.sleep(delay)
         
         raise AnthropicAPIError(
-            f"API call failed after {self.config.max_retries} attempts: {last_error}",
+            f"API call failed after {attempt + 1} attempts: {last_error}",
+            status_code=getattr(last_error, "status_code", None),
             response=last_error
         )
     
@@ -252,14 +586,23 @@ class AnthropicProvider(BaseLLMProvider):
         self,
         messages: List[LLMMessage],
         tools: Optional[List[ToolDefinition]] = None,
+        stream_batch_interval_ms: int = 50,
+        stream_batch_max_chars: int = 256,
         **kwargs
     ) -> Iterator[str]:
         """
         Stream a completion from Claude.
         
+        Text events are coalesced and yielded once ``stream_batch_max_chars``
+        characters have accumulated or ``stream_batch_interval_ms`` has
+        passed since the first buffered event. Set both to 0 to yield every
+        event as it arrives.
+        
         Args:
             messages: Conversation messages
             tools: Optional tools (note: tool use with streaming has limitations)
+            stream_batch_interval_ms: Maximum time to hold buffered text
+            stream_batch_max_chars: Buffered size that triggers a yield
             **kwargs: Additional parameters
             
         Yields:
@@ -267,45 +610,132 @@ class AnthropicProvider(BaseLLMProvider):
         """
         client = self._get_client()
         
-        # Convert messages
-        system_prompt, converted_messages = self._convert_messages(messages)
+        params = self._build_params(messages, tools, kwargs)
         
-        # Build request parameters
-        params = {
-            "model": kwargs.get("model", self.config.model),
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-            "messages": converted_messages,
-        }
+        # Stream response
+        with client.messages.stream(**params) as stream:
+            yield from _batch_chunks(
+                stream.text_stream, stream_batch_interval_ms / 1000, stream_batch_max_chars
+            )
+    
+    async def acomplete(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[ToolDefinition]] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate a completion using Claude without blocking the event loop.
         
-        if system_prompt:
-            params["system"] = system_prompt
+        Args:
+            messages: Conversation messages
+            tools: Optional tools for function calling
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+            
+        Returns:
+            LLMResponse with completion
+        """
+        client = self._get_async_client()
+        params = self._build_params(messages, tools, kwargs)
+        send = (
+            self._get_batch_scheduler().submit if self.batching_enabled
+            else lambda p: client.messages.create(**p)
+        )
         
-        if "temperature" in kwargs:
-            params["temperature"] = kwargs["temperature"]
-        elif self.config.temperature is not None:
-            params["temperature"] = self.config.temperature
+        cache_ticket, cached = await self._acache_lookup(params, kwargs.get("cache", False))
+        if cached is not None:
+            return cached
         
-        if tools:
-            params["tools"] = self._convert_tools(tools)
+        last_error = None
+        for attempt in range(max(1, self.config.max_retries)):
+            try:
+                response = await send(params)
+                result = self._parse_response(response)
+                self._cache_store(cache_ticket, result)
+                return result
+            except Exception as e:
+                last_error = e
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
         
-        # Stream response
-        with client.messages.stream(**params) as stream:
-            for text in stream.text_stream:
-                yield text
+        raise AnthropicAPIError(
+            f"API call failed after {attempt + 1} attempts: {last_error}",
+            status_code=getattr(last_error, "status_code", None),
+            response=last_error
+        )
+    
+    async def astream(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[ToolDefinition]] = None,
+        stream_batch_interval_ms: int = 50,
+        stream_batch_max_chars: int = 256,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from Claude without blocking the event loop.
+        
+        Batching works as in stream(), except that buffered text is also
+        flushed when the interval expires while the model is paused.
+        
+        Args:
+            messages: Conversation messages
+            tools: Optional tools (note: tool use with streaming has limitations)
+            stream_batch_interval_ms: Maximum time to hold buffered text
+            stream_batch_max_chars: Buffered size that triggers a yield
+            **kwargs: Additional parameters
+            
+        Yields:
+            Content chunks as they are generated
+        """
+        client = self._get_async_client()
+        params = self._build_params(messages, tools, kwargs)
+        
+        async def text_events():
+            async with client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        
+        async for chunk in _abatch_chunks(
+            text_events(), stream_batch_interval_ms / 1000, stream_batch_max_chars
+        ):
+            yield chunk
+    
+    @classmethod
+    def _get_encoder(cls):
+        """Load the local BPE encoder once per process, or None if unavailable."""
+        if not cls._encoder_loaded:
+            with _ENCODER_LOCK:
+                if not cls._encoder_loaded:
+                    try:
+                        import tiktoken
+                        cls._encoder = tiktoken.get_encoding(cls.TOKENIZER_ENCODING)
+                    except Exception:
+                        cls._encoder = None
+                    cls._encoder_loaded = True
+        return cls._encoder
     
     def count_tokens(self, text: str) -> int:
         """
-        Count tokens using Anthropic's tokenizer.
-        Falls back to estimation if tokenizer unavailable.
+        Count tokens locally without an API round trip.
+        
+        Uses tiktoken's cl100k_base encoding as an approximation of Claude's
+        tokenizer; falls back to estimation if tiktoken is unavailable.
         """
-        try:
-            client = self._get_client()
-            # Use the count_tokens endpoint if available
-            response = client.count_tokens(text)
-            return response.tokens
-        except Exception:
-            # Fallback to estimation (~4 chars per token for Claude)
-            return len(text) // 4
+        encoder = self._get_encoder()
+        if encoder is not None:
+            return len(encoder.encode(text, disallowed_special=()))
+        # Fallback to estimation (~4 chars per token for Claude)
+        return len(text) // 4
+    
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for several texts in one call."""
+        encoder = self._get_encoder()
+        if encoder is not None:
+            return [len(tokens) for tokens in encoder.encode_batch(texts, disallowed_special=())]
+        return [len(text) // 4 for text in texts]
     
     def create_tool_definition(
         self,
@@ -3,13 +3,33 @@ Base LLM Provider classes and interfaces.
 Defines the contract that all LLM providers must implement.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, Callable, Iterator
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Protocol, Type, Callable, Iterator, Tuple, Union
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
+import asyncio
+import hashlib
+import inspect
 import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class MessageRole(Enum):
+
+def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class MessageRole(str, Enum):
     """Role of a message in a conversation."""
     SYSTEM = "system"
     USER = "user"
@@ -17,18 +37,47 @@ class MessageRole(Enum):
     TOOL = "tool"
 
 
-@dataclass
+# Interned role strings stored on LLMMessage; they compare equal to the
+# corresponding MessageRole members
+ROLE_SYSTEM = sys.intern("system")
+ROLE_USER = sys.intern("user")
+ROLE_ASSISTANT = sys.intern("assistant")
+ROLE_TOOL = sys.intern("tool")
+_ROLES = {role.value: sys.intern(role.value) for role in MessageRole}
+
+
+@dataclass(slots=True)
 class LLMMessage:
-    """Represents a message in a conversation."""
-    role: MessageRole
+    """
+    Represents a message in a conversation.
+    
+    ``role`` may be given as a MessageRole or its string value and is
+    stored as an interned string.
+    """
+    role: str
     content: str
     name: Optional[str] = None
     tool_call_id: Optional[str] = None
+    # Anthropic request payload, filled in on first conversion and dropped
+    # whenever another field is assigned
+    _anthropic_payload: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        role = self.role.value if isinstance(self.role, MessageRole) else self.role
+        interned = _ROLES.get(role)
+        if interned is None:
+            raise ValueError(f"Invalid message role: {role!r}")
+        self.role = interned
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_anthropic_payload":
+            object.__setattr__(self, "_anthropic_payload", None)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
         result = {
-            "role": self.role.value,
+            "role": self.role,
             "content": self.content
         }
         if self.name:
@@ -40,30 +89,30 @@ class LLMMessage:
     @classmethod
     def system(cls, content: str) -> "LLMMessage":
         """Create a system message."""
-        return cls(role=MessageRole.SYSTEM, content=content)
+        return cls(role=ROLE_SYSTEM, content=content)
     
     @classmethod
     def user(cls, content: str) -> "LLMMessage":
         """Create a user message."""
-        return cls(role=MessageRole.USER, content=content)
+        return cls(role=ROLE_USER, content=content)
     
     @classmethod
     def assistant(cls, content: str) -> "LLMMessage":
         """Create an assistant message."""
-        return cls(role=MessageRole.ASSISTANT, content=content)
+        return cls(role=ROLE_ASSISTANT, content=content)
     
     @classmethod
     def tool_result(cls, tool_call_id: str, content: str, name: str = None) -> "LLMMessage":
         """Create a tool result message."""
         return cls(
-            role=MessageRole.TOOL,
+            role=ROLE_TOOL,
             content=content,
             tool_call_id=tool_call_id,
             name=name
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Represents a tool call requested by the LLM."""
     id: str
@@ -78,7 +127,7 @@ class ToolCall:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result from executing a tool."""
     tool_call_id: str
@@ -92,11 +141,11 @@ class ToolResult:
     def to_content(self) -> str:
         """Convert to content string for LLM."""
         if self.is_error:
-            return json.dumps({"error": self.error})
-        return json.dumps(self.output) if not isinstance(self.output, str) else self.output
+            return _dumps({"error": self.error}).decode("utf-8")
+        return _dumps(self.output).decode("utf-8") if not isinstance(self.output, str) else self.output
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from an LLM provider."""
     content: str
@@ -127,9 +176,20 @@ class LLMResponse:
             "stop_reason": self.stop_reason,
             "usage": self.usage
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LLMResponse":
+        """Create a response from its to_dict() form."""
+        return cls(
+            content=data["content"],
+            model=data["model"],
+            tool_calls=[ToolCall(**tc) for tc in data.get("tool_calls", [])],
+            stop_reason=data.get("stop_reason"),
+            usage=dict(data.get("usage", {}))
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     """Configuration for an LLM provider."""
     api_key: Optional[str] = None
@@ -156,12 +216,13 @@ class ProviderConfig:
         )
 
 
-@dataclass 
+@dataclass(slots=True)
 class ToolDefinition:
     """Definition of a tool that can be used by the LLM."""
     name: str
     description: str
     parameters: Dict[str, Any]
+    _anthropic: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -169,6 +230,91 @@ class ToolDefinition:
             "description": self.description,
             "input_schema": self.parameters
         }
+    
+    def to_anthropic_dict(self) -> Dict[str, Any]:
+        """Anthropic tool format, built once per definition."""
+        if self._anthropic is None:
+            self._anthropic = self.to_dict()
+        return self._anthropic
+
+
+class CacheBackend(Protocol):
+    """Storage for cached responses, keyed by request hash."""
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        ...
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        ...
+
+
+class MemoryCache:
+    """In-process LRU response cache."""
+    
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def request_cache_key(params: Dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON form of request parameters."""
+    return hashlib.sha256(_dumps(params, sort_keys=True)).hexdigest()
+
+
+def _semantic_request(params: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """
+    Prompt text and namespace for a semantic cache lookup, if eligible.
+    
+    Only requests ending in a plain-text user message qualify. The
+    namespace covers the model, system prompt and all earlier messages, so
+    a short follow-up such as "yes" only matches within the same
+    conversation.
+    """
+    messages = params.get("messages") or []
+    if not messages or messages[-1].get("role") != "user":
+        return None
+    text = messages[-1].get("content")
+    if not isinstance(text, str) or not text:
+        return None
+    namespace = request_cache_key({
+        "model": params.get("model"),
+        "system": params.get("system"),
+        "history": messages[:-1],
+    })
+    return text, namespace
+
+
+_TOOL_POOL: Optional[ThreadPoolExecutor] = None
+_TOOL_POOL_LOCK = threading.Lock()
+
+
+def _get_tool_pool() -> ThreadPoolExecutor:
+    """Get the process-wide pool used to run a round's tool calls."""
+    global _TOOL_POOL
+    if _TOOL_POOL is None:
+        with _TOOL_POOL_LOCK:
+            if _TOOL_POOL is None:
+                _TOOL_POOL = ThreadPoolExecutor(thread_name_prefix="llm-tool")
+    return _TOOL_POOL
 
 
 class BaseLLMProvider(ABC):
@@ -179,6 +325,9 @@ class BaseLLMProvider(ABC):
     and implement the required abstract methods.
     """
     
+    # Registry name; read from the class so registration needs no instance
+    PROVIDER_NAME: str = ""
+    
     def __init__(self, config: ProviderConfig):
         """
         Initialize the provider with configuration.
@@ -187,13 +336,102 @@ class BaseLLMProvider(ABC):
             config: Provider configuration
         """
         self.config = config
+        self.response_cache: Optional[CacheBackend] = None
+        self.semantic_cache = None
+        self.cache_hits = 0
+        self.cache_misses = 0
         self._validate_config()
     
+    def _cache_lookup(
+        self,
+        params: Dict[str, Any],
+        force: bool = False
+    ) -> Tuple[Optional[tuple], Optional[LLMResponse]]:
+        """
+        Look up a request in the response caches.
+        
+        The exact-match cache only holds deterministic requests (temperature
+        0) unless ``force`` is set; the semantic cache additionally skips
+        requests with tools. Returns a ticket to pass to _cache_store()
+        (None when nothing is cacheable) and the cached response, if any.
+        """
+        key, cached = self._exact_cache_lookup(params, force)
+        if cached is not None:
+            return None, cached
+        request = self._semantic_cache_request(params)
+        found = self.semantic_cache.lookup(*request) if request is not None else None
+        return self._finish_cache_lookup(key, request, found)
+    
+    async def _acache_lookup(
+        self,
+        params: Dict[str, Any],
+        force: bool = False
+    ) -> Tuple[Optional[tuple], Optional[LLMResponse]]:
+        """Async variant of _cache_lookup(); the prompt is embedded in a worker thread."""
+        key, cached = self._exact_cache_lookup(params, force)
+        if cached is not None:
+            return None, cached
+        request = self._semantic_cache_request(params)
+        found = None
+        if request is not None:
+            found = await asyncio.to_thread(self.semantic_cache.lookup, *request)
+        return self._finish_cache_lookup(key, request, found)
+    
+    def _exact_cache_lookup(
+        self,
+        params: Dict[str, Any],
+        force: bool
+    ) -> Tuple[Optional[str], Optional[LLMResponse]]:
+        if self.response_cache is None or not (force or params.get("temperature", 0) == 0):
+            return None, None
+        key = request_cache_key(params)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return key, LLMResponse.from_dict(cached)
+        return key, None
+    
+    def _semantic_cache_request(self, params: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        if (self.semantic_cache is None or not self.semantic_cache.enabled
+                or params.get("temperature", 0) != 0 or params.get("tools")):
+            return None
+        return _semantic_request(params)
+    
+    def _finish_cache_lookup(
+        self,
+        key: Optional[str],
+        request: Optional[Tuple[str, str]],
+        found: Optional[tuple]
+    ) -> Tuple[Optional[tuple], Optional[LLMResponse]]:
+        semantic = None
+        if found is not None:
+            vector, cached = found
+            if cached is not None:
+                self.cache_hits += 1
+                return None, LLMResponse.from_dict(cached)
+            semantic = (vector, request[1])
+        
+        if key is None and semantic is None:
+            return None, None
+        self.cache_misses += 1
+        return (key, semantic), None
+    
+    def _cache_store(self, ticket: Optional[tuple], response: LLMResponse) -> None:
+        """Store a response under a ticket returned by _cache_lookup()."""
+        if ticket is None:
+            return
+        key, semantic = ticket
+        value = response.to_dict()
+        if key is not None:
+            self.response_cache.set(key, value)
+        if semantic is not None:
+            vector, namespace = semantic
+            self.semantic_cache.add(vector, value, namespace)
+    
     @property
-    @abstractmethod
     def name(self) -> str:
         """Return the provider name."""
-        pass
+        return self.PROVIDER_NAME
     
     @property
     @abstractmethod
@@ -253,6 +491,7 @@ class BaseLLMProvider(ABC):
         tools: Optional[List[ToolDefinition]] = None,
         tool_executor: Optional[Callable[[ToolCall], ToolResult]] = None,
         max_tool_rounds: int = 10,
+        parallel_tools: bool = True,
         **kwargs
     ) -> LLMResponse:
         """
@@ -264,6 +503,7 @@ class BaseLLMProvider(ABC):
             tools: Optional list of available tools
             tool_executor: Function to execute tool calls
             max_tool_rounds: Maximum rounds of tool use
+            parallel_tools: Run the tool calls of a round concurrently
             **kwargs: Additional parameters
             
         Returns:
@@ -285,9 +525,13 @@ class BaseLLMProvider(ABC):
             # Add assistant response with tool calls
             messages.append(LLMMessage.assistant(response.content))
             
-            # Execute tools and add results
-            for tool_call in response.tool_calls:
-                result = tool_executor(tool_call)
+            # Execute tools and add results in call order
+            if parallel_tools and len(response.tool_calls) > 1:
+                results = list(_get_tool_pool().map(tool_executor, response.tool_calls))
+            else:
+                results = [tool_executor(tool_call) for tool_call in response.tool_calls]
+            
+            for tool_call, result in zip(response.tool_calls, results):
                 messages.append(LLMMessage.tool_result(
                     tool_call_id=tool_call.id,
                     content=result.to_content(),
@@ -297,6 +541,109 @@ class BaseLLMProvider(ABC):
         # Final completion after max rounds
         return self.complete(messages, tools=tools, **kwargs)
     
+    async def acomplete(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[ToolDefinition]] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Async variant of complete().
+        
+        The default runs complete() in a worker thread; providers with a
+        native async client should override it.
+        """
+        return await asyncio.to_thread(self.complete, messages, tools, **kwargs)
+    
+    async def astream(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[ToolDefinition]] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of stream().
+        
+        The default yields the full completion as a single chunk; providers
+        with a native async client should override it.
+        """
+        response = await self.acomplete(messages, tools=tools, **kwargs)
+        yield response.content
+    
+    async def achat(
+        self,
+        user_message: str,
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[ToolDefinition]] = None,
+        tool_executor: Optional[Callable[[ToolCall], Union[ToolResult, Awaitable[ToolResult]]]] = None,
+        max_tool_rounds: int = 10,
+        parallel_tools: bool = True,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Async variant of chat().
+        
+        Completions are awaited via acomplete(). The tool calls of a round
+        run concurrently: coroutine executors are gathered, plain ones run
+        in worker threads. Results are appended in call order either way.
+        
+        Args:
+            user_message: The user's message
+            system_prompt: Optional system prompt
+            tools: Optional list of available tools
+            tool_executor: Function or coroutine function to execute tool calls
+            max_tool_rounds: Maximum rounds of tool use
+            parallel_tools: Run the tool calls of a round concurrently
+            **kwargs: Additional parameters
+            
+        Returns:
+            Final LLMResponse after tool execution
+        """
+        messages = []
+        
+        if system_prompt:
+            messages.append(LLMMessage.system(system_prompt))
+        
+        messages.append(LLMMessage.user(user_message))
+        
+        for _ in range(max_tool_rounds):
+            response = await self.acomplete(messages, tools=tools, **kwargs)
+            
+            if not response.has_tool_calls or not tool_executor:
+                return response
+            
+            messages.append(LLMMessage.assistant(response.content))
+            
+            if inspect.iscoroutinefunction(tool_executor):
+                if parallel_tools:
+                    results = await asyncio.gather(
+                        *(tool_executor(tool_call) for tool_call in response.tool_calls)
+                    )
+                else:
+                    results = [await tool_executor(tool_call) for tool_call in response.tool_calls]
+            else:
+                loop = asyncio.get_running_loop()
+                pool = _get_tool_pool()
+                if parallel_tools:
+                    results = await asyncio.gather(*(
+                        loop.run_in_executor(pool, tool_executor, tool_call)
+                        for tool_call in response.tool_calls
+                    ))
+                else:
+                    results = [
+                        await loop.run_in_executor(pool, tool_executor, tool_call)
+                        for tool_call in response.tool_calls
+                    ]
+            
+            for tool_call, result in zip(response.tool_calls, results):
+                messages.append(LLMMessage.tool_result(
+                    tool_call_id=tool_call.id,
+                    content=result.to_content(),
+                    name=tool_call.name
+                ))
+        
+        return await self.acomplete(messages, tools=tools, **kwargs)
+    
     def count_tokens(self, text: str) -> int:
         """
         Estimate token count for text.
@@ -305,6 +652,10 @@ class BaseLLMProvider(ABC):
         """
         # Rough approximation: ~4 characters per token
         return len(text) // 4
+    
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for several texts."""
+        return [self.count_tokens(text) for text in texts]
 
 
 class ProviderRegistry:
@@ -323,15 +674,9 @@ class ProviderRegistry:
         Returns:
             The same provider class (for decorator usage)
         """
-        # Create temporary instance to get name
-        temp_config = ProviderConfig(api_key="temp", model="temp")
-        try:
-            instance = provider_class(temp_config)
-            cls._providers[instance.name] = provider_class
-        except Exception:
-            # If instantiation fails, use class name
-            name = provider_class.__name__.lower().replace("provider", "")
-            cls._providers[name] = provider_class
+        # Fall back to the class name when no PROVIDER_NAME is declared
+        name = provider_class.PROVIDER_NAME or provider_class.__name__.lower().replace("provider", "")
+        cls._providers[name] = provider_class
         return provider_class
     
     @classmethod
@@ -0,0 +1,84 @@
+"""
+Request batching for async provider calls.
+
+Groups independent requests issued within a short window and dispatches
+them together, so concurrent conversations share connection setup and
+HTTP/2 multiplexing instead of queueing one request at a time.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+
+class BatchScheduler:
+    """
+    Collects requests for up to ``max_wait_ms`` (or ``max_batch`` requests)
+    and sends each batch concurrently.
+
+    A scheduler is bound to the event loop it is first used on.
+    """
+
+    def __init__(self,
+                 send: Callable[[Dict[str, Any]], Awaitable[Any]],
+                 max_wait_ms: float = 5,
+                 max_batch: int = 32):
+        """
+        Initialize the scheduler.
+
+        Args:
+            send: Coroutine function performing a single request
+            max_wait_ms: Longest a request waits for others to join its batch
+            max_batch: Batch size that triggers immediate dispatch
+        """
+        self._send = send
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch = max_batch
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # In-flight dispatches; the loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, params: Dict[str, Any]) -> Any:
+        """Queue a request and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((params, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """Dispatch pending requests now and wait for all in-flight batches."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def close(self) -> None:
+        """Flush outstanding requests before the scheduler is discarded."""
+        await self.flush()
+
+    async def _dispatch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        results = await asyncio.gather(
+            *(self._send(params) for params, _ in batch),
+            return_exceptions=True
+        )
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
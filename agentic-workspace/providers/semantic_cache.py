@@ -0,0 +1,129 @@
+"""
+Semantic response cache for LLM providers.
+
+Matches new prompts against previously answered ones by embedding
+similarity, so paraphrased deterministic requests can reuse a response.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return [0.0 for _ in vector]
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache for responses.
+
+    Entries are grouped by namespace (model and system prompt) and expire
+    after ``ttl_seconds``; the least recently used entry is evicted once
+    ``max_entries`` is reached.
+    """
+
+    def __init__(self,
+                 embedder: Optional[Callable[[str], Sequence[float]]] = None,
+                 threshold: float = 0.95,
+                 ttl_seconds: Optional[float] = 3600,
+                 max_entries: int = 1000,
+                 enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            embedder: Function mapping text to an embedding vector; defaults
+                to a sentence-transformers model loaded on first use
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Entry lifetime, or None to keep entries until evicted
+            max_entries: Maximum number of cached responses
+            enabled: Whether lookups and stores are performed
+        """
+        self._embedder = embedder
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        # id -> (namespace, unit vector, response dict, expires_at)
+        self._entries: "OrderedDict[int, Tuple[str, List[float], Dict[str, Any], float]]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _embed(self, text: str) -> List[float]:
+        if self._embedder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    "The 'sentence-transformers' package is required for the "
+                    "default embedder. Install it or pass embedder=..."
+                )
+            model = SentenceTransformer(DEFAULT_EMBEDDING_MODEL)
+            self._embedder = lambda t: model.encode(t).tolist()
+        return _normalize(list(self._embedder(text)))
+
+    def lookup(self, text: str, namespace: str = "") -> Tuple[List[float], Optional[Dict[str, Any]]]:
+        """
+        Find the most similar cached response.
+
+        Returns:
+            Tuple of (embedding of text, cached response dict or None); pass
+            the embedding to add() on a miss to avoid embedding twice
+        """
+        vector = self._embed(text)
+        now = time.time()
+
+        with self._lock:
+            expired = [i for i, e in self._entries.items() if e[3] <= now]
+            for entry_id in expired:
+                del self._entries[entry_id]
+
+            candidates = [(i, e) for i, e in self._entries.items() if e[0] == namespace]
+            if not candidates:
+                return vector, None
+
+            if np is not None:
+                scores = np.asarray([e[1] for _, e in candidates]) @ np.asarray(vector)
+                best = int(scores.argmax())
+                best_score = float(scores[best])
+            else:
+                scores = [sum(a * b for a, b in zip(e[1], vector)) for _, e in candidates]
+                best = max(range(len(scores)), key=scores.__getitem__)
+                best_score = scores[best]
+
+            if best_score < self.threshold:
+                return vector, None
+
+            entry_id, entry = candidates[best]
+            self._entries.move_to_end(entry_id)
+            return vector, entry[2]
+
+    def add(self, vector: List[float], value: Dict[str, Any], namespace: str = "") -> None:
+        """Store a response under an embedding returned by lookup()."""
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds is not None else math.inf
+        with self._lock:
+            self._entries[self._next_id] = (namespace, vector, value, expires_at)
+            self._next_id += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
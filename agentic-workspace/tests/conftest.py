@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for the agentic workspace tests.
+"""
+import sys
+from pathlib import Path
+
+# Make the workspace packages (utils, tools, providers, ...) importable once
+# for the whole session instead of from each test module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Skip writing .pyc files (including pytest's rewritten test modules) for
+# everything imported during the run; equivalent to PYTHONDONTWRITEBYTECODE=1
+sys.dont_write_bytecode = True
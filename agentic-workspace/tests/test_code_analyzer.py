@@ -0,0 +1,131 @@
+"""
+Unit tests for the code analyzer tool
+"""
+from tools.implementations.code_analyzer import (
+    CodeAnalyzerTool,
+    ComplexityAnalyzer,
+    PerformanceAnalyzer,
+    SecurityAnalyzer,
+)
+
+
+PYTHON_SAMPLE = '''import os
+from helpers import *
+
+# Configuration
+password = "hunter2"
+
+
+def process(items):
+    global counter
+    for i in range(len(items)):
+        if items[i] and i > 0:
+            eval(items[i])
+
+    os.system("ls")
+'''
+
+
+class TestCodeAnalyzer:
+    """Test cases for the code analyzers"""
+
+    def test_security_issues_by_line(self):
+        """Test that security findings report the matching line"""
+        issues = SecurityAnalyzer(PYTHON_SAMPLE, "python").analyze()
+        found = sorted((issue.line, issue.severity) for issue in issues)
+        assert found == [(5, "critical"), (12, "high"), (14, "high")]
+
+    def test_security_patterns_ignore_case(self):
+        """Test that security patterns match case-insensitively"""
+        issues = SecurityAnalyzer('API_KEY = "abc"', "python").analyze()
+        assert [issue.message for issue in issues] == ["Hardcoded API key detected"]
+
+    def test_security_matches_stay_within_a_line(self):
+        """Test overlapping findings on one line and no matches across lines"""
+        code = 'subprocess.run(cmd, shell=True); os.system(cmd)\neval\n(x)\n'
+        issues = SecurityAnalyzer(code, "python").analyze()
+        assert [(issue.line, issue.message) for issue in issues] == [
+            (1, "Shell=True can lead to command injection"),
+            (1, "os.system() is vulnerable to command injection"),
+        ]
+
+    def test_performance_issues(self):
+        """Test Python and JavaScript performance findings"""
+        python_lines = [i.line for i in PerformanceAnalyzer(PYTHON_SAMPLE, "python").analyze()]
+        assert sorted(python_lines) == [2, 9, 10]
+
+        js = "el.innerHTML += row;\nconst copy = JSON.parse(JSON.stringify(obj));\n"
+        js_lines = [i.line for i in PerformanceAnalyzer(js, "javascript").analyze()]
+        assert sorted(js_lines) == [1, 2]
+
+    def test_complexity_metrics(self):
+        """Test cyclomatic complexity and line counts"""
+        analyzer = ComplexityAnalyzer(PYTHON_SAMPLE, "python")
+        assert analyzer.calculate_cyclomatic_complexity() == 4
+        assert analyzer.calculate_loc_metrics() == {
+            "total_lines": 15,
+            "code_lines": 9,
+            "blank_lines": 5,
+            "comment_lines": 1,
+            "comment_ratio": 11.11,
+        }
+
+    def test_long_functions(self):
+        """Test that long functions are reported alongside the complexity"""
+        body = "".join(f"    x{i} = {i}\n" for i in range(6))
+        code = f"def short():\n    pass\n\nasync def long():\n{body}"
+        complexity, issues = ComplexityAnalyzer(code, "python").analyze_structure(threshold=5)
+        assert complexity == 1
+        assert [(issue.line, issue.message) for issue in issues] == [
+            (4, "Function 'long' is 7 lines (threshold: 5)")
+        ]
+
+    def test_estimated_complexity(self):
+        """Test the pattern-based estimate used for other languages"""
+        js = "if (a && b) { x(); } else { for (;;) {} }"
+        assert ComplexityAnalyzer(js, "javascript").calculate_cyclomatic_complexity() == 5
+
+    def test_analyze_file(self, tmp_path):
+        """Test a full analysis run against a file"""
+        source = tmp_path / "sample.py"
+        source.write_text(PYTHON_SAMPLE, encoding="utf-8")
+
+        result = CodeAnalyzerTool()(file_path=str(source))
+        assert result.is_success
+        assert result.data["metrics"]["quality_score"] == 100 - 25 - 15 - 15 - 2 * 3
+        assert len(result.data["issues"]) == 6
+
+    def test_analyses_on_thread_pool(self, monkeypatch):
+        """Test that pooled analyses report the same results in the same order"""
+        from tools.implementations import code_analyzer
+        sequential = CodeAnalyzerTool()(code=PYTHON_SAMPLE).data
+        monkeypatch.setattr(code_analyzer, "_GIL_ENABLED", False)
+        assert CodeAnalyzerTool()(code=PYTHON_SAMPLE).data == sequential
+
+    def test_analyze_crlf_file(self, tmp_path):
+        """Test that CRLF files report the same lines as LF files"""
+        source = tmp_path / "sample.py"
+        source.write_bytes(PYTHON_SAMPLE.replace("\n", "\r\n").encode("utf-8"))
+
+        crlf = CodeAnalyzerTool()(file_path=str(source)).data
+        lf = CodeAnalyzerTool()(code=PYTHON_SAMPLE).data
+        assert crlf["issues"] == lf["issues"]
+        assert crlf["metrics"] == lf["metrics"]
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file is reported as an error"""
+        result = CodeAnalyzerTool()(file_path=str(tmp_path / "missing.py"))
+        assert not result.is_success
+        assert "File not found" in result.error
+
+
+    def test_package_exports_result_types(self):
+        """Test that the package's ToolResult and ToolStatus are the analyzer's"""
+        import tools.implementations as implementations
+        from tools.implementations import base
+
+        result = CodeAnalyzerTool()(code=PYTHON_SAMPLE)
+        assert isinstance(result, implementations.ToolResult)
+        assert result.status == implementations.ToolStatus.SUCCESS
+        assert implementations.BaseToolResult is base.ToolResult
+        assert implementations.BaseToolStatus is base.ToolStatus
@@ -5,12 +5,8 @@ import pytest
 import json
 import tempfile
 import os
-from pathlib import Path
 import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from utils.config_loader import ConfigLoader
 
 
@@ -47,6 +43,58 @@ class TestConfigLoader:
         finally:
             os.unlink(temp_path)
 
+    def test_load_json_stdlib_fallback(self, monkeypatch):
+        """Test loading JSON when orjson is not installed"""
+        import utils.config_loader as config_loader
+        monkeypatch.setattr(config_loader, "orjson", None)
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('{"key": "value", "nested": {"list": [1, 2]}}')
+            temp_path = f.name
+
+        try:
+            assert ConfigLoader.load_json(temp_path, use_cache=False) == {
+                "key": "value", "nested": {"list": [1, 2]}
+            }
+            with open(temp_path, 'w') as f:
+                f.write("{invalid json content}")
+            with pytest.raises(json.JSONDecodeError):
+                ConfigLoader.load_json(temp_path, use_cache=False)
+        finally:
+            os.unlink(temp_path)
+
+    def test_load_json_cache_invalidated_on_change(self):
+        """Test that cached JSON is reloaded after the file changes"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"version": 1}, f)
+            temp_path = f.name
+
+        try:
+            first = ConfigLoader.load_json(temp_path)
+            first["version"] = "mutated"
+            assert ConfigLoader.load_json(temp_path) == {"version": 1}
+
+            with open(temp_path, 'w') as f:
+                json.dump({"version": 22}, f)
+            assert ConfigLoader.load_json(temp_path) == {"version": 22}
+        finally:
+            ConfigLoader.clear_cache()
+            os.unlink(temp_path)
+
+    def test_load_json_cache_isolates_nested_values(self):
+        """Test that mutating nested values of a result leaves the cache intact"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"a": {"tools": ["read"]}}, f)
+            temp_path = f.name
+
+        try:
+            ConfigLoader.load_json(temp_path)["a"]["tools"].append("INJECTED")
+            ConfigLoader.load_json(temp_path)["a"]["tools"].append("INJECTED")
+            assert ConfigLoader.load_json(temp_path) == {"a": {"tools": ["read"]}}
+        finally:
+            ConfigLoader.clear_cache()
+            os.unlink(temp_path)
+
     def test_validate_config_success(self):
         """Test successful config validation"""
         config = {
@@ -114,6 +162,25 @@ class TestConfigLoader:
         assert result["model"]["name"] == "claude-sonnet"
         assert result["model"]["temperature"] == 0.9
 
+    def test_merge_configs_deep(self):
+        """Test merging configurations nested deeper than the recursion limit"""
+        depth = sys.getrecursionlimit() + 100
+        base, override = {}, {}
+        b, o = base, override
+        for _ in range(depth):
+            b["child"], o["child"] = {"keep": 1}, {}
+            b, o = b["child"], o["child"]
+        o["value"] = "deep"
+
+        result = ConfigLoader.merge_configs(base, override)
+
+        node = result
+        for _ in range(depth):
+            node = node["child"]
+            assert node["keep"] == 1
+        assert node["value"] == "deep"
+        assert "value" not in b
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,50 @@
+"""
+Unit tests for the file tools
+"""
+from pathlib import Path
+
+import pytest
+
+from tools.implementations.file_tools import GlobTool, _iter_glob
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A small tree with nested, hidden and non-Python files"""
+    for name in (
+        "top.py", "readme.md", ".hidden.py",
+        "pkg/mod.py", "pkg/data.txt", "pkg/sub/deep.py",
+        ".venv/lib/site.py", "pkg/.cache/cached.py",
+    ):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    return tmp_path
+
+
+def _is_hidden(path: Path, base: Path) -> bool:
+    return any(part.startswith(".") for part in path.relative_to(base).parts)
+
+
+class TestIterGlob:
+    """Test cases for the scandir-based glob walk"""
+
+    @pytest.mark.parametrize("pattern", ["*", "*.py", "**/*.py", "pkg/**", "pkg/*/*.py", "**"])
+    def test_matches_path_glob(self, tree, pattern):
+        """Test that results agree with Path.glob, with and without hidden entries"""
+        expected = {p for p in tree.glob(pattern) if not pattern.endswith("**") or p.is_dir()}
+
+        found = {Path(path) for path, _ in _iter_glob(str(tree), pattern, True)}
+        assert found == expected
+
+        found = {Path(path) for path, _ in _iter_glob(str(tree), pattern, False)}
+        assert found == {p for p in expected if not _is_hidden(p, tree)}
+
+    def test_absolute_pattern_rejected(self, tree):
+        """Test that absolute patterns fail instead of matching relative to the base"""
+        with pytest.raises(ValueError, match="Non-relative"):
+            list(_iter_glob(str(tree), "/etc/host*", False))
+
+        result = GlobTool().run(pattern="/etc/host*", base_path=str(tree))
+        assert not result.is_success()
+        assert result.error_type == "ValueError"
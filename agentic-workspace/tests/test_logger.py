@@ -3,13 +3,7 @@ Unit tests for logger utility
 """
 import pytest
 import json
-import tempfile
-import shutil
 from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.logger import AgenticLogger
 
@@ -17,15 +11,12 @@ from utils.logger import AgenticLogger
 class TestAgenticLogger:
     """Test cases for AgenticLogger utility"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup_logger(self, tmp_path):
+        """Set up test fixtures in pytest's managed temp directory"""
+        self.temp_dir = str(tmp_path)
         self.logger = AgenticLogger(log_dir=self.temp_dir)
 
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_logger_initialization(self):
         """Test logger initializes correctly"""
         assert self.logger is not None
@@ -100,6 +91,63 @@ class TestAgenticLogger:
         log_files = list(Path(self.temp_dir).glob("*.log"))
         assert len(log_files) > 0
 
+    def test_batched_agent_actions(self):
+        """Test that batched agent actions are written once the batch fills"""
+        logger = AgenticLogger(log_dir=self.temp_dir, console_output=False, batch_size=3)
+        log_file = next(Path(self.temp_dir).glob("*.log"))
+
+        logger.log_agent_action("test-agent", "first", {})
+        logger.log_agent_action("test-agent", "second", {})
+        assert log_file.read_text() == ""
+
+        logger.log_agent_action("test-agent", "third", {})
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(line)["action"] for line in lines] == ["first", "second", "third"]
+
+    def test_flush_writes_pending_actions(self):
+        """Test that flush writes a partially filled batch"""
+        logger = AgenticLogger(log_dir=self.temp_dir, console_output=False, batch_size=10)
+        log_file = next(Path(self.temp_dir).glob("*.log"))
+
+        logger.log_agent_action("test-agent", "only", {})
+        logger.flush()
+        assert json.loads(log_file.read_text())["agent"] == "test-agent"
+        assert logger.get_metrics_summary()["agent_actions"]["count"] == 1
+
+    def test_batched_records_reach_ancestor_handlers(self, caplog):
+        """Test that flushed records propagate like unbatched ones"""
+        logger = AgenticLogger(log_dir=self.temp_dir, console_output=False, batch_size=10)
+
+        logger.log_agent_action("test-agent", "buffered", {})
+        assert caplog.records == []
+        logger.flush()
+        assert [record.action for record in caplog.records] == ["buffered"]
+
+    def test_batched_workflow_events_flush_on_error(self):
+        """Test that workflow events are batched and an error flushes the batch"""
+        logger = AgenticLogger(log_dir=self.temp_dir, console_output=False, batch_size=10)
+        log_file = next(Path(self.temp_dir).glob("*.log"))
+
+        logger.log_workflow_start("test-workflow", {})
+        logger.log_workflow_step("test-workflow", "build", "completed")
+        assert log_file.read_text() == ""
+
+        logger.log_workflow_step("test-workflow", "deploy", "failed")
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(line)["action"] for line in lines] == [
+            "workflow_start", "step_completed", "step_failed"
+        ]
+
+    def test_json_records_stdlib_fallback(self, monkeypatch):
+        """Test JSON log lines when orjson is not installed"""
+        import utils.logger as logger_module
+        monkeypatch.setattr(logger_module, "orjson", None)
+        logger = AgenticLogger(log_dir=self.temp_dir, console_output=False)
+        log_file = next(Path(self.temp_dir).glob("*.log"))
+
+        logger.log_agent_action("test-agent", "paths", {"path": Path("a.txt")})
+        assert json.loads(log_file.read_text())["details"] == {"path": "a.txt"}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,457 @@
+"""
+Unit tests for the LLM providers
+"""
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from providers import (
+    AnthropicProvider,
+    BatchScheduler,
+    LLMMessage,
+    MemoryCache,
+    ProviderConfig,
+    SemanticCache,
+    ToolResult,
+    get_provider,
+)
+from providers.anthropic_provider import MessageConverter, _abatch_chunks, _batch_chunks
+from providers.base_provider import ToolDefinition, request_cache_key
+
+
+def _response(text, model="stub-model"):
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=text)],
+        model=model,
+        stop_reason="end_turn",
+        usage=SimpleNamespace(input_tokens=3, output_tokens=5),
+    )
+
+
+def _tool_response(*calls):
+    """A response requesting the given (id, name, input) tool calls"""
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="calling tools")] + [
+            SimpleNamespace(type="tool_use", id=call_id, name=name, input=arguments)
+            for call_id, name, arguments in calls
+        ],
+        model="stub-model",
+        stop_reason="tool_use",
+        usage=SimpleNamespace(input_tokens=3, output_tokens=5),
+    )
+
+
+class StubMessages:
+    """Stands in for the SDK's ``client.messages`` resource"""
+
+    def __init__(self, replies=None):
+        self.calls = []
+        self.replies = list(replies or [])
+
+    def _next(self, params):
+        self.calls.append(params)
+        reply = self.replies.pop(0) if self.replies else f"reply {len(self.calls)}"
+        if isinstance(reply, BaseException):
+            raise reply
+        return _response(reply) if isinstance(reply, str) else reply
+
+    def create(self, **params):
+        return self._next(params)
+
+
+class AsyncStubMessages(StubMessages):
+    """Async variant of StubMessages"""
+
+    async def create(self, **params):
+        await asyncio.sleep(0)
+        return self._next(params)
+
+
+def _provider(**config):
+    provider = AnthropicProvider(ProviderConfig(api_key="test-key", temperature=0, **config))
+    provider._client = SimpleNamespace(messages=StubMessages())
+    return provider
+
+
+def _use_async_stub(provider, messages=None):
+    """Install an async stub client for the running loop"""
+    provider._async_client = SimpleNamespace(messages=messages or AsyncStubMessages())
+    provider._async_client_loop = asyncio.get_running_loop()
+    return provider._async_client.messages
+
+
+def _embed(text):
+    """Letter-count embedding, so equal texts are identical vectors"""
+    return [text.lower().count(c) for c in "abcdefghijklmnopqrstuvwxyz"]
+
+
+class TestResponseCache:
+    """Test cases for the exact-match response cache"""
+
+    def test_request_cache_key(self):
+        """Test that keys ignore dict order but not values"""
+        assert request_cache_key({"a": 1, "b": [1, 2]}) == request_cache_key({"b": [1, 2], "a": 1})
+        assert request_cache_key({"a": 1}) != request_cache_key({"a": 2})
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        """Test LRU eviction once max_size is exceeded"""
+        cache = MemoryCache(max_size=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        assert cache.get("a") == {"v": 1}
+        cache.set("c", {"v": 3})
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == ({"v": 1}, {"v": 3})
+
+    def test_complete_hit_and_miss(self):
+        """Test that a repeated deterministic request is served from the cache"""
+        provider = _provider()
+        provider.response_cache = MemoryCache()
+        messages = [LLMMessage.user("hello")]
+
+        assert provider.complete(messages).content == "reply 1"
+        cached = provider.complete(messages)
+        assert (cached.content, cached.model, cached.input_tokens) == ("reply 1", "stub-model", 3)
+        assert provider.complete([LLMMessage.user("other")]).content == "reply 2"
+        assert (provider.cache_hits, provider.cache_misses) == (1, 2)
+
+    def test_sampled_requests_need_force(self):
+        """Test that temperature > 0 is only cached with cache=True"""
+        provider = _provider()
+        provider.response_cache = MemoryCache()
+        messages = [LLMMessage.user("hello")]
+
+        provider.complete(messages, temperature=0.7)
+        assert provider.complete(messages, temperature=0.7).content == "reply 2"
+        provider.complete(messages, temperature=0.7, cache=True)
+        assert provider.complete(messages, temperature=0.7, cache=True).content == "reply 3"
+
+    def test_acomplete_hit_and_miss(self):
+        """Test the response cache on the async path"""
+        provider = _provider()
+        provider.response_cache = MemoryCache()
+
+        async def run():
+            stub = _use_async_stub(provider)
+            first = await provider.acomplete([LLMMessage.user("hello")])
+            second = await provider.acomplete([LLMMessage.user("hello")])
+            return first.content, second.content, len(stub.calls)
+
+        assert asyncio.run(run()) == ("reply 1", "reply 1", 1)
+
+
+class TestSemanticCache:
+    """Test cases for the semantic response cache on providers"""
+
+    def test_lookup_threshold_namespace_and_eviction(self):
+        """Test similarity matching, namespaces and LRU eviction"""
+        cache = SemanticCache(embedder=_embed, threshold=0.99, max_entries=2)
+        vector, hit = cache.lookup("hello world", "ns")
+        assert hit is None
+        cache.add(vector, {"content": "hi"}, "ns")
+
+        assert cache.lookup("world hello", "ns")[1] == {"content": "hi"}
+        assert cache.lookup("hello world", "other")[1] is None
+        assert cache.lookup("something else", "ns")[1] is None
+
+        for text in ("first", "second"):
+            cache.add(cache.lookup(text, "ns")[0], {"content": text}, "ns")
+        assert len(cache) == 2
+        assert cache.lookup("hello world", "ns")[1] is None
+
+    def test_entries_expire(self):
+        """Test that entries past their TTL are not returned"""
+        cache = SemanticCache(embedder=_embed, ttl_seconds=0)
+        vector, _ = cache.lookup("hello", "")
+        cache.add(vector, {"content": "hi"})
+        assert cache.lookup("hello", "")[1] is None
+        assert len(cache) == 0
+
+    def test_follow_up_does_not_match_other_conversation(self):
+        """Test that the same follow-up in another conversation misses"""
+        provider = _provider()
+        provider.semantic_cache = SemanticCache(embedder=_embed)
+
+        first = [LLMMessage.user("write a poem"), LLMMessage.assistant("Roses..."), LLMMessage.user("yes")]
+        other = [LLMMessage.user("delete my files"), LLMMessage.assistant("Sure?"), LLMMessage.user("yes")]
+        assert provider.complete(first).content == "reply 1"
+        assert provider.complete(other).content == "reply 2"
+        assert provider.complete(list(first)).content == "reply 1"
+        assert (provider.cache_hits, provider.cache_misses) == (1, 2)
+
+    def test_acomplete_embeds_off_the_event_loop(self):
+        """Test that the async path runs the embedder in a worker thread"""
+        threads = []
+
+        def embed(text):
+            threads.append(threading.current_thread())
+            return _embed(text)
+
+        provider = _provider()
+        provider.semantic_cache = SemanticCache(embedder=embed)
+
+        async def run():
+            _use_async_stub(provider)
+            return await provider.acomplete([LLMMessage.user("hello")])
+
+        assert asyncio.run(run()).content == "reply 1"
+        assert threads and threading.main_thread() not in threads
+
+
+class TestRetries:
+    """Test cases for the provider's own retry loop"""
+
+    def test_retries_non_api_errors(self, monkeypatch):
+        """Test that failures outside the SDK are retried with backoff"""
+        from providers import anthropic_provider
+        monkeypatch.setattr(anthropic_provider.random, "uniform", lambda a, b: 0)
+
+        provider = _provider()
+        provider._client.messages.replies = [RuntimeError("parse"), "ok"]
+        assert provider.complete([LLMMessage.user("hi")]).content == "ok"
+        assert len(provider._client.messages.calls) == 2
+
+    def test_api_errors_left_to_sdk(self, monkeypatch):
+        """Test that API errors, rate limits included, are not retried again"""
+        from providers import anthropic_provider
+
+        class APIError(Exception):
+            status_code = 429
+
+        monkeypatch.setattr(anthropic_provider, "_anthropic", SimpleNamespace(APIError=APIError))
+        provider = _provider()
+        provider._client.messages.replies = [APIError("rate limited"), "ok"]
+        with pytest.raises(anthropic_provider.AnthropicAPIError) as excinfo:
+            provider.complete([LLMMessage.user("hi")])
+        assert excinfo.value.status_code == 429
+        assert len(provider._client.messages.calls) == 1
+
+
+class TestBatchScheduler:
+    """Test cases for BatchScheduler"""
+
+    def test_flush_waits_for_in_flight_batches(self):
+        """Test that flush() dispatches pending requests and awaits them"""
+        sent = []
+
+        async def send(params):
+            await asyncio.sleep(0.01)
+            sent.append(params["n"])
+            return params["n"]
+
+        async def run():
+            scheduler = BatchScheduler(send, max_wait_ms=10_000)
+            waiters = [asyncio.ensure_future(scheduler.submit({"n": n})) for n in range(3)]
+            await asyncio.sleep(0)
+            assert len(scheduler._tasks) == 0
+            await scheduler.flush()
+            assert sorted(sent) == [0, 1, 2] and not scheduler._tasks
+            return await asyncio.gather(*waiters)
+
+        assert asyncio.run(run()) == [0, 1, 2]
+
+    def test_full_batch_dispatches_and_errors_reach_their_caller(self):
+        """Test immediate dispatch at max_batch and per-request errors"""
+        batches = []
+
+        async def send(params):
+            batches.append(params["n"])
+            if params["n"] == 1:
+                raise ValueError("bad request")
+            return params["n"]
+
+        async def run():
+            scheduler = BatchScheduler(send, max_wait_ms=10_000, max_batch=3)
+            return await asyncio.gather(
+                *(scheduler.submit({"n": n}) for n in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        assert results[0] == 0 and results[2] == 2
+        assert isinstance(results[1], ValueError)
+        assert sorted(batches) == [0, 1, 2]
+
+    def test_acomplete_through_scheduler(self):
+        """Test that batching routes concurrent acomplete() calls through one scheduler"""
+        provider = _provider()
+        provider.batching_enabled = True
+
+        async def run():
+            stub = _use_async_stub(provider)
+            responses = await asyncio.gather(
+                *(provider.acomplete([LLMMessage.user(f"q{n}")]) for n in range(3))
+            )
+            return sorted(r.content for r in responses), len(stub.calls), provider._batch_scheduler
+
+        contents, calls, scheduler = asyncio.run(run())
+        assert contents == ["reply 1", "reply 2", "reply 3"]
+        assert calls == 3 and scheduler is not None
+
+
+class TestGetProvider:
+    """Test cases for get_provider"""
+
+    def test_returns_independent_instances(self):
+        """Test that one caller's cache settings don't leak into another's"""
+        config = {"api_key": "test-key"}
+        first = get_provider("anthropic", config)
+        second = get_provider("anthropic", config)
+        assert first is not second
+
+        first.response_cache = MemoryCache()
+        assert second.response_cache is None
+
+
+class TestMessageConverter:
+    """Test cases for incremental message conversion"""
+
+    def test_extending_conversation_reuses_payloads(self):
+        """Test that only new messages are converted when the list grows"""
+        converter = MessageConverter()
+        messages = [LLMMessage.system("be brief"), LLMMessage.user("hi")]
+        system, first = converter.convert(messages)
+        assert (system, first) == ("be brief", [{"role": "user", "content": "hi"}])
+
+        messages += [LLMMessage.assistant("hello"), LLMMessage.tool_result("t1", "42")]
+        _, second = converter.convert(messages)
+        assert second[0] is first[0]
+        assert second[2] == {
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "42"}],
+        }
+
+        _, other = converter.convert([LLMMessage.user("new conversation")])
+        assert other == [{"role": "user", "content": "new conversation"}]
+
+    def test_mutated_message_is_converted_again(self):
+        """Test that editing a message between calls does not resend the old payload"""
+        converter = MessageConverter()
+        system = LLMMessage.system("be brief")
+        tool = LLMMessage.tool_result("t1", "42")
+        messages = [system, LLMMessage.user("hi"), LLMMessage.assistant("calling"), tool]
+        converter.convert(messages)
+
+        messages[1].content = "hello"
+        tool.tool_call_id = "t2"
+        system.content = "be verbose"
+        prompt, converted = converter.convert(messages)
+        assert prompt == "be verbose"
+        assert converted[0] == {"role": "user", "content": "hello"}
+        assert converted[2]["content"][0]["tool_use_id"] == "t2"
+
+        # A message edited after conversion is also rebuilt on its own
+        tool.content = "43"
+        assert MessageConverter.convert_message(tool)["content"][0]["content"] == "43"
+
+    def test_converter_per_thread(self):
+        """Test that each thread converts with its own converter"""
+        provider = _provider()
+        converters = []
+
+        def convert():
+            provider._convert_messages([LLMMessage.user("hi")])
+            converters.append(provider._local.converter)
+
+        convert()
+        thread = threading.Thread(target=convert)
+        thread.start()
+        thread.join()
+        assert len(converters) == 2 and converters[0] is not converters[1]
+
+    def test_chat_reuses_conversion_across_rounds(self):
+        """Test that tool rounds in chat() only convert the new messages"""
+        provider = _provider()
+        provider._client.messages.replies = [_tool_response(("t1", "lookup", {"q": 1})), "done"]
+        tools = [ToolDefinition("lookup", "Look something up", {"type": "object"})]
+
+        response = provider.chat(
+            "question", tools=tools,
+            tool_executor=lambda call: ToolResult(call.id, {"answer": call.arguments["q"]})
+        )
+        assert response.content == "done"
+        first, second = provider._client.messages.calls
+        assert second["messages"][0] is first["messages"][0]
+        assert second["tools"] is first["tools"]
+        assert second["messages"][2]["content"][0]["content"] == '{"answer":1}'
+
+
+class TestStreamBatching:
+    """Test cases for coalescing streamed text"""
+
+    def test_batch_chunks_by_size(self):
+        """Test size-bounded batches and the trailing partial batch"""
+        chunks = iter(["a", "b", "c", "d", "e"])
+        assert list(_batch_chunks(chunks, 60, 2)) == ["ab", "cd", "e"]
+        assert list(_batch_chunks(iter(["a", "b"]), 0, 0)) == ["a", "b"]
+
+    def test_abatch_chunks_flushes_on_interval(self):
+        """Test that a pause in the stream flushes buffered text"""
+        async def chunks():
+            yield "a"
+            yield "b"
+            await asyncio.sleep(0.1)
+            yield "c"
+
+        async def run():
+            return [chunk async for chunk in _abatch_chunks(chunks(), 0.02, 100)]
+
+        assert asyncio.run(run()) == ["ab", "c"]
+
+    def test_abatch_chunks_propagates_errors(self):
+        """Test that an error in the underlying stream reaches the consumer"""
+        async def chunks():
+            yield "a"
+            raise ConnectionError("dropped")
+
+        async def run():
+            return [chunk async for chunk in _abatch_chunks(chunks(), 10, 100)]
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(run())
+
+
+class TestAsyncChat:
+    """Test cases for achat()"""
+
+    def test_achat_runs_async_tools_in_call_order(self):
+        """Test that coroutine tool executors run concurrently, results in order"""
+        provider = _provider()
+        started = []
+
+        async def executor(call):
+            started.append(call.id)
+            # The second call finishes first
+            await asyncio.sleep(0.02 if call.id == "t1" else 0)
+            return ToolResult(call.id, call.id.upper())
+
+        async def run():
+            stub = _use_async_stub(provider, AsyncStubMessages([
+                _tool_response(("t1", "a", {}), ("t2", "b", {})), "done"
+            ]))
+            response = await provider.achat("go", tool_executor=executor)
+            return response, stub.calls
+
+        response, calls = asyncio.run(run())
+        assert response.content == "done"
+        assert started == ["t1", "t2"]
+        results = [message["content"][0]["content"] for message in calls[1]["messages"][2:]]
+        assert results == ["T1", "T2"]
+
+    def test_achat_runs_sync_tools_off_the_loop(self):
+        """Test that plain tool executors run in worker threads"""
+        provider = _provider()
+
+        def executor(call):
+            return ToolResult(call.id, threading.current_thread() is threading.main_thread())
+
+        async def run(calls, parallel_tools):
+            stub = _use_async_stub(provider, AsyncStubMessages([_tool_response(*calls), "done"]))
+            await provider.achat("go", tool_executor=executor, parallel_tools=parallel_tools)
+            return [m["content"][0]["content"] for m in stub.calls[1]["messages"][2:]]
+
+        two = (("t1", "a", {}), ("t2", "b", {}))
+        assert asyncio.run(run(two, True)) == ["false", "false"]
+        assert asyncio.run(run(two, False)) == ["false", "false"]
+        assert asyncio.run(run(two[:1], True)) == ["false"]
@@ -0,0 +1,116 @@
+"""
+Unit tests for the tool base classes
+"""
+import dataclasses
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from tools.implementations import base
+from tools.implementations.base import BaseTool, ToolParameter, ToolRegistry, ToolResult, ToolStatus
+
+
+class FailingTool(BaseTool):
+    """Tool whose execution always raises"""
+
+    name = "failing"
+    description = "Always fails"
+    parameters = []
+
+    def execute(self, **kwargs):
+        raise RuntimeError("boom")
+
+
+class TestToolResult:
+    """Test cases for ToolResult"""
+
+    def test_explicit_timestamp(self):
+        """Test that a timestamp passed to the constructor is kept"""
+        result = ToolResult(status=ToolStatus.SUCCESS, timestamp="2024-01-01T00:00:00")
+        assert result.timestamp == "2024-01-01T00:00:00"
+        assert result.to_dict()["timestamp"] == "2024-01-01T00:00:00"
+
+    def test_default_timestamp(self):
+        """Test that the default timestamp is formatted from timestamp_ns"""
+        result = ToolResult(status=ToolStatus.SUCCESS, timestamp_ns=1_700_000_000_123_456_789)
+        assert result.timestamp is None
+        assert result.get_timestamp() == "2023-11-14T22:13:20.123456"
+        assert result.timestamp == "2023-11-14T22:13:20.123456"
+
+    def test_timestamp_is_a_dataclass_field(self):
+        """Test that fields(), asdict(), repr() and replace() see the timestamp"""
+        result = ToolResult(status=ToolStatus.SUCCESS, timestamp="2024-01-01T00:00:00")
+        assert "timestamp" in {f.name for f in dataclasses.fields(result)}
+        assert dataclasses.asdict(result)["timestamp"] == "2024-01-01T00:00:00"
+        assert "timestamp='2024-01-01T00:00:00'" in repr(result)
+        assert dataclasses.replace(result, data=1).timestamp == "2024-01-01T00:00:00"
+
+    def test_to_bytes_same_without_orjson(self, monkeypatch):
+        """Test that the stdlib fallback writes the same schema as orjson"""
+        result = ToolResult.success({"path": Path("a.txt"), "n": 1}, metadata={"k": [1, 2]})
+
+        with_orjson = json.loads(result.to_bytes())
+        monkeypatch.setattr(base, "orjson", None)
+        assert json.loads(result.to_bytes()) == with_orjson
+        assert with_orjson["timestamp"] == result.timestamp
+        assert with_orjson["data"] == {"path": "a.txt", "n": 1}
+
+
+class PathTool(BaseTool):
+    """Tool with a parameter default that is not JSON-native"""
+
+    name = "paths"
+    description = "Takes a path"
+    parameters = [ToolParameter("root", "string", "Root directory", required=False, default=Path("."))]
+
+    def execute(self, **kwargs):
+        return ToolResult.success(None)
+
+
+class TestToolRegistry:
+    """Test cases for ToolRegistry"""
+
+    def test_register_non_json_default(self):
+        """Test that non-JSON parameter defaults are serialized as strings"""
+        registry = ToolRegistry()
+        registry.register(PathTool())
+        assert registry.list_tools() == ["paths"]
+        schemas = json.loads(registry.get_all_schemas_bytes())
+        assert schemas[0]["parameters"]["properties"]["root"]["default"] == "."
+
+    def test_failed_registration_leaves_registry_untouched(self, monkeypatch):
+        """Test that a schema error doesn't leave a half-registered tool"""
+        registry = ToolRegistry()
+        monkeypatch.setattr(PathTool, "get_schema", lambda self: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            registry.register(PathTool())
+        assert registry.list_tools() == [] and registry.get_all_schemas_bytes() == b"[]"
+
+
+class TestToolLogging:
+    """Test cases for tool logging"""
+
+    def test_failures_logged_synchronously_by_default(self, caplog):
+        """Test that tool failures reach handlers up the hierarchy"""
+        assert FailingTool().run().error == "boom"
+        assert [r.getMessage() for r in caplog.records] == ["Tool failing execution failed"]
+
+    def test_enable_queued_logging(self):
+        """Test that opting in moves the target's handlers onto a listener"""
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        target = logging.getLogger("test-queued")
+        target.addHandler(handler)
+
+        listener = base.enable_queued_logging(target)
+        try:
+            assert base.enable_queued_logging(target) is listener
+            assert handler not in target.handlers
+            target.warning("queued")
+        finally:
+            base._stop_queued_logging()
+            target.handlers.clear()
+        assert [r.getMessage() for r in records] == ["queued"]
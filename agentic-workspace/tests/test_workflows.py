@@ -0,0 +1,237 @@
+"""
+Unit tests for workflow_engine utility
+"""
+import asyncio
+import pytest
+import threading
+
+from utils.workflow_engine import (
+    DependencyResolver,
+    StepStatus,
+    WorkflowEngine,
+    WorkflowStatus,
+    get_shared_pool,
+)
+
+
+def _step(name, depends_on=None, **extra):
+    step = {"name": name, "agent": "test-agent", "action": "run"}
+    if depends_on:
+        step["depends_on"] = depends_on
+    step.update(extra)
+    return step
+
+
+class TestDependencyResolver:
+    """Test cases for DependencyResolver"""
+
+    def test_topological_sort_levels(self):
+        """Test that steps are grouped into dependency levels"""
+        graph = {"a": set(), "b": {"a"}, "c": {"a"}, "d": {"b", "c"}}
+        levels = DependencyResolver.topological_sort(graph)
+        assert levels == [["a"], ["b", "c"], ["d"]]
+
+    def test_topological_sort_fan_out_first(self):
+        """Test that steps unblocking more work are ordered first in a level"""
+        graph = {
+            "lint": set(),
+            "find-files": set(),
+            "analyze": {"find-files"},
+            "test": {"find-files"},
+            "report": {"analyze", "test"},
+        }
+        levels = DependencyResolver.topological_sort(graph)
+        assert levels[0] == ["find-files", "lint"]
+
+    def test_topological_sort_keeps_declaration_order_on_ties(self):
+        """Test that equal-weight steps keep their declared order"""
+        graph = {"c": set(), "a": set(), "b": set()}
+        assert DependencyResolver.topological_sort(graph) == [["c", "a", "b"]]
+
+    def test_topological_sort_cycle(self):
+        """Test circular dependency detection"""
+        with pytest.raises(ValueError, match="Circular dependency"):
+            DependencyResolver.topological_sort({"a": {"b"}, "b": {"a"}})
+
+    def test_topological_sort_unknown_dependency(self):
+        """Test unknown dependency detection"""
+        with pytest.raises(ValueError, match="Unknown dependency"):
+            DependencyResolver.topological_sort({"a": {"missing"}})
+
+
+class TestWorkflowEngine:
+    """Test cases for WorkflowEngine"""
+
+    def test_execute_parallel_workflow(self):
+        """Test executing a workflow with a parallel fan-out"""
+        workflow = {
+            "name": "fan-out",
+            "steps": [
+                _step("a"),
+                _step("b", ["a"]),
+                _step("c", ["a"]),
+                _step("d", ["b", "c"]),
+            ],
+        }
+        result = WorkflowEngine().execute(workflow)
+        assert result.status == WorkflowStatus.COMPLETED
+        assert all(r.status == StepStatus.COMPLETED for r in result.steps.values())
+
+    def test_execute_resolves_step_outputs(self):
+        """Test that step outputs are passed to dependent steps"""
+        seen = {}
+
+        def executor(agent, action, params):
+            seen[action] = params
+            return {"value": 42}
+
+        workflow = {
+            "name": "refs",
+            "steps": [
+                _step("a", action="first"),
+                _step("b", ["a"], action="second",
+                      params={"n": "${steps.a.output.value}", "s": "n=${steps.a.output.value}"}),
+            ],
+        }
+        result = WorkflowEngine(agent_executor=executor).execute(workflow)
+        assert result.status == WorkflowStatus.COMPLETED
+        assert seen["second"] == {"n": 42, "s": "n=42"}
+
+    def test_validate_workflow_valid(self):
+        """Test that a well-formed workflow has no validation errors"""
+        workflow = {
+            "name": "valid",
+            "steps": [
+                _step("a"),
+                _step("b", ["a"], params={"files": "${steps.a.output}"}),
+            ],
+        }
+        assert WorkflowEngine().validate_workflow(workflow) == []
+
+    def test_validate_workflow_errors(self):
+        """Test that structural problems are reported"""
+        workflow = {
+            "name": "invalid",
+            "steps": [
+                _step("a", ["missing"]),
+                _step("a"),
+                {"name": "c", "agent": "x"},
+                _step("d", params={"x": ["${steps.nowhere.output}"]}),
+            ],
+        }
+        errors = WorkflowEngine().validate_workflow(workflow)
+        assert "Duplicate step name: a" in errors
+        assert "Step 'c' is missing 'action'" in errors
+        assert "Step 'a' depends on unknown step 'missing'" in errors
+        assert "Step 'd' references unknown step 'nowhere'" in errors
+
+    def test_validate_workflow_cycle(self):
+        """Test that dependency cycles are reported"""
+        workflow = {"name": "cycle", "steps": [_step("a", ["b"]), _step("b", ["a"])]}
+        errors = WorkflowEngine().validate_workflow(workflow)
+        assert len(errors) == 1 and "Circular dependency" in errors[0]
+
+    def test_parallel_runs_share_pool(self):
+        """Test that parallel steps run on the shared pool for max_workers"""
+        threads = set()
+
+        def executor(agent, action, params):
+            threads.add(threading.current_thread().name)
+            return None
+
+        workflow = {"name": "pool", "steps": [_step("a"), _step("b")]}
+        engine = WorkflowEngine(agent_executor=executor, max_workers=3)
+        engine.execute(workflow)
+        engine.execute(workflow)
+        assert get_shared_pool(3) is get_shared_pool(3)
+        assert threads and all(name.startswith("workflow-3") for name in threads)
+
+    def test_nested_parallel_run(self):
+        """Test that a workflow step can itself run a parallel workflow"""
+        inner = {"name": "inner", "steps": [_step("x"), _step("y")]}
+
+        def executor(agent, action, params):
+            return WorkflowEngine(max_workers=2).execute(inner).status.value
+
+        outer = {"name": "outer", "steps": [_step("a"), _step("b")]}
+        result = WorkflowEngine(agent_executor=executor, max_workers=2).execute(outer)
+        assert result.status == WorkflowStatus.COMPLETED
+        assert {r.output for r in result.steps.values()} == {"completed"}
+
+    def test_parallel_step_starts_when_own_dependencies_finish(self):
+        """Test that a step does not wait for unrelated steps of an earlier level"""
+        finished = []
+        slow_done = threading.Event()
+
+        def executor(agent, action, params):
+            if action == "slow":
+                slow_done.wait(timeout=5)
+            elif action == "after-fast":
+                slow_done.set()
+            finished.append(action)
+            return action
+
+        workflow = {
+            "name": "no-barrier",
+            "steps": [
+                _step("slow", action="slow"),
+                _step("fast", action="fast"),
+                _step("after-fast", ["fast"], action="after-fast"),
+            ],
+        }
+        result = WorkflowEngine(agent_executor=executor).execute(workflow)
+        assert result.status == WorkflowStatus.COMPLETED
+        assert finished.index("after-fast") < finished.index("slow")
+
+    def test_parallel_fail_fast_stops_dependents(self):
+        """Test that fail-fast skips steps depending on a failed step"""
+        def executor(agent, action, params):
+            if action == "boom":
+                raise RuntimeError("boom")
+            return action
+
+        workflow = {
+            "name": "fail-fast",
+            "steps": [
+                _step("a", action="boom"),
+                _step("b"),
+                _step("c", ["a"]),
+            ],
+        }
+        result = WorkflowEngine(agent_executor=executor).execute(workflow)
+        assert result.status == WorkflowStatus.FAILED
+        assert result.steps["a"].status == StepStatus.FAILED
+        assert "c" not in result.steps
+
+    def test_async_executor_overlaps_steps(self):
+        """Test that coroutine executors run independent steps concurrently"""
+        started = []
+
+        async def executor(agent, action, params):
+            started.append(action)
+            await asyncio.sleep(0)
+            # Both level-0 steps have started before either finishes
+            return len(started)
+
+        workflow = {
+            "name": "async",
+            "steps": [
+                _step("a", action="a"),
+                _step("b", action="b"),
+                _step("c", ["a", "b"], action="c", params={"n": "${steps.a.output}"}),
+            ],
+        }
+        result = WorkflowEngine(agent_executor=executor).execute(workflow)
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.steps["a"].output == 2
+        assert result.steps["b"].output == 2
+
+    def test_aexecute_runs_sync_executor(self):
+        """Test that aexecute runs plain executors in worker threads"""
+        def executor(agent, action, params):
+            return threading.current_thread() is threading.main_thread()
+
+        workflow = {"name": "to-thread", "steps": [_step("a"), _step("b", ["a"])]}
+        result = asyncio.run(WorkflowEngine(agent_executor=executor).aexecute(workflow))
+        assert result.status == WorkflowStatus.COMPLETED
+        assert [r.output for r in result.steps.values()] == [False, False]
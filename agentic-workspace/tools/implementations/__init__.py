@@ -1,10 +1,92 @@
 """
 Tool implementations for the agentic workspace.
+
+Only the core tool types are imported eagerly. Tool classes are loaded on
+first attribute access, and the built-in tools are registered with the
+global registry the first time the registry is requested.
 """
-from .code_analyzer import CodeAnalyzerTool, ToolResult, ToolStatus
+import importlib
+
+from .base import (
+    BaseTool,
+    ToolParameter,
+    ToolRegistry,
+    enable_queued_logging,
+    register_tool,
+)
+from .base import ToolResult as BaseToolResult
+from .base import ToolStatus as BaseToolStatus
+from .base import get_registry as _get_base_registry
+
+# Tool class name -> defining module, imported on first access
+_LAZY_TOOLS = {
+    # ToolResult and ToolStatus have always been CodeAnalyzerTool's result
+    # types; the registry tools' ones are BaseToolResult and BaseToolStatus
+    "ToolResult": ".code_analyzer",
+    "ToolStatus": ".code_analyzer",
+    "CodeAnalyzerTool": ".code_analyzer",
+    "BashTool": ".bash_tools",
+    "TestRunnerTool": ".bash_tools",
+    "ReadFileTool": ".file_tools",
+    "WriteFileTool": ".file_tools",
+    "EditFileTool": ".file_tools",
+    "GlobTool": ".file_tools",
+    "GrepTool": ".file_tools",
+    "FileReadTool": ".file_operations",
+    "FileWriteTool": ".file_operations",
+    "FileSearchTool": ".file_operations",
+    "FileEditTool": ".file_operations",
+}
+
+# Modules that register their tools with the global registry on import
+_REGISTERING_MODULES = (".bash_tools", ".file_tools")
+_registered = False
+
+
+def _ensure_registered() -> None:
+    """Import the built-in tool modules so their tools are registered."""
+    global _registered
+    if not _registered:
+        for module in _REGISTERING_MODULES:
+            importlib.import_module(module, __name__)
+        _registered = True
+
+
+def get_registry() -> ToolRegistry:
+    """Get the global tool registry with the built-in tools registered."""
+    _ensure_registered()
+    return _get_base_registry()
+
+
+def list_available_tools() -> list:
+    """List the names of all registered tools."""
+    return get_registry().list_tools()
+
+
+def get_tool(name: str):
+    """Get a registered tool instance by name."""
+    return get_registry().get(name)
+
+
+def __getattr__(name: str):
+    module = _LAZY_TOOLS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
-    "CodeAnalyzerTool",
-    "ToolResult", 
-    "ToolStatus",
+    "BaseTool",
+    "BaseToolResult",
+    "BaseToolStatus",
+    "ToolParameter",
+    "ToolRegistry",
+    "enable_queued_logging",
+    "get_registry",
+    "get_tool",
+    "list_available_tools",
+    "register_tool",
+    *_LAZY_TOOLS,
 ]
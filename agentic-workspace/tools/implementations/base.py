@@ -4,16 +4,75 @@ Provides abstract base classes and utilities for tool implementations.
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, TypeVar, Generic
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Generic
 from enum import Enum
+import atexit
 import json
 import logging
-from datetime import datetime
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+_log_listener: Optional[QueueListener] = None
+_log_listener_lock = threading.Lock()
+
+
+def enable_queued_logging(target: Optional[logging.Logger] = None) -> QueueListener:
+    """
+    Move a logger's handlers onto a background QueueListener.
+    
+    Afterwards, logging calls (including those made during tool execution)
+    only enqueue the record; formatting and handler I/O happen on the
+    listener thread. Opt-in: call it once during application setup, after
+    configuring handlers. Handlers added to ``target`` later stay
+    synchronous. Repeated calls return the running listener.
+    
+    Args:
+        target: Logger whose handlers are moved; defaults to the root logger
+    
+    Returns:
+        The running listener, which is stopped at interpreter exit
+    """
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is None:
+            target = target or logging.getLogger()
+            handlers = list(target.handlers)
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            for handler in handlers:
+                target.removeHandler(handler)
+            target.addHandler(QueueHandler(log_queue))
+            _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            _log_listener.start()
+            atexit.register(_stop_queued_logging)
+        return _log_listener
+
+
+def _stop_queued_logging() -> None:
+    """Stop the listener started by enable_queued_logging(), flushing its queue."""
+    global _log_listener
+    with _log_listener_lock:
+        listener, _log_listener = _log_listener, None
+    if listener is not None:
+        listener.stop()
+
+
+# Exceptions that tools raise in normal operation; logged without a traceback
+EXPECTED_TOOL_ERRORS = (FileNotFoundError, PermissionError, ValueError)
+
+
 class ToolStatus(Enum):
     """Execution status for tool operations."""
     SUCCESS = "success"
@@ -23,7 +82,11 @@ class ToolStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Plain-dict view of the status values; cheaper than Enum.value in to_dict()
+_STATUS_STR = {status: status.value for status in ToolStatus}
+
+
+@dataclass(slots=True)
 class ToolResult:
     """
     Standardized result container for tool executions.
@@ -37,22 +100,42 @@ class ToolResult:
     error_type: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     execution_time_ms: float = 0.0
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    # ISO 8601 creation time; when omitted it is formatted from timestamp_ns
+    # by get_timestamp() the first time it is needed
+    timestamp: Optional[str] = None
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    def get_timestamp(self) -> str:
+        """UTC creation time as an ISO 8601 string, formatted on first call."""
+        if self.timestamp is None:
+            seconds, ns = divmod(self.timestamp_ns, 1_000_000_000)
+            moment = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=ns // 1000)
+            self.timestamp = moment.replace(tzinfo=None).isoformat()
+        return self.timestamp
     
     def is_success(self) -> bool:
         return self.status == ToolStatus.SUCCESS
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "status": self.status.value,
+            "status": _STATUS_STR[self.status],
             "data": self.data,
             "error": self.error,
             "error_type": self.error_type,
             "metadata": self.metadata,
             "execution_time_ms": self.execution_time_ms,
-            "timestamp": self.timestamp
+            "timestamp": self.get_timestamp()
         }
     
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the to_dict() form to JSON bytes, using orjson when it is
+        installed; both paths produce the same keys and value types.
+        """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), default=str, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.to_dict(), default=str).encode("utf-8")
+    
     @classmethod
     def success(cls, data: Any, metadata: Optional[Dict] = None, execution_time_ms: float = 0.0) -> "ToolResult":
         return cls(
@@ -72,7 +155,24 @@ class ToolResult:
         )
 
 
-@dataclass
+def _accept_any(value: Any) -> bool:
+    return True
+
+
+_NUMBER_TYPES = (int, float)
+
+# param_type -> type check; exact type checks keep bool out of the numeric types
+_TYPE_VALIDATORS = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: type(v) is int,
+    "number": lambda v: type(v) in _NUMBER_TYPES,
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+}
+
+
+@dataclass(slots=True)
 class ToolParameter:
     """Definition of a single tool parameter."""
     name: str
@@ -81,27 +181,27 @@ class ToolParameter:
     required: bool = True
     default: Any = None
     enum_values: Optional[List[str]] = None
+    _validator: Callable[[Any], bool] = field(init=False, repr=False, compare=False)
+    _enum_set: Optional[frozenset] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._validator = _TYPE_VALIDATORS.get(self.param_type, _accept_any)
+        self._enum_set = frozenset(self.enum_values) if self.enum_values else None
     
     def validate(self, value: Any) -> bool:
         """Validate a value against this parameter definition."""
         if value is None:
             return not self.required
         
-        type_validators = {
-            "string": lambda v: isinstance(v, str),
-            "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
-            "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-            "boolean": lambda v: isinstance(v, bool),
-            "array": lambda v: isinstance(v, list),
-            "object": lambda v: isinstance(v, dict),
-        }
-        
-        validator = type_validators.get(self.param_type, lambda v: True)
-        if not validator(value):
+        if not self._validator(value):
             return False
         
-        if self.enum_values and value not in self.enum_values:
-            return False
+        if self._enum_set is not None:
+            try:
+                return value in self._enum_set
+            except TypeError:
+                # Unhashable values can't be enum members
+                return False
         
         return True
 
@@ -148,6 +248,12 @@ class BaseTool(ABC):
         """
         pass
     
+    @cached_property
+    def _param_index(self) -> Tuple[List[ToolParameter], Dict[str, ToolParameter]]:
+        """Parameter definitions and a name index, built on first use."""
+        params = list(self.parameters)
+        return params, {p.name: p for p in params}
+    
     def validate_parameters(self, params: Dict[str, Any]) -> Optional[str]:
         """
         Validate input parameters against definitions.
@@ -155,22 +261,14 @@ class BaseTool(ABC):
         Returns:
             Error message if validation fails, None if valid
         """
-        param_map = {p.name: p for p in self.parameters}
-        
-        # Check for missing required parameters
-        for param in self.parameters:
-            if param.required and param.name not in params:
+        # Extra parameters are allowed, so only defined ones are checked
+        for param in self._param_index[0]:
+            if param.name in params:
+                if not param.validate(params[param.name]):
+                    return f"Invalid value for parameter '{param.name}': expected {param.param_type}"
+            elif param.required:
                 return f"Missing required parameter: {param.name}"
         
-        # Validate provided parameters
-        for name, value in params.items():
-            if name not in param_map:
-                continue  # Allow extra parameters
-            
-            param = param_map[name]
-            if not param.validate(value):
-                return f"Invalid value for parameter '{name}': expected {param.param_type}"
-        
         return None
     
     def run(self, **kwargs) -> ToolResult:
@@ -179,7 +277,6 @@ class BaseTool(ABC):
         
         This is the main entry point for tool execution.
         """
-        import time
         start_time = time.time()
         
         validation_error = self.validate_parameters(kwargs)
@@ -191,7 +288,11 @@ class BaseTool(ABC):
             result.execution_time_ms = (time.time() - start_time) * 1000
             return result
         except Exception as e:
-            logger.exception(f"Tool {self.name} execution failed")
+            if isinstance(e, EXPECTED_TOOL_ERRORS):
+                # Routine failures (missing files, bad input) need no traceback
+                logger.debug("Tool %s failed: %s", self.name, e)
+            else:
+                logger.exception("Tool %s execution failed", self.name)
             return ToolResult.failure(str(e), type(e).__name__)
     
     def get_schema(self) -> Dict[str, Any]:
@@ -199,7 +300,7 @@ class BaseTool(ABC):
         properties = {}
         required = []
         
-        for param in self.parameters:
+        for param in self._param_index[0]:
             prop = {
                 "type": param.param_type,
                 "description": param.description
@@ -233,13 +334,25 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
+        # Tool schemas are static, so they are built once at registration
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._schema_bytes: Dict[str, bytes] = {}
     
     def register(self, tool: BaseTool) -> None:
         """Register a tool instance."""
+        # Build everything first so a failing schema leaves the registry untouched;
+        # non-JSON defaults (such as a Path) are written as strings
+        schema = tool.get_schema()
+        schema_bytes = (
+            orjson.dumps(schema, default=str) if orjson is not None
+            else json.dumps(schema, default=str).encode("utf-8")
+        )
         if tool.name in self._tools:
-            logger.warning(f"Overwriting existing tool: {tool.name}")
+            logger.warning("Overwriting existing tool: %s", tool.name)
         self._tools[tool.name] = tool
-        logger.info(f"Registered tool: {tool.name}")
+        self._schemas[tool.name] = schema
+        self._schema_bytes[tool.name] = schema_bytes
+        logger.info("Registered tool: %s", tool.name)
     
     def get(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name."""
@@ -250,8 +363,12 @@ class ToolRegistry:
         return list(self._tools.keys())
     
     def get_all_schemas(self) -> List[Dict[str, Any]]:
-        """Get schemas for all registered tools."""
-        return [tool.get_schema() for tool in self._tools.values()]
+        """Get schemas for all registered tools (shared; do not modify)."""
+        return list(self._schemas.values())
+    
+    def get_all_schemas_bytes(self) -> bytes:
+        """Get schemas for all registered tools as a JSON array."""
+        return b"[" + b",".join(self._schema_bytes.values()) + b"]"
     
     def execute(self, tool_name: str, **kwargs) -> ToolResult:
         """Execute a tool by name."""
@@ -9,8 +9,16 @@ from enum import Enum
 import json
 import time
 import functools
+import inspect
+import threading
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ToolStatus(Enum):
     """Execution status for tool operations."""
@@ -21,7 +29,11 @@ class ToolStatus(Enum):
     PERMISSION_DENIED = "permission_denied"
 
 
-@dataclass
+# Plain-dict view of the status values; cheaper than Enum.value in to_dict()
+_STATUS_STR = {status: status.value for status in ToolStatus}
+
+
+@dataclass(slots=True)
 class ToolResult:
     """Result container for tool execution."""
     status: ToolStatus
@@ -33,20 +45,38 @@ class ToolResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary."""
         return {
-            "status": self.status.value,
+            "status": _STATUS_STR[self.status],
             "data": self.data,
             "error": self.error,
             "execution_time_ms": self.execution_time_ms,
             "metadata": self.metadata
         }
 
+    def to_bytes(self) -> bytes:
+        """Serialize to JSON bytes, using orjson when it is installed."""
+        if orjson is not None:
+            # orjson serializes the dataclass and its enum natively
+            return orjson.dumps(self, default=str, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.to_dict(), default=str).encode("utf-8")
+
     @property
     def is_success(self) -> bool:
         """Check if execution was successful."""
         return self.status == ToolStatus.SUCCESS
 
 
-@dataclass
+# param_type -> accepted Python type(s)
+_TYPE_MAP = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict
+}
+
+
+@dataclass(slots=True)
 class ToolParameter:
     """Definition of a tool parameter."""
     name: str
@@ -55,27 +85,27 @@ class ToolParameter:
     required: bool = True
     default: Any = None
     enum_values: Optional[list] = None
+    _expected_type: Any = field(init=False, repr=False, compare=False)
+    _enum_set: Optional[frozenset] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._expected_type = _TYPE_MAP.get(self.param_type)
+        self._enum_set = frozenset(self.enum_values) if self.enum_values else None
 
     def validate(self, value: Any) -> bool:
         """Validate a value against this parameter definition."""
         if value is None:
             return not self.required
 
-        type_map = {
-            "string": str,
-            "integer": int,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict
-        }
-
-        expected_type = type_map.get(self.param_type)
-        if expected_type and not isinstance(value, expected_type):
+        if self._expected_type and not isinstance(value, self._expected_type):
             return False
 
-        if self.enum_values and value not in self.enum_values:
-            return False
+        if self._enum_set is not None:
+            try:
+                return value in self._enum_set
+            except TypeError:
+                # Unhashable values can't be enum members
+                return False
 
         return True
 
@@ -116,6 +146,32 @@ class BaseTool(ABC):
         """Return the list of parameters this tool accepts."""
         pass
 
+    @classmethod
+    def parameter_list(cls) -> tuple[ToolParameter, ...]:
+        """Return get_parameters(), computed once per tool class."""
+        params = cls.__dict__.get("_parameter_cache")
+        if params is None:
+            params = tuple(cls.get_parameters())
+            cls._parameter_cache = params
+        return params
+
+    @classmethod
+    def _parameter_index(cls) -> tuple[Dict[str, ToolParameter], frozenset]:
+        """
+        Return (parameters by name, names that must be supplied), computed
+        once per tool class. Required parameters with a default are not
+        counted as must-supply.
+        """
+        index = cls.__dict__.get("_parameter_index_cache")
+        if index is None:
+            params = cls.parameter_list()
+            index = (
+                {p.name: p for p in params},
+                frozenset(p.name for p in params if p.required and p.default is None),
+            )
+            cls._parameter_index_cache = index
+        return index
+
     @abstractmethod
     def execute(self, **kwargs) -> ToolResult:
         """
@@ -143,14 +199,22 @@ class BaseTool(ABC):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        for param_def in self.get_parameters():
-            value = params.get(param_def.name, param_def.default)
+        by_name, required = self._parameter_index()
 
-            if param_def.required and value is None:
-                return False, f"Missing required parameter: {param_def.name}"
+        missing = required - params.keys()
+        if missing:
+            # Report the first missing parameter in declaration order
+            name = next(n for n in by_name if n in missing)
+            return False, f"Missing required parameter: {name}"
 
+        for name, value in params.items():
+            param_def = by_name.get(name)
+            if param_def is None:
+                continue
+            if value is None and param_def.required:
+                return False, f"Missing required parameter: {name}"
             if not param_def.validate(value):
-                return False, f"Invalid value for parameter {param_def.name}: {value}"
+                return False, f"Invalid value for parameter {name}: {value}"
 
         return True, None
 
@@ -180,7 +244,7 @@ class BaseTool(ABC):
         properties = {}
         required = []
 
-        for param in self.get_parameters():
+        for param in self.parameter_list():
             prop = {
                 "type": param.param_type,
                 "description": param.description
@@ -206,11 +270,26 @@ class BaseTool(ABC):
         }
 
 
+def _config_key(config: Optional[Dict[str, Any]]) -> bytes:
+    """Serialize a tool config into a hashable cache key."""
+    if not config:
+        return b""
+    if orjson is not None:
+        return orjson.dumps(config, default=str,
+                            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+
+
 class ToolRegistry:
     """Registry for managing and accessing tools."""
 
     _instance = None
     _tools: Dict[str, Type[BaseTool]] = {}
+    # name -> default-config instance created at registration, used for schemas
+    _prototypes: Dict[str, BaseTool] = {}
+    # (name, serialized config) -> shared tool instance
+    _instances: Dict[tuple, BaseTool] = {}
+    _instances_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -230,6 +309,11 @@ class ToolRegistry:
         """
         instance = tool_class()
         cls._tools[instance.name] = tool_class
+        cls._prototypes[instance.name] = instance
+        with cls._instances_lock:
+            # Drop instances of a tool class this registration replaces
+            for key in [k for k in cls._instances if k[0] == instance.name]:
+                del cls._instances[key]
         return tool_class
 
     @classmethod
@@ -239,11 +323,24 @@ class ToolRegistry:
 
     @classmethod
     def get_instance(cls, name: str, config: Optional[Dict[str, Any]] = None) -> Optional[BaseTool]:
-        """Get an instance of a registered tool."""
+        """
+        Get an instance of a registered tool.
+        
+        Tools hold no state beyond their config, so one instance is shared
+        per (name, config) pair.
+        """
         tool_class = cls.get(name)
-        if tool_class:
-            return tool_class(config)
-        return None
+        if tool_class is None:
+            return None
+        
+        key = (name, _config_key(config))
+        tool = cls._instances.get(key)
+        if tool is None:
+            with cls._instances_lock:
+                tool = cls._instances.get(key)
+                if tool is None:
+                    tool = cls._instances[key] = tool_class(config)
+        return tool
 
     @classmethod
     def list_tools(cls) -> list[str]:
@@ -253,11 +350,18 @@ class ToolRegistry:
     @classmethod
     def get_all_schemas(cls) -> list[Dict[str, Any]]:
         """Get JSON schemas for all registered tools."""
-        schemas = []
-        for tool_class in cls._tools.values():
-            instance = tool_class()
-            schemas.append(instance.to_schema())
-        return schemas
+        return [tool.to_schema() for tool in cls._prototypes.values()]
+
+
+# Function annotation -> tool parameter type; anything else is a string
+_ANNOTATION_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object"
+}
 
 
 def tool(name: str = None, description: str = None):
@@ -273,36 +377,21 @@ def tool(name: str = None, description: str = None):
         tool_description = description or func.__doc__ or "No description"
 
         # Extract parameters from function signature
-        import inspect
-        sig = inspect.signature(func)
         params = []
 
-        for param_name, param in sig.parameters.items():
+        for param_name, param in inspect.signature(func).parameters.items():
             if param_name in ('self', 'cls'):
                 continue
 
-            param_type = "string"
-            if param.annotation != inspect.Parameter.empty:
-                type_map = {
-                    str: "string",
-                    int: "integer",
-                    float: "number",
-                    bool: "boolean",
-                    list: "array",
-                    dict: "object"
-                }
-                param_type = type_map.get(param.annotation, "string")
-
-            required = param.default == inspect.Parameter.empty
-            default = None if required else param.default
-
+            required = param.default is inspect.Parameter.empty
             params.append(ToolParameter(
                 name=param_name,
-                param_type=param_type,
+                param_type=_ANNOTATION_TYPES.get(param.annotation, "string"),
                 description=f"Parameter: {param_name}",
                 required=required,
-                default=default
+                default=None if required else param.default
             ))
+        params = tuple(params)
 
         class FunctionTool(BaseTool):
             @property
@@ -315,6 +404,11 @@ def tool(name: str = None, description: str = None):
 
             @classmethod
             def get_parameters(cls) -> list[ToolParameter]:
+                return list(params)
+
+            @classmethod
+            def parameter_list(cls) -> tuple[ToolParameter, ...]:
+                # Built once above when the function was decorated
                 return params
 
             def execute(self, **kwargs) -> ToolResult:
@@ -336,40 +430,53 @@ def with_timeout(seconds: float):
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            import threading
-            result = [ToolResult(status=ToolStatus.TIMEOUT, error=f"Execution timed out after {seconds}s")]
+            future = Future()
 
             def target():
-                result[0] = func(*args, **kwargs)
-
-            thread = threading.Thread(target=target)
-            thread.start()
-            thread.join(timeout=seconds)
-
-            if thread.is_alive():
+                future.set_running_or_notify_cancel()
+                try:
+                    future.set_result(func(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            # One daemon thread per call: a call that hangs past its timeout
+            # cannot be interrupted, but it holds no shared worker and does
+            # not keep the interpreter alive
+            threading.Thread(target=target, name="tool-timeout", daemon=True).start()
+            try:
+                return future.result(timeout=seconds)
+            except FuturesTimeoutError:
                 return ToolResult(
                     status=ToolStatus.TIMEOUT,
                     error=f"Execution timed out after {seconds}s"
                 )
-            return result[0]
 
         return wrapper
     return decorator
 
 
-def with_retry(max_attempts: int = 3, backoff_factor: float = 2.0):
-    """Decorator to add retry logic to tool execution."""
+def with_retry(max_attempts: int = 3,
+               backoff_factor: float = 2.0,
+               retriable_statuses: frozenset = frozenset({ToolStatus.ERROR, ToolStatus.TIMEOUT})):
+    """
+    Decorator to add retry logic to tool execution.
+    
+    Results whose status is not in ``retriable_statuses`` (for example
+    invalid input) are returned immediately without retrying.
+    """
     def decorator(func: Callable) -> Callable:
+        delays = tuple(backoff_factor ** i for i in range(max_attempts - 1))
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_error = None
             for attempt in range(max_attempts):
                 result = func(*args, **kwargs)
-                if result.is_success:
+                if result.is_success or result.status not in retriable_statuses:
                     return result
                 last_error = result.error
                 if attempt < max_attempts - 1:
-                    time.sleep(backoff_factor ** attempt)
+                    time.sleep(delays[attempt])
 
             return ToolResult(
                 status=ToolStatus.ERROR,
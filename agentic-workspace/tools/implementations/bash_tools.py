@@ -2,16 +2,321 @@
 Bash execution tool for the agentic workspace.
 Provides secure command execution with timeout and output capture.
 """
+import atexit
+import importlib.util
+import json
 import subprocess
 import shlex
+import shutil
 import os
+import re
+import selectors
 import signal
+import sys
+import tempfile
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union
 
 from .base import BaseTool, ToolParameter, ToolResult, register_tool
 
 
+# Summary-line patterns used by TestRunnerTool._parse_test_output
+_PASSED_RE = re.compile(r'(\d+)\s+passed')
+_FAILED_RE = re.compile(r'(\d+)\s+failed')
+_SKIPPED_RE = re.compile(r'(\d+)\s+skipped')
+_ERROR_RE = re.compile(r'(\d+)\s+error')
+_COVERAGE_RE = re.compile(r'TOTAL\s+\d+\s+\d+\s+(\d+)%')
+_JEST_PASSED_RE = re.compile(r'Tests:\s+(\d+)\s+passed')
+
+_READ_CHUNK = 64 * 1024
+
+
+def _decode(data: Union[bytes, bytearray]) -> str:
+    """Decode captured output, translating newlines as text mode would."""
+    text = data.decode("utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _run_streaming(command: Union[str, List[str]], timeout: float, merge_stderr: bool = False,
+                   **popen_kwargs) -> Tuple[int, str, str]:
+    """
+    Run a command, draining stdout and stderr as they are produced.
+    
+    A string is run through the shell; an argument list is executed
+    directly.
+    
+    Output is collected in byte buffers and decoded once at the end, so
+    no pipe can fill up and stall the child. Windows selectors only accept
+    sockets, so there the pipes are drained by ``communicate`` instead.
+    
+    Returns:
+        Tuple of (return code, stdout, stderr); stderr is empty when merged
+        into stdout
+    
+    Raises:
+        subprocess.TimeoutExpired: After killing a command that overran
+    """
+    proc = subprocess.Popen(
+        command,
+        shell=isinstance(command, str),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+        **popen_kwargs
+    )
+    if os.name == "nt":
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        stderr = "" if merge_stderr else _decode(stderr)
+        return proc.returncode, _decode(stdout), stderr
+    
+    buffers = {proc.stdout: bytearray()}
+    if not merge_stderr:
+        buffers[proc.stderr] = bytearray()
+    deadline = time.monotonic() + timeout
+    
+    try:
+        with selectors.DefaultSelector() as selector:
+            for stream in buffers:
+                selector.register(stream, selectors.EVENT_READ)
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(command, timeout)
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, _READ_CHUNK)
+                    if chunk:
+                        buffers[key.fileobj] += chunk
+                    else:
+                        selector.unregister(key.fileobj)
+        proc.wait(max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for stream in buffers:
+            stream.close()
+    
+    stderr = "" if merge_stderr else _decode(buffers[proc.stderr])
+    return proc.returncode, _decode(buffers[proc.stdout]), stderr
+
+
+# Runs inside the warm interpreter: pytest and its plugins are imported once,
+# then every request is served by a fresh fork, so test modules are always
+# imported anew. Requests and replies are JSON lines on stdin/stdout.
+_PYTEST_SERVER_SOURCE = r"""
+import json, os, sys, traceback
+from importlib.metadata import entry_points
+
+# Match the pytest console script, which doesn't put the cwd on sys.path
+del sys.path[0]
+import pytest
+for entry_point in entry_points(group="pytest11"):
+    try:
+        entry_point.load()
+    except Exception:
+        pass
+
+for line in sys.stdin:
+    request = json.loads(line)
+    pid = os.fork()
+    if pid == 0:
+        fd = os.open(request["output"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+        try:
+            os.chdir(request["cwd"])
+            os.environ.clear()
+            os.environ.update(request["env"])
+            code = int(pytest.main(request["args"]))
+        except BaseException:
+            traceback.print_exc()
+            code = 3
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    print(json.dumps({"return_code": os.waitstatus_to_exitcode(status)}), flush=True)
+"""
+
+
+@lru_cache(maxsize=None)
+def _pytest_available() -> bool:
+    """Whether this interpreter can host the pooled pytest runner."""
+    return hasattr(os, "fork") and importlib.util.find_spec("pytest") is not None
+
+
+@lru_cache(maxsize=16)
+def _runs_on_this_interpreter(script: str) -> bool:
+    """Whether the console script at ``script`` has this interpreter in its shebang."""
+    try:
+        with open(script, "rb") as f:
+            first_line = f.readline(4096)
+    except OSError:
+        return False
+    command = first_line[2:].split() if first_line.startswith(b"#!") else []
+    if not command:
+        return False
+    # Paths are compared as written: a virtualenv's python is often a symlink
+    # to the base interpreter, but has its own packages
+    interpreter = os.path.abspath(os.fsdecode(command[0]))
+    return os.path.normcase(interpreter) == os.path.normcase(os.path.abspath(sys.executable))
+
+
+def _pytest_server_usable() -> bool:
+    """
+    Whether a pytest command can be served by the pooled runner.
+    
+    The runner uses this interpreter, so it is only used when the ``pytest``
+    found on PATH runs on this interpreter too; anything else, such as a
+    project virtualenv, a wrapper or a shim, gets its own pytest process.
+    """
+    if not _pytest_available():
+        return False
+    script = shutil.which("pytest")
+    return script is not None and _runs_on_this_interpreter(script)
+
+
+class _PytestServer:
+    """
+    Long-lived interpreter that runs pytest in a fork per request.
+    
+    Interpreter startup and pytest/plugin imports are paid once instead of
+    on every test run. A server handles one run at a time: concurrent runs
+    check out separate servers, and finished ones are kept idle for reuse.
+    A server whose run times out or fails is killed and discarded.
+    """
+    
+    # Idle servers kept for reuse; extra ones are shut down when released
+    MAX_IDLE = 4
+    
+    _idle: List["_PytestServer"] = []
+    _idle_lock = threading.Lock()
+    _atexit_registered = False
+    
+    def __init__(self):
+        # The server leads its own process group, which its forked runs
+        # join, so killing the group also stops a run in progress
+        self._proc = subprocess.Popen(
+            [sys.executable, "-c", _PYTEST_SERVER_SOURCE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=0,
+            start_new_session=True
+        )
+        self._pending = b""
+    
+    @classmethod
+    def acquire(cls) -> Optional["_PytestServer"]:
+        """Check out an idle server or start one, or None where it can't be used."""
+        if not _pytest_server_usable():
+            return None
+        with cls._idle_lock:
+            if not cls._atexit_registered:
+                atexit.register(cls._shutdown)
+                cls._atexit_registered = True
+            while cls._idle:
+                server = cls._idle.pop()
+                if server._proc.poll() is None:
+                    return server
+        try:
+            return cls()
+        except OSError:
+            return None
+    
+    def _release(self) -> None:
+        with self._idle_lock:
+            if len(self._idle) < self.MAX_IDLE and self._proc.poll() is None:
+                self._idle.append(self)
+                return
+        self._close()
+    
+    def _close(self) -> None:
+        self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._kill()
+        else:
+            self._proc.stdout.close()
+    
+    def _kill(self) -> None:
+        try:
+            os.killpg(self._proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self._proc.wait()
+        self._proc.stdin.close()
+        self._proc.stdout.close()
+    
+    @classmethod
+    def _shutdown(cls) -> None:
+        with cls._idle_lock:
+            idle = cls._idle[:]
+            cls._idle.clear()
+        for server in idle:
+            server._close()
+    
+    def _read_reply(self, deadline: float) -> Dict[str, Any]:
+        fd = self._proc.stdout.fileno()
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while b"\n" not in self._pending:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    raise subprocess.TimeoutExpired("pytest", 0)
+                if not selector.select(timeout):
+                    continue
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    raise RuntimeError("pytest server exited")
+                self._pending += chunk
+        line, self._pending = self._pending.split(b"\n", 1)
+        return json.loads(line)
+    
+    def run(self, args: List[str], timeout: float) -> Tuple[int, str]:
+        """
+        Run pytest with the given arguments in the current directory.
+        
+        The server goes back to the idle pool after a completed run; on any
+        error it is killed along with the run, and must not be used again.
+        
+        Returns:
+            Tuple of (return code, combined stdout and stderr)
+        
+        Raises:
+            subprocess.TimeoutExpired: After killing a run that overran
+            RuntimeError: If the server failed; run pytest without it instead
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                output = os.path.join(tmp, "output")
+                request = {"args": args, "cwd": os.getcwd(), "env": dict(os.environ), "output": output}
+                self._proc.stdin.write(json.dumps(request).encode("utf-8") + b"\n")
+                return_code = self._read_reply(deadline)["return_code"]
+                with open(output, "rb") as f:
+                    result = return_code, _decode(f.read())
+        except subprocess.TimeoutExpired:
+            self._kill()
+            raise
+        except Exception as e:
+            self._kill()
+            raise RuntimeError("pytest server failed") from e
+        
+        self._release()
+        return result
+
+
 class BashTool(BaseTool):
     """Execute bash commands with security controls."""
     
@@ -37,6 +342,19 @@ class BashTool(BaseTool):
         r"curl.*\|\s*sh",  # Curl piping to shell
         r"wget.*\|\s*sh",  # Wget piping to shell
     ]
+    _DANGEROUS_COMPILED = tuple(re.compile(pattern) for pattern in DANGEROUS_PATTERNS)
+    
+    # Characters that need a shell to interpret; commands free of them are
+    # executed directly from their shlex tokens without spawning /bin/sh
+    _SHELL_SYNTAX = re.compile(r'[|&;<>()$`\\*?\[\]{}~#!\n]')
+    
+    # Builtins and keywords that only exist inside a shell
+    SHELL_BUILTINS = frozenset({
+        ".", "alias", "bg", "cd", "command", "eval", "exec", "exit", "export",
+        "fg", "getopts", "hash", "jobs", "local", "read", "readonly", "return",
+        "set", "shift", "source", "time", "times", "trap", "type", "ulimit",
+        "umask", "unalias", "unset", "wait",
+    })
     
     @property
     def name(self) -> str:
@@ -90,8 +408,6 @@ class BashTool(BaseTool):
         Returns:
             Error message if unsafe, None if safe
         """
-        import re
-        
         # Check against blocked commands
         normalized = " ".join(command.lower().split())
         for blocked in self.BLOCKED_COMMANDS:
@@ -99,12 +415,30 @@ class BashTool(BaseTool):
                 return f"Blocked command pattern: {blocked}"
         
         # Check dangerous patterns
-        for pattern in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, command):
-                return f"Dangerous pattern detected: {pattern}"
+        for pattern in self._DANGEROUS_COMPILED:
+            if pattern.search(command):
+                return f"Dangerous pattern detected: {pattern.pattern}"
         
         return None
     
+    def _direct_argv(self, command: str) -> Optional[List[str]]:
+        """
+        Tokenize a command that can run without a shell.
+        
+        Returns:
+            The argument list, or None if the command uses shell syntax,
+            a shell builtin or a variable assignment
+        """
+        if self._SHELL_SYNTAX.search(command):
+            return None
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return None
+        if not argv or argv[0] in self.SHELL_BUILTINS or "=" in argv[0]:
+            return None
+        return argv
+    
     def execute(self, command: str, working_directory: str = ".",
                 timeout_seconds: int = 60, env_vars: Optional[Dict[str, str]] = None,
                 capture_stderr: bool = True) -> ToolResult:
@@ -127,26 +461,25 @@ class BashTool(BaseTool):
         if env_vars:
             env.update(env_vars)
         
-        # Configure stderr handling
-        stderr_config = subprocess.PIPE if capture_stderr else subprocess.STDOUT
+        run_options = {"merge_stderr": not capture_stderr, "cwd": cwd, "env": env}
         
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=cwd,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=timeout_seconds
-            )
+            argv = self._direct_argv(command)
+            if argv is not None:
+                try:
+                    return_code, stdout, stderr = _run_streaming(argv, timeout_seconds, **run_options)
+                except (FileNotFoundError, PermissionError):
+                    # Leave it to the shell, which reports "not found" itself
+                    argv = None
+            if argv is None:
+                return_code, stdout, stderr = _run_streaming(command, timeout_seconds, **run_options)
             
             return ToolResult.success(
                 data={
-                    "stdout": result.stdout,
-                    "stderr": result.stderr if capture_stderr else None,
-                    "return_code": result.returncode,
-                    "success": result.returncode == 0
+                    "stdout": stdout,
+                    "stderr": stderr if capture_stderr else None,
+                    "return_code": return_code,
+                    "success": return_code == 0
                 },
                 metadata={
                     "command": command,
@@ -242,6 +575,53 @@ class TestRunnerTool(BaseTool):
         if not path.exists():
             return ToolResult.failure(f"Test path not found: {test_path}", "FileNotFoundError")
         
+        command, pytest_args = self._build_command(
+            test_path, framework, verbose, coverage, parallel, filter_pattern
+        )
+        
+        # Execute tests
+        try:
+            server = _PytestServer.acquire() if framework == "pytest" else None
+            output = None
+            if server is not None:
+                try:
+                    return_code, output = server.run(list(pytest_args), timeout_seconds)
+                except RuntimeError:
+                    # The server failed and was discarded; run pytest as a fresh process instead
+                    output = None
+            if output is None:
+                return_code, stdout, stderr = _run_streaming(command, timeout_seconds)
+                output = stdout + stderr
+            
+            # Parse results (basic parsing)
+            
+            # Try to extract test counts from output
+            test_data = self._parse_test_output(output, framework)
+            test_data["raw_output"] = output
+            test_data["return_code"] = return_code
+            test_data["success"] = return_code == 0
+            
+            return ToolResult.success(
+                data=test_data,
+                metadata={"framework": framework, "command": command}
+            )
+            
+        except subprocess.TimeoutExpired:
+            return ToolResult.failure(
+                f"Tests timed out after {timeout_seconds} seconds",
+                "TimeoutError"
+            )
+    
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _build_command(cls, test_path: str, framework: str, verbose: bool, coverage: bool,
+                       parallel: bool, filter_pattern: Optional[str]) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Build the test command, cached for repeated runs with the same options.
+        
+        Returns:
+            Tuple of (shell command, pytest arguments for the pooled runner)
+        """
         # Build command options
         options = []
         
@@ -277,43 +657,13 @@ class TestRunnerTool(BaseTool):
         
         # Build command
         options_str = " ".join(options)
-        command_template = self.FRAMEWORK_COMMANDS.get(framework)
+        command_template = cls.FRAMEWORK_COMMANDS.get(framework)
         command = command_template.format(path=test_path, options=options_str)
-        
-        # Execute tests
-        try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout_seconds
-            )
-            
-            # Parse results (basic parsing)
-            output = result.stdout + result.stderr
-            
-            # Try to extract test counts from output
-            test_data = self._parse_test_output(output, framework)
-            test_data["raw_output"] = output
-            test_data["return_code"] = result.returncode
-            test_data["success"] = result.returncode == 0
-            
-            return ToolResult.success(
-                data=test_data,
-                metadata={"framework": framework, "command": command}
-            )
-            
-        except subprocess.TimeoutExpired:
-            return ToolResult.failure(
-                f"Tests timed out after {timeout_seconds} seconds",
-                "TimeoutError"
-            )
+        pytest_args = tuple(shlex.split(command)[1:]) if framework == "pytest" else ()
+        return command, pytest_args
     
     def _parse_test_output(self, output: str, framework: str) -> Dict[str, Any]:
         """Parse test output to extract metrics."""
-        import re
-        
         data = {
             "total_tests": 0,
             "passed": 0,
@@ -326,34 +676,34 @@ class TestRunnerTool(BaseTool):
         
         if framework == "pytest":
             # Match pytest summary line: "5 passed, 2 failed, 1 skipped"
-            match = re.search(r'(\d+)\s+passed', output)
+            match = _PASSED_RE.search(output)
             if match:
                 data["passed"] = int(match.group(1))
             
-            match = re.search(r'(\d+)\s+failed', output)
+            match = _FAILED_RE.search(output)
             if match:
                 data["failed"] = int(match.group(1))
             
-            match = re.search(r'(\d+)\s+skipped', output)
+            match = _SKIPPED_RE.search(output)
             if match:
                 data["skipped"] = int(match.group(1))
             
-            match = re.search(r'(\d+)\s+error', output)
+            match = _ERROR_RE.search(output)
             if match:
                 data["errors"] = int(match.group(1))
             
             # Coverage
-            match = re.search(r'TOTAL\s+\d+\s+\d+\s+(\d+)%', output)
+            match = _COVERAGE_RE.search(output)
             if match:
                 data["coverage_percent"] = int(match.group(1))
         
         elif framework == "jest":
             # Match Jest summary
-            match = re.search(r'Tests:\s+(\d+)\s+passed', output)
+            match = _JEST_PASSED_RE.search(output)
             if match:
                 data["passed"] = int(match.group(1))
             
-            match = re.search(r'(\d+)\s+failed', output)
+            match = _FAILED_RE.search(output)
             if match:
                 data["failed"] = int(match.group(1))
         
@@ -4,8 +4,14 @@ Analyzes code for complexity, security issues, and performance concerns.
 """
 import ast
 import re
+import sys
+import threading
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -29,7 +35,7 @@ class ToolResult:
         return self.status == ToolStatus.SUCCESS
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeIssue:
     """Represents a code issue found during analysis."""
     severity: str
@@ -48,49 +54,114 @@ class CodeIssue:
         }
 
 
+@dataclass
+class SourceBuffer:
+    """
+    Source text shared by the analyzers of one run.
+
+    The line-start offsets are computed on first use and reused by every
+    analyzer, instead of each one splitting the text into lines.
+    """
+    code: str
+
+    @cached_property
+    def line_starts(self) -> List[int]:
+        """Offset of the first character of each line."""
+        return [0, *[match.end() for match in _NEWLINE.finditer(self.code)]]
+
+
+def _as_source(code: Union[str, SourceBuffer]) -> SourceBuffer:
+    return code if isinstance(code, SourceBuffer) else SourceBuffer(code)
+
+
+_NEWLINE = re.compile(r'\n')
+
+# Lines that are empty or whitespace only, and lines starting a comment
+_BLANK_LINE = re.compile(r'^[^\S\n]*$', re.MULTILINE)
+_COMMENT_LINE = re.compile(r'^[^\S\n]*(?:[#*]|/[/*])', re.MULTILINE)
+
+# Branching constructs counted by the language-agnostic complexity estimate.
+# The leading lookahead lists every possible first character, which lets the
+# regex engine skip ahead instead of trying each alternative at every offset.
+_BRANCH_RE = re.compile(
+    r'(?=[iefwc?&|])'
+    r'(?:\b(?:if|else|elif|for|while|catch|except|case)\b|\b\?\s*:|&&|\|\|)'
+)
+
+
 class ComplexityAnalyzer:
     """Analyzes code complexity metrics."""
 
-    def __init__(self, code: str, language: str):
-        self.code = code
+    def __init__(self, code: Union[str, SourceBuffer], language: str):
+        self.source = _as_source(code)
+        self.code = self.source.code
         self.language = language
-        self.lines = code.split('\n')
-
-    def calculate_cyclomatic_complexity(self) -> int:
-        """Calculate cyclomatic complexity for Python code."""
-        if self.language != "python":
-            return self._estimate_complexity()
-
-        try:
-            tree = ast.parse(self.code)
+        self._tree: Optional[ast.AST] = None
+        self._tree_error: Optional[SyntaxError] = None
+        self._walk_result: Optional[Tuple[int, List[Tuple[str, int, int]]]] = None
+
+    def _parse(self) -> ast.AST:
+        """Parse the code once and reuse the tree across metrics."""
+        if self._tree is None:
+            if self._tree_error is not None:
+                raise self._tree_error
+            try:
+                self._tree = ast.parse(self.code)
+            except SyntaxError as e:
+                self._tree_error = e
+                raise
+        return self._tree
+
+    def _walk(self) -> Tuple[int, List[Tuple[str, int, int]]]:
+        """
+        Walk the tree once, collecting every tree-based metric.
+
+        Returns:
+            Tuple of (cyclomatic complexity, [(name, first line, line count)]
+            for each function)
+        """
+        if self._walk_result is None:
             complexity = 1
+            functions = []
 
-            for node in ast.walk(tree):
+            for node in ast.walk(self._parse()):
                 if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
                     complexity += 1
                 elif isinstance(node, ast.BoolOp):
                     complexity += len(node.values) - 1
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    if getattr(node, 'end_lineno', None) is not None:
+                        functions.append((node.name, node.lineno, node.end_lineno - node.lineno + 1))
+
+            self._walk_result = (complexity, functions)
+        return self._walk_result
+
+    def analyze_structure(self, threshold: int = 50) -> Tuple[int, List[CodeIssue]]:
+        """
+        Return the cyclomatic complexity and long-function issues together,
+        from a single parse and tree walk.
+        """
+        return self.calculate_cyclomatic_complexity(), self.find_long_functions(threshold)
 
-            return complexity
+    def calculate_cyclomatic_complexity(self) -> int:
+        """Calculate cyclomatic complexity for Python code."""
+        if self.language != "python":
+            return self._estimate_complexity()
+
+        try:
+            return self._walk()[0]
         except SyntaxError:
             return self._estimate_complexity()
 
     def _estimate_complexity(self) -> int:
         """Estimate complexity for non-Python languages."""
-        patterns = [
-            r'\bif\b', r'\belse\b', r'\belif\b', r'\bfor\b', r'\bwhile\b',
-            r'\bcatch\b', r'\bexcept\b', r'\bcase\b', r'\b\?\s*:', r'\&\&', r'\|\|'
-        ]
-        complexity = 1
-        for pattern in patterns:
-            complexity += len(re.findall(pattern, self.code))
-        return complexity
+        return 1 + sum(1 for _ in _BRANCH_RE.finditer(self.code))
 
     def calculate_loc_metrics(self) -> Dict[str, int]:
         """Calculate lines of code metrics."""
-        total_lines = len(self.lines)
-        blank_lines = sum(1 for line in self.lines if not line.strip())
-        comment_lines = sum(1 for line in self.lines if line.strip().startswith(('#', '//', '/*', '*')))
+        total_lines = self.code.count("\n") + 1
+        blank_lines = len(_BLANK_LINE.findall(self.code))
+        comment_lines = len(_COMMENT_LINE.findall(self.code))
         code_lines = total_lines - blank_lines - comment_lines
 
         return {
@@ -108,25 +179,57 @@ class ComplexityAnalyzer:
             return issues
 
         try:
-            tree = ast.parse(self.code)
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if hasattr(node, 'end_lineno') and hasattr(node, 'lineno'):
-                        func_lines = node.end_lineno - node.lineno + 1
-                        if func_lines > threshold:
-                            issues.append(CodeIssue(
-                                severity="medium",
-                                category="complexity",
-                                message=f"Function '{node.name}' is {func_lines} lines (threshold: {threshold})",
-                                line=node.lineno,
-                                suggestion="Consider breaking this function into smaller, focused functions"
-                            ))
+            functions = self._walk()[1]
         except SyntaxError:
-            pass
+            return issues
+
+        for name, lineno, func_lines in functions:
+            if func_lines > threshold:
+                issues.append(CodeIssue(
+                    severity="medium",
+                    category="complexity",
+                    message=f"Function '{name}' is {func_lines} lines (threshold: {threshold})",
+                    line=lineno,
+                    suggestion="Consider breaking this function into smaller, focused functions"
+                ))
 
         return issues
 
 
+def _scan(source: SourceBuffer, patterns: tuple) -> List[Tuple[int, int]]:
+    """
+    Return (pattern index, line number) for every line a pattern matches,
+    ordered by pattern and then line.
+
+    Each pattern is searched over the whole buffer. Once it hits a line,
+    the search resumes at the next line. A match that runs past the end of
+    its line is re-checked up to the line end, so patterns containing
+    ``\\s`` keep their per-line meaning.
+    """
+    code = source.code
+    line_starts = source.line_starts
+    last_line = len(line_starts)
+    hits = []
+    for index, entry in enumerate(patterns):
+        search, match = entry[0].search, entry[0].match
+        pos = 0
+        while True:
+            found = search(code, pos)
+            if found is None:
+                break
+            start = found.start()
+            line = bisect_right(line_starts, start)
+            end = line_starts[line] - 1 if line < last_line else len(code)
+            if found.end() <= end or match(code, start, end):
+                hits.append((index, line))
+                if line == last_line:
+                    break
+                pos = end + 1
+            else:
+                pos = start + 1
+    return hits
+
+
 class SecurityAnalyzer:
     """Analyzes code for security vulnerabilities."""
 
@@ -150,26 +253,33 @@ class SecurityAnalyzer:
         ]
     }
 
-    def __init__(self, code: str, language: str):
-        self.code = code
+    # SECURITY_PATTERNS with each pattern compiled once at class creation
+    _COMPILED = {
+        language: tuple((re.compile(pattern, re.IGNORECASE), *rest) for pattern, *rest in patterns)
+        for language, patterns in SECURITY_PATTERNS.items()
+    }
+
+    def __init__(self, code: Union[str, SourceBuffer], language: str):
+        self.source = _as_source(code)
+        self.code = self.source.code
         self.language = language
-        self.lines = code.split('\n')
 
     def analyze(self) -> List[CodeIssue]:
         """Run security analysis on the code."""
+        patterns = self._COMPILED.get(self.language)
+        if not patterns:
+            return []
+
         issues = []
-        patterns = self.SECURITY_PATTERNS.get(self.language, [])
-
-        for pattern, severity, message, suggestion in patterns:
-            for i, line in enumerate(self.lines, 1):
-                if re.search(pattern, line, re.IGNORECASE):
-                    issues.append(CodeIssue(
-                        severity=severity,
-                        category="security",
-                        message=message,
-                        line=i,
-                        suggestion=suggestion
-                    ))
+        for index, line in _scan(self.source, patterns):
+            _, severity, message, suggestion = patterns[index]
+            issues.append(CodeIssue(
+                severity=severity,
+                category="security",
+                message=message,
+                line=line,
+                suggestion=suggestion
+            ))
 
         return issues
 
@@ -177,10 +287,24 @@ class SecurityAnalyzer:
 class PerformanceAnalyzer:
     """Analyzes code for performance concerns."""
 
-    def __init__(self, code: str, language: str):
-        self.code = code
+    PYTHON_PATTERNS = tuple((re.compile(pattern), message, suggestion) for pattern, message, suggestion in (
+        (r'for\s+.*\s+in\s+range\(len\(', "Using range(len()) is often unnecessary", "Iterate directly or use enumerate()"),
+        (r'import\s+\*', "Wildcard imports affect performance and readability", "Import specific names"),
+        (r'global\s+\w+', "Global variables can impact performance", "Consider passing as parameters"),
+    ))
+
+    JAVASCRIPT_PATTERNS = tuple((re.compile(pattern), message, suggestion) for pattern, message, suggestion in (
+        (r'\.innerHTML\s*\+=', "innerHTML concatenation is slow", "Build string then assign once"),
+        (r'JSON\.parse\(JSON\.stringify', "Deep clone via JSON is slow", "Use structuredClone() or a library"),
+    ))
+
+    # Languages with performance checks
+    LANGUAGES = frozenset({"python", "javascript", "typescript"})
+
+    def __init__(self, code: Union[str, SourceBuffer], language: str):
+        self.source = _as_source(code)
+        self.code = self.source.code
         self.language = language
-        self.lines = code.split('\n')
 
     def analyze(self) -> List[CodeIssue]:
         """Run performance analysis on the code."""
@@ -188,55 +312,114 @@ class PerformanceAnalyzer:
 
         if self.language == "python":
             issues.extend(self._analyze_python())
-        elif self.language in ["javascript", "typescript"]:
+        elif self.language in ("javascript", "typescript"):
             issues.extend(self._analyze_javascript())
 
         return issues
 
+    def _issues(self, patterns: tuple) -> List[CodeIssue]:
+        """Build issues for pattern matches, ordered by line."""
+        issues = []
+        hits = sorted(_scan(self.source, patterns), key=lambda hit: (hit[1], hit[0]))
+        for index, line in hits:
+            _, message, suggestion = patterns[index]
+            issues.append(CodeIssue(
+                severity="low",
+                category="performance",
+                message=message,
+                line=line,
+                suggestion=suggestion
+            ))
+        return issues
+
     def _analyze_python(self) -> List[CodeIssue]:
         """Analyze Python-specific performance issues."""
-        issues = []
+        return self._issues(self.PYTHON_PATTERNS)
 
-        patterns = [
-            (r'for\s+.*\s+in\s+range\(len\(', "Using range(len()) is often unnecessary", "Iterate directly or use enumerate()"),
-            (r'import\s+\*', "Wildcard imports affect performance and readability", "Import specific names"),
-            (r'global\s+\w+', "Global variables can impact performance", "Consider passing as parameters"),
-        ]
+    def _analyze_javascript(self) -> List[CodeIssue]:
+        """Analyze JavaScript-specific performance issues."""
+        return self._issues(self.JAVASCRIPT_PATTERNS)
 
-        for i, line in enumerate(self.lines, 1):
-            for pattern, message, suggestion in patterns:
-                if re.search(pattern, line):
-                    issues.append(CodeIssue(
-                        severity="low",
-                        category="performance",
-                        message=message,
-                        line=i,
-                        suggestion=suggestion
-                    ))
 
-        return issues
+def _read_source(path: Path) -> str:
+    """
+    Read a UTF-8 source file in one read and one decode.
 
-    def _analyze_javascript(self) -> List[CodeIssue]:
-        """Analyze JavaScript-specific performance issues."""
-        issues = []
+    Newlines are translated as text mode would, so CRLF files produce the
+    same line numbers.
+    """
+    code = path.read_bytes().decode("utf-8")
+    if "\r" in code:
+        code = code.replace("\r\n", "\n").replace("\r", "\n")
+    return code
 
-        patterns = [
-            (r'\.innerHTML\s*\+=', "innerHTML concatenation is slow", "Build string then assign once"),
-            (r'JSON\.parse\(JSON\.stringify', "Deep clone via JSON is slow", "Use structuredClone() or a library"),
-        ]
 
-        for i, line in enumerate(self.lines, 1):
-            for pattern, message, suggestion in patterns:
-                if re.search(pattern, line):
-                    issues.append(CodeIssue(
-                        severity="low",
-                        category="performance",
-                        message=message,
-                        line=i,
-                        suggestion=suggestion
-                    ))
+def _run_complexity(source: SourceBuffer, language: str) -> Tuple[Dict[str, Any], List[CodeIssue]]:
+    analyzer = ComplexityAnalyzer(source, language)
+    if language == "python":
+        cc, issues = analyzer.analyze_structure()
+    else:
+        # Only Python is parsed; other languages get the keyword estimate
+        cc, issues = analyzer._estimate_complexity(), []
+    metrics = {"cyclomatic_complexity": cc, "loc": analyzer.calculate_loc_metrics()}
 
-        return issues
+    if cc > 20:
+        issues.append(CodeIssue(
+            severity="high",
+            category="complexity",
+            message=f"Very high cyclomatic complexity: {cc}",
+            suggestion="Consider refactoring to reduce complexity below 20"
+        ))
+    elif cc > 10:
+        issues.append(CodeIssue(
+            severity="medium",
+            category="complexity",
+            message=f"High cyclomatic complexity: {cc}",
+            suggestion="Consider refactoring to reduce complexity"
+        ))
+
+    return metrics, issues
+
+
+def _run_security(source: SourceBuffer, language: str) -> Tuple[Dict[str, Any], List[CodeIssue]]:
+    if language not in SecurityAnalyzer.SECURITY_PATTERNS:
+        return {}, []
+    return {}, SecurityAnalyzer(source, language).analyze()
+
+
+def _run_performance(source: SourceBuffer, language: str) -> Tuple[Dict[str, Any], List[CodeIssue]]:
+    if language not in PerformanceAnalyzer.LANGUAGES:
+        return {}, []
+    return {}, PerformanceAnalyzer(source, language).analyze()
+
+
+# analysis_type -> analysis returning (metrics, issues), in report order
+_ANALYSES = (
+    ("complexity", _run_complexity),
+    ("security", _run_security),
+    ("performance", _run_performance),
+)
+
+# ast and re hold the GIL, so analyses only run concurrently on
+# free-threaded builds; elsewhere a pool would just add overhead
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+_analysis_pool: Optional[ThreadPoolExecutor] = None
+_analysis_pool_lock = threading.Lock()
+
+
+def _get_analysis_pool() -> ThreadPoolExecutor:
+    """Get the worker pool shared by all CodeAnalyzerTool runs."""
+    global _analysis_pool
+    if _analysis_pool is None:
+        with _analysis_pool_lock:
+            if _analysis_pool is None:
+                _analysis_pool = ThreadPoolExecutor(max_workers=len(_ANALYSES), thread_name_prefix="code-analysis")
+    return _analysis_pool
+
+
+# Quality-score penalty per issue of each severity
+_SEVERITY_WEIGHTS = {"critical": 25, "high": 15, "medium": 5, "low": 2}
 
 
 class CodeAnalyzerTool:
@@ -250,14 +433,13 @@ class CodeAnalyzerTool:
         
         # Get code from file or direct input
         if file_path:
-            path = Path(file_path)
-            if not path.exists():
+            try:
+                code = _read_source(Path(file_path))
+            except FileNotFoundError:
                 return ToolResult(
                     status=ToolStatus.ERROR,
                     error=f"File not found: {file_path}"
                 )
-            try:
-                code = path.read_text(encoding='utf-8')
             except Exception as e:
                 return ToolResult(
                     status=ToolStatus.ERROR,
@@ -280,53 +462,27 @@ class CodeAnalyzerTool:
         }
 
         all_issues = []
+        source = SourceBuffer(code)
 
-        # Complexity analysis
-        if analysis_type in ["complexity", "all"]:
-            complexity_analyzer = ComplexityAnalyzer(code, language)
-            results["metrics"]["cyclomatic_complexity"] = complexity_analyzer.calculate_cyclomatic_complexity()
-            results["metrics"]["loc"] = complexity_analyzer.calculate_loc_metrics()
-            all_issues.extend(complexity_analyzer.find_long_functions())
-
-            cc = results["metrics"]["cyclomatic_complexity"]
-            if cc > 20:
-                all_issues.append(CodeIssue(
-                    severity="high",
-                    category="complexity",
-                    message=f"Very high cyclomatic complexity: {cc}",
-                    suggestion="Consider refactoring to reduce complexity below 20"
-                ))
-            elif cc > 10:
-                all_issues.append(CodeIssue(
-                    severity="medium",
-                    category="complexity",
-                    message=f"High cyclomatic complexity: {cc}",
-                    suggestion="Consider refactoring to reduce complexity"
-                ))
-
-        # Security analysis
-        if analysis_type in ["security", "all"]:
-            security_analyzer = SecurityAnalyzer(code, language)
-            all_issues.extend(security_analyzer.analyze())
+        analyses = [run for kind, run in _ANALYSES if analysis_type in (kind, "all")]
+        if len(analyses) > 1 and not _GIL_ENABLED:
+            outputs = list(_get_analysis_pool().map(lambda run: run(source, language), analyses))
+        else:
+            outputs = [run(source, language) for run in analyses]
 
-        # Performance analysis
-        if analysis_type in ["performance", "all"]:
-            performance_analyzer = PerformanceAnalyzer(code, language)
-            all_issues.extend(performance_analyzer.analyze())
+        for metrics, issues in outputs:
+            results["metrics"].update(metrics)
+            all_issues.extend(issues)
 
         # Convert issues to dict and calculate score
         results["issues"] = [issue.to_dict() for issue in all_issues]
+        severity_count = Counter(issue.severity for issue in all_issues)
 
-        # Calculate overall score (0-100)
-        severity_weights = {"critical": 25, "high": 15, "medium": 5, "low": 2}
-        penalty = sum(severity_weights.get(issue.severity, 0) for issue in all_issues)
+        # Calculate overall score (0-100), weighting each severity once
+        penalty = sum(_SEVERITY_WEIGHTS.get(severity, 0) * count for severity, count in severity_count.items())
         results["metrics"]["quality_score"] = max(0, 100 - penalty)
 
         # Generate recommendations
-        severity_count = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-        for issue in all_issues:
-            severity_count[issue.severity] = severity_count.get(issue.severity, 0) + 1
-
         if severity_count["critical"] > 0:
             results["recommendations"].append(
                 f"Address {severity_count['critical']} critical issue(s) immediately"
@@ -5,13 +5,109 @@ Provides read, write, edit, glob, and grep functionality.
 import os
 import re
 import fnmatch
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterator, List, Optional, Dict, Any, Tuple
 import difflib
 
 from .base import BaseTool, ToolParameter, ToolResult, register_tool
 
 
+_MAGIC_CHARS = re.compile(r'[*?\[]')
+
+
+@lru_cache(maxsize=256)
+def _compile_segment(segment: str) -> Callable[[str], Any]:
+    """Compile one glob path segment into a regex match function."""
+    return re.compile(fnmatch.translate(segment)).match
+
+
+def _iter_glob(base: str, pattern: str,
+               include_hidden: bool) -> Iterator[Tuple[str, Optional[os.DirEntry]]]:
+    """
+    Walk ``base`` with an explicit stack of scandir calls, yielding
+    ``(path, entry)`` for every match of ``pattern``.
+    
+    Follows Path.glob semantics: segments are matched with fnmatch rules,
+    ``**`` matches zero or more directories (without following symlinks),
+    and paths are joined the way pathlib renders them. Hidden entries are
+    pruned during the walk unless ``include_hidden`` is set. ``entry`` is
+    None when a match was found without listing its parent directory.
+    
+    Raises:
+        ValueError: If ``pattern`` is absolute, which Path.glob also rejects
+    """
+    if pattern.startswith(("/", "\\")) or os.path.isabs(pattern):
+        raise ValueError(f"Non-relative patterns are unsupported: {pattern}")
+    parts = tuple(p for p in pattern.split("/") if p not in ("", "."))
+    if not parts:
+        return
+    dedupe = parts.count("**") > 1
+    seen = set()
+    
+    def join(parent: str, name: str) -> str:
+        return name if parent == "." else os.path.join(parent, name)
+    
+    stack = [(base, 0, None)]
+    while stack:
+        directory, index, dir_entry = stack.pop()
+        segment = parts[index]
+        last = index == len(parts) - 1
+        
+        if segment == "**":
+            if last:
+                if not dedupe or directory not in seen:
+                    seen.add(directory)
+                    yield directory, dir_entry
+            else:
+                stack.append((directory, index + 1, dir_entry))
+            try:
+                with os.scandir(directory) as it:
+                    subdirs = [
+                        e for e in it
+                        if e.is_dir(follow_symlinks=False)
+                        and (include_hidden or not e.name.startswith("."))
+                    ]
+            except OSError:
+                continue
+            for entry in reversed(subdirs):
+                stack.append((join(directory, entry.name), index, entry))
+            continue
+        
+        if not _MAGIC_CHARS.search(segment):
+            # Literal segment: a single lookup instead of listing the directory
+            if not include_hidden and segment.startswith("."):
+                continue
+            path = join(directory, segment)
+            if not os.path.lexists(path):
+                continue
+            if last:
+                if not dedupe or path not in seen:
+                    seen.add(path)
+                    yield path, None
+            elif os.path.isdir(path):
+                stack.append((path, index + 1, None))
+            continue
+        
+        match = _compile_segment(segment)
+        try:
+            with os.scandir(directory) as it:
+                entries = [
+                    e for e in it
+                    if match(e.name) and (include_hidden or not e.name.startswith("."))
+                ]
+        except OSError:
+            continue
+        for entry in entries if last else reversed(entries):
+            path = join(directory, entry.name)
+            if last:
+                if not dedupe or path not in seen:
+                    seen.add(path)
+                    yield path, entry
+            elif entry.is_dir():
+                stack.append((path, index + 1, entry))
+
+
 class ReadFileTool(BaseTool):
     """Read contents of a file."""
     
@@ -298,18 +394,21 @@ class GlobTool(BaseTool):
         
         try:
             matches = []
-            for match in base.glob(pattern):
-                if not include_hidden:
-                    # Skip hidden files/directories
-                    parts = match.relative_to(base).parts
-                    if any(part.startswith(".") for part in parts):
-                        continue
+            for path, entry in _iter_glob(str(base), pattern, include_hidden):
+                if entry is not None:
+                    is_file = entry.is_file()
+                    is_dir = entry.is_dir()
+                    size = entry.stat().st_size if is_file else None
+                else:
+                    is_file = os.path.isfile(path)
+                    is_dir = os.path.isdir(path)
+                    size = os.path.getsize(path) if is_file else None
                 
                 matches.append({
-                    "path": str(match),
-                    "is_file": match.is_file(),
-                    "is_dir": match.is_dir(),
-                    "size": match.stat().st_size if match.is_file() else None
+                    "path": path,
+                    "is_file": is_file,
+                    "is_dir": is_dir,
+                    "size": size
                 })
                 
                 if len(matches) >= max_results:
@@ -17,6 +17,7 @@ from .workflow_engine import (
     StepStatus,
     VariableResolver,
     DependencyResolver,
+    get_shared_pool,
     load_workflow,
 )
 from .agent_orchestrator import (
@@ -29,6 +30,7 @@ from .agent_orchestrator import (
     AgentState,
     TaskContext,
     TaskResult,
+    TaskSpec,
 )
 
 __all__ = [
@@ -48,6 +50,7 @@ __all__ = [
     "StepStatus",
     "VariableResolver",
     "DependencyResolver",
+    "get_shared_pool",
     "load_workflow",
     
     # Agents
@@ -60,6 +63,7 @@ __all__ = [
     "AgentState",
     "TaskContext",
     "TaskResult",
+    "TaskSpec",
 ]
 
 
@@ -6,18 +6,31 @@ multi-agent coordination, and intelligent task delegation.
 """
 import json
 import logging
+import sys
 import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Type
-from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Type, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _read_json(path: Union[str, Path]) -> Any:
+    """Read a JSON file, preferring orjson when it is installed."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 class AgentState(Enum):
     """Lifecycle state of an agent."""
     UNINITIALIZED = "uninitialized"
@@ -43,7 +56,7 @@ class AgentCapability(Enum):
     WORKFLOW_COORDINATION = "workflow-coordination"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for an agent instance."""
     name: str
@@ -81,9 +94,7 @@ class AgentConfig:
     @classmethod
     def from_file(cls, path: str) -> "AgentConfig":
         """Load config from JSON file."""
-        with open(path, "r") as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(_read_json(path))
 
 
 @dataclass
@@ -98,6 +109,16 @@ class TaskContext:
     created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+@dataclass
+class TaskSpec:
+    """A single task submitted through AgentOrchestrator.execute_tasks_batch."""
+    agent_name: str
+    action: str
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    task_id: Optional[str] = None
+    timeout_seconds: int = 300
+
+
 @dataclass
 class TaskResult:
     """Result from an agent task execution."""
@@ -423,6 +444,9 @@ class AgentOrchestrator:
         Returns:
             True if registration successful
         """
+        # Interned keys let lookups with interned names compare by identity
+        agent.config.name = sys.intern(agent.config.name)
+        
         with self._lock:
             if agent.name in self._agents:
                 logger.warning(f"Agent {agent.name} already registered, replacing")
@@ -474,6 +498,50 @@ class AgentOrchestrator:
         
         return count
     
+    def load_agents(self,
+                    directory: str,
+                    names: Optional[List[str]] = None,
+                    pattern: str = "**/*.json") -> int:
+        """
+        Register agents from a directory, optionally restricted to given names.
+        
+        Only the ``name`` field of each file is inspected up front; agents are
+        built and initialized just for the requested names, and the scan stops
+        once all of them are registered. With ``names=None`` every agent found
+        is registered.
+        
+        Returns:
+            Number of agents newly registered
+        """
+        wanted = None if names is None else {n for n in names if n not in self._agents}
+        if wanted is not None and not wanted:
+            return 0
+        
+        count = 0
+        for config_file in Path(directory).glob(pattern):
+            if config_file.name.startswith("example-") or config_file.name.endswith(".schema.json"):
+                continue
+            
+            try:
+                data = _read_json(config_file)
+                if not isinstance(data, dict):
+                    continue
+                name = data.get("name")
+                if wanted is not None and name not in wanted:
+                    continue
+                if self.register_from_config(AgentConfig.from_dict(data)):
+                    count += 1
+            except Exception as e:
+                logger.error(f"Failed to register agent from {config_file}: {e}")
+                continue
+            
+            if wanted is not None:
+                wanted.discard(name)
+                if not wanted:
+                    break
+        
+        return count
+    
     def get_agent(self, name: str) -> Optional[BaseAgent]:
         """Get an agent by name."""
         return self._agents.get(name)
@@ -542,6 +610,7 @@ class AgentOrchestrator:
         Returns:
             TaskResult with execution outcome
         """
+        agent_name = sys.intern(agent_name)
         agent = self.get_agent(agent_name)
         
         if not agent:
@@ -560,6 +629,88 @@ class AgentOrchestrator:
         
         return agent.execute(action, context)
     
+    def _group_batch(self,
+                     specs: List[TaskSpec],
+                     futures: List[Future]) -> Dict[str, List[Any]]:
+        """
+        Resolve agents for a batch in one locked pass.
+        
+        Unknown agents fail their future immediately; the rest are grouped
+        per agent, since an agent runs one task at a time.
+        """
+        groups: Dict[str, List[Any]] = {}
+        with self._lock:
+            agents = self._agents
+            for i, spec in enumerate(specs):
+                task_id = spec.task_id or f"task-{time.time()}-{i}"
+                agent = agents.get(spec.agent_name)
+                if agent is None:
+                    futures[i].set_result(TaskResult(
+                        task_id=task_id,
+                        agent_name=spec.agent_name,
+                        status="failure",
+                        error=f"Agent not found: {spec.agent_name}"
+                    ))
+                    continue
+                context = TaskContext(
+                    task_id=task_id,
+                    inputs=spec.inputs,
+                    timeout_seconds=spec.timeout_seconds
+                )
+                groups.setdefault(agent.name, []).append((futures[i], agent, spec.action, context))
+        return groups
+    
+    @staticmethod
+    def _run_group(group: List[Any]) -> None:
+        """Run one agent's share of a batch in order, resolving each future."""
+        for future, agent, action, context in group:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(agent.execute(action, context))
+            except BaseException as e:
+                future.set_exception(e)
+    
+    def submit_batch(self, specs: List[TaskSpec]) -> List[Future]:
+        """
+        Enqueue several independent tasks without waiting for them.
+        
+        All agents are resolved under a single lock acquisition and one job
+        per agent is handed to the worker pool.
+        
+        Args:
+            specs: Tasks to execute
+            
+        Returns:
+            Futures resolving to TaskResults, in the same order as ``specs``
+        """
+        futures = [Future() for _ in specs]
+        for group in self._group_batch(specs, futures).values():
+            self._executor.submit(self._run_group, group)
+        return futures
+    
+    def execute_tasks_batch(self, specs: List[TaskSpec]) -> List[TaskResult]:
+        """
+        Execute several independent tasks concurrently and wait for them.
+        
+        Like submit_batch, but a batch touching a single agent runs inline
+        instead of going through the worker pool.
+        
+        Args:
+            specs: Tasks to execute
+            
+        Returns:
+            TaskResults in the same order as ``specs``
+        """
+        futures = [Future() for _ in specs]
+        groups = list(self._group_batch(specs, futures).values())
+        if len(groups) == 1:
+            self._run_group(groups[0])
+        else:
+            for group in groups:
+                self._executor.submit(self._run_group, group)
+        return [future.result() for future in futures]
+    
     def delegate_task(self,
                       action: str,
                       inputs: Dict[str, Any],
@@ -4,16 +4,35 @@ Configuration loader utility for agentic workspace.
 Provides comprehensive configuration loading, validation, merging,
 and environment variable support.
 """
+import copy
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Decode JSON bytes, preferring orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers see
+    the same exception type on either path.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class ConfigLoader:
     """Load and validate configuration files for agents and workflows."""
     
-    _cache: Dict[str, Dict[str, Any]] = {}
+    # absolute path -> ((st_mtime_ns, st_size), parsed config)
+    _cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
     _cache_enabled: bool = True
 
     @classmethod
@@ -28,13 +47,45 @@ class ConfigLoader:
         """Clear the configuration cache."""
         cls._cache.clear()
 
-    @staticmethod
-    def load_json(file_path: Union[str, Path]) -> Dict[str, Any]:
+    @classmethod
+    def _load_cached(cls,
+                     file_path: Union[str, Path],
+                     parse: Callable[[Path], Dict[str, Any]],
+                     use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Parse a file, memoized on its modification time and size.
+
+        Cached entries are invalidated as soon as the file changes on disk;
+        callers always receive a deep copy, so mutating a returned config
+        (nested values included) never alters the cached one.
+        """
+        path = Path(file_path)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}") from None
+
+        use_cache = use_cache and cls._cache_enabled
+        key = str(path.absolute())
+        stamp = (st.st_mtime_ns, st.st_size)
+        if use_cache:
+            hit = cls._cache.get(key)
+            if hit is not None and hit[0] == stamp:
+                return copy.deepcopy(hit[1])
+
+        config = parse(path)
+        if cls._cache_enabled and isinstance(config, dict):
+            cls._cache[key] = (stamp, copy.deepcopy(config))
+        return config
+
+    @classmethod
+    def load_json(cls, file_path: Union[str, Path], use_cache: bool = True) -> Dict[str, Any]:
         """
         Load a JSON configuration file.
 
         Args:
             file_path: Path to the JSON file
+            use_cache: Whether to reuse a previous parse of an unchanged file
 
         Returns:
             Dictionary containing the configuration
@@ -43,20 +94,20 @@ class ConfigLoader:
             FileNotFoundError: If file doesn't exist
             json.JSONDecodeError: If JSON is invalid
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        def parse(path: Path) -> Dict[str, Any]:
+            with open(path, 'rb') as f:
+                return _loads(f.read())
 
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return cls._load_cached(file_path, parse, use_cache)
 
-    @staticmethod
-    def load_yaml(file_path: Union[str, Path]) -> Dict[str, Any]:
+    @classmethod
+    def load_yaml(cls, file_path: Union[str, Path], use_cache: bool = True) -> Dict[str, Any]:
         """
         Load a YAML configuration file.
 
         Args:
             file_path: Path to the YAML file
+            use_cache: Whether to reuse a previous parse of an unchanged file
 
         Returns:
             Dictionary containing the configuration
@@ -69,13 +120,12 @@ class ConfigLoader:
             import yaml
         except ImportError:
             raise ImportError("PyYAML is required for YAML support. Install with: pip install pyyaml")
-        
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
-        with open(path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+        def parse(path: Path) -> Dict[str, Any]:
+            with open(path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f) or {}
+
+        return cls._load_cached(file_path, parse, use_cache)
 
     @classmethod
     def load_config(cls, file_path: Union[str, Path], use_cache: bool = True) -> Dict[str, Any]:
@@ -90,24 +140,14 @@ class ConfigLoader:
             Dictionary containing the configuration
         """
         path = Path(file_path)
-        cache_key = str(path.absolute())
-        
-        if use_cache and cls._cache_enabled and cache_key in cls._cache:
-            return cls._cache[cache_key].copy()
-        
         suffix = path.suffix.lower()
 
         if suffix == '.json':
-            config = cls.load_json(path)
+            return cls.load_json(path, use_cache)
         elif suffix in ['.yaml', '.yml']:
-            config = cls.load_yaml(path)
+            return cls.load_yaml(path, use_cache)
         else:
             raise ValueError(f"Unsupported configuration format: {suffix}")
-        
-        if cls._cache_enabled:
-            cls._cache[cache_key] = config.copy()
-        
-        return config
 
     @classmethod
     def load_agent_config(cls, agent_name: str, config_dir: str = "./agents") -> Dict[str, Any]:
@@ -185,11 +225,19 @@ class ConfigLoader:
             Merged configuration
         """
         result = base.copy()
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = ConfigLoader.merge_configs(result[key], value)
-            else:
-                result[key] = value
+        # Iterative so arbitrarily deep configs don't hit the recursion limit;
+        # dicts on the merge path are copied, untouched subtrees are shared
+        stack = [(result, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    merged = current.copy()
+                    target[key] = merged
+                    stack.append((merged, value))
+                else:
+                    target[key] = value
         return result
 
     @staticmethod
@@ -4,16 +4,23 @@ Logging utility for agentic workspace operations.
 Provides structured logging with JSON output, metrics tracking,
 and comprehensive agent/workflow monitoring.
 """
+import atexit
 import logging
 import json
 import sys
-from datetime import datetime
+import weakref
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field, asdict
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class MetricPoint:
@@ -67,8 +74,10 @@ class JsonFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
     def format(self, record: logging.LogRecord) -> str:
+        # Use the record's creation time so buffered records keep their timestamps
+        created = datetime.fromtimestamp(record.created, tz=timezone.utc)
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": created.replace(tzinfo=None).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -90,7 +99,10 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data)
+        if orjson is not None:
+            # The handler appends the line terminator, so no OPT_APPEND_NEWLINE
+            return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(log_data, default=str)
 
 
 class AgenticLogger:
@@ -105,7 +117,8 @@ class AgenticLogger:
                  log_dir: str = "./logs", 
                  level: int = logging.INFO,
                  json_format: bool = True,
-                 console_output: bool = True):
+                 console_output: bool = True,
+                 batch_size: int = 1):
         """
         Initialize the logger.
 
@@ -114,11 +127,18 @@ class AgenticLogger:
             level: Logging level
             json_format: Use JSON format for logs
             console_output: Also output to console
+            batch_size: Buffer this many agent actions and workflow events
+                        before writing them out in one batch (1 writes each
+                        record immediately); error records flush at once
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
         self.metrics = MetricsCollector()
+        self.batch_size = max(1, batch_size)
+        self._pending: deque = deque()
+        if self.batch_size > 1:
+            _batching_loggers.add(self)
 
         # Set up logging
         self.logger = logging.getLogger("agentic-workspace")
@@ -183,7 +203,7 @@ class AgenticLogger:
         for key, value in extra.items():
             setattr(record, key, value)
         
-        self.logger.handle(record)
+        self._emit(record)
         
         # Record metric
         self.metrics.record(
@@ -214,7 +234,7 @@ class AgenticLogger:
         for key, value in extra.items():
             setattr(record, key, value)
         
-        self.logger.handle(record)
+        self._emit(record)
 
     def log_workflow_step(
         self,
@@ -247,7 +267,7 @@ class AgenticLogger:
         for key, value in extra.items():
             setattr(record, key, value)
         
-        self.logger.handle(record)
+        self._emit(record)
 
     def log_workflow_end(
         self,
@@ -278,7 +298,7 @@ class AgenticLogger:
         for key, value in extra.items():
             setattr(record, key, value)
         
-        self.logger.handle(record)
+        self._emit(record)
 
     def log_error(
         self, 
@@ -299,6 +319,8 @@ class AgenticLogger:
         
         message = f"[{agent_name}] Error: {type(error).__name__}: {error}"
         
+        # Keep buffered records ahead of the error in the log
+        self.flush()
         self.logger.error(message, exc_info=True, extra=extra)
         
         # Record error metric
@@ -337,6 +359,31 @@ class AgenticLogger:
             {"tool": tool_name, "agent": agent_name, "status": status}
         )
 
+    def _emit(self, record: logging.LogRecord) -> None:
+        """Handle a structured record, buffering it when batching is on."""
+        if self.batch_size == 1:
+            self.logger.handle(record)
+            return
+        self._pending.append(record)
+        # Errors are written out straight away, like MemoryHandler's flushLevel
+        if len(self._pending) >= self.batch_size or record.levelno >= logging.ERROR:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write out buffered records.
+
+        Each record is handled exactly as an unbatched one would be, so it
+        reaches the same handlers, including those of ancestor loggers.
+        """
+        pending = self._pending
+        while True:
+            try:
+                record = pending.popleft()
+            except IndexError:
+                break
+            self.logger.handle(record)
+
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary of all collected metrics."""
         return {
@@ -346,6 +393,17 @@ class AgenticLogger:
         }
 
 
+# Batching loggers still alive; flushed once at interpreter exit
+_batching_loggers: "weakref.WeakSet[AgenticLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_batching_loggers() -> None:
+    """Flush buffered records of batching loggers at interpreter exit."""
+    for logger in list(_batching_loggers):
+        logger.flush()
+
+
 # Global logger instance
 _global_logger: Optional[AgenticLogger] = None
 
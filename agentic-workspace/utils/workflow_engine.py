@@ -5,16 +5,26 @@ Orchestrates multi-step workflows with dependency management,
 parallel execution, and comprehensive error handling.
 """
 import asyncio
+import heapq
+import inspect
 import json
 import logging
+import os
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +99,37 @@ class WorkflowResult:
         }
 
 
+_VARIABLE_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(value: str) -> Tuple[Any, ...]:
+    """
+    Compile a parameter string into a substitution plan.
+    
+    Returns ``()`` for strings without references, ``(parts,)`` when the
+    whole string is a single reference (so the raw value is preserved), and
+    otherwise a tuple of literal strings and reference part tuples to be
+    joined after lookup.
+    """
+    match = _VARIABLE_PATTERN.fullmatch(value)
+    if match:
+        return (tuple(match.group(1).split(".")),)
+    
+    plan: List[Any] = []
+    pos = 0
+    for m in _VARIABLE_PATTERN.finditer(value):
+        if m.start() > pos:
+            plan.append(value[pos:m.start()])
+        plan.append(tuple(m.group(1).split(".")))
+        pos = m.end()
+    if not plan:
+        return ()
+    if pos < len(value):
+        plan.append(value[pos:])
+    return tuple(plan)
+
+
 class VariableResolver:
     """
     Resolves variable references in workflow parameters.
@@ -103,7 +144,6 @@ class VariableResolver:
     def __init__(self, inputs: Dict[str, Any], step_results: Dict[str, StepResult]):
         self.inputs = inputs
         self.step_results = step_results
-        self._pattern = re.compile(r'\$\{([^}]+)\}')
     
     def resolve(self, value: Any) -> Any:
         """Resolve variables in a value (recursively for dicts/lists)."""
@@ -116,34 +156,39 @@ class VariableResolver:
         return value
     
     def _resolve_string(self, value: str) -> Any:
-        """Resolve variable references in a string."""
-        # Check if the entire string is a variable reference
-        match = self._pattern.fullmatch(value)
-        if match:
-            return self._get_value(match.group(1))
+        """Resolve variable references in a string using its compiled plan."""
+        plan = _compile_template(value)
+        if not plan:
+            return value
         
-        # Otherwise, perform string interpolation
-        def replace(m):
-            result = self._get_value(m.group(1))
-            return str(result) if result is not None else ""
+        # The entire string is a single variable reference
+        if len(plan) == 1 and isinstance(plan[0], tuple):
+            return self._lookup(plan[0])
         
-        return self._pattern.sub(replace, value)
+        # Otherwise, perform string interpolation
+        out = []
+        for segment in plan:
+            if isinstance(segment, str):
+                out.append(segment)
+            else:
+                result = self._lookup(segment)
+                out.append(str(result) if result is not None else "")
+        return "".join(out)
     
     def _get_value(self, path: str) -> Any:
         """Get a value from the context using a dot-notation path."""
-        import os
-        
-        parts = path.split(".")
-        
+        return self._lookup(tuple(path.split(".")))
+    
+    def _lookup(self, parts: Tuple[str, ...]) -> Any:
+        """Get a value from the context using pre-split path parts."""
         if parts[0] == "inputs":
             return self._navigate(self.inputs, parts[1:])
         elif parts[0] == "steps":
             if len(parts) < 2:
                 return None
-            step_name = parts[1]
-            if step_name not in self.step_results:
+            step_result = self.step_results.get(parts[1])
+            if step_result is None:
                 return None
-            step_result = self.step_results[step_name]
             if len(parts) == 2:
                 return step_result.output
             if parts[2] == "output":
@@ -156,7 +201,7 @@ class VariableResolver:
         
         return None
     
-    def _navigate(self, obj: Any, path: List[str]) -> Any:
+    def _navigate(self, obj: Any, path: Sequence[str]) -> Any:
         """Navigate through nested dicts/lists using a path."""
         for key in path:
             if obj is None:
@@ -189,53 +234,68 @@ class DependencyResolver:
         """
         Perform topological sort to determine execution order.
         
+        Steps within a level are ordered by fan-out weight (1 plus the weight
+        of every dependent), heaviest first, so steps that unblock the most
+        downstream work are dispatched first. Ties keep declaration order.
+        
         Returns:
             List of execution levels, where steps in each level can run in parallel
         """
-        in_degree = {node: 0 for node in graph}
-        for deps in graph.values():
-            for dep in deps:
-                if dep in in_degree:
-                    in_degree[dep] = in_degree.get(dep, 0)
-        
+        order = {node: i for i, node in enumerate(graph)}
+        dependents: Dict[str, List[str]] = {node: [] for node in graph}
+        in_degree = {}
         for node, deps in graph.items():
             for dep in deps:
                 if dep not in graph:
                     raise ValueError(f"Unknown dependency: {dep}")
-        
-        for deps in graph.values():
-            for dep in deps:
-                if dep in in_degree:
-                    in_degree[dep] += 0  # Already counted
-        
-        # Kahn's algorithm with level tracking
-        # Recalculate in-degrees
-        in_degree = {node: 0 for node in graph}
-        for node, deps in graph.items():
+                dependents[dep].append(node)
             in_degree[node] = len(deps)
         
+        # Kahn's algorithm with level tracking
         levels = []
-        remaining = set(graph.keys())
+        ready = [n for n in graph if in_degree[n] == 0]
+        visited = 0
         
-        while remaining:
-            # Find all nodes with no remaining dependencies
-            ready = [n for n in remaining if in_degree[n] == 0]
-            
-            if not ready:
-                # Circular dependency detected
-                raise ValueError(f"Circular dependency detected among: {remaining}")
-            
+        while ready:
             levels.append(ready)
-            
+            visited += len(ready)
+            next_ready = []
             for node in ready:
-                remaining.remove(node)
-                # Decrease in-degree for dependent nodes
-                for other, deps in graph.items():
-                    if node in deps:
-                        in_degree[other] -= 1
+                for other in dependents[node]:
+                    in_degree[other] -= 1
+                    if in_degree[other] == 0:
+                        next_ready.append(other)
+            ready = next_ready
+        
+        if visited != len(graph):
+            remaining = {n for n, d in in_degree.items() if d > 0}
+            raise ValueError(f"Circular dependency detected among: {remaining}")
+        
+        weight = DependencyResolver.fan_out_weights(graph, levels)
+        for level in levels:
+            level.sort(key=lambda n: (-weight[n], order[n]))
         
         return levels
     
+    @staticmethod
+    def fan_out_weights(graph: Dict[str, Set[str]],
+                        levels: List[List[str]]) -> Dict[str, int]:
+        """
+        Weight each step by 1 plus the weights of the steps depending on it.
+        
+        Computed leaves-first by walking the topological levels backwards.
+        """
+        dependents: Dict[str, List[str]] = {node: [] for node in graph}
+        for node, deps in graph.items():
+            for dep in deps:
+                dependents[dep].append(node)
+        
+        weight: Dict[str, int] = {}
+        for level in reversed(levels):
+            for node in level:
+                weight[node] = 1 + sum(weight[d] for d in dependents[node])
+        return weight
+    
     @staticmethod
     def get_ready_steps(graph: Dict[str, Set[str]], 
                         completed: Set[str]) -> List[str]:
@@ -247,6 +307,36 @@ class DependencyResolver:
         return ready
 
 
+_shared_pools: Dict[int, ThreadPoolExecutor] = {}
+_shared_pools_lock = threading.Lock()
+_pool_worker = threading.local()
+
+
+def _mark_pool_worker() -> None:
+    _pool_worker.active = True
+
+
+def get_shared_pool(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Get the process-wide thread pool for the given worker count.
+    
+    Pools are created lazily on first use and live for the rest of the
+    process, so repeated workflow runs reuse their threads.
+    """
+    pool = _shared_pools.get(max_workers)
+    if pool is None:
+        with _shared_pools_lock:
+            pool = _shared_pools.get(max_workers)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=f"workflow-{max_workers}",
+                    initializer=_mark_pool_worker
+                )
+                _shared_pools[max_workers] = pool
+    return pool
+
+
 class WorkflowEngine:
     """
     Executes workflows with full orchestration capabilities.
@@ -262,7 +352,8 @@ class WorkflowEngine:
     
     def __init__(self, 
                  agent_executor: Optional[Callable] = None,
-                 max_workers: int = 4):
+                 max_workers: int = 4,
+                 executor: Optional[ThreadPoolExecutor] = None):
         """
         Initialize the workflow engine.
         
@@ -270,9 +361,13 @@ class WorkflowEngine:
             agent_executor: Callable that executes agent actions
                            Signature: (agent_name, action, params) -> result
             max_workers: Maximum parallel workers for concurrent execution
+            executor: Thread pool to run parallel steps on; defaults to the
+                      process-wide pool for ``max_workers``. Never shut down
+                      by the engine.
         """
         self.agent_executor = agent_executor or self._default_executor
         self.max_workers = max_workers
+        self.executor = executor
         self._running = False
     
     def _default_executor(self, agent: str, action: str, params: Dict) -> Any:
@@ -295,6 +390,11 @@ class WorkflowEngine:
         Returns:
             WorkflowResult with execution details
         """
+        if inspect.iscoroutinefunction(self.agent_executor):
+            # Async executors run on an event loop; use aexecute() directly
+            # when already inside one
+            return asyncio.run(self.aexecute(workflow_config, inputs, parallel))
+        
         workflow_name = workflow_config.get("name", "unnamed")
         inputs = inputs or {}
         
@@ -305,6 +405,8 @@ class WorkflowEngine:
         )
         
         start_time = time.time()
+        pool: Optional[ThreadPoolExecutor] = None
+        owns_pool = False
         
         try:
             # Validate inputs
@@ -322,54 +424,146 @@ class WorkflowEngine:
             step_results: Dict[str, StepResult] = {}
             failed_steps: Set[str] = set()
             
-            # Execute each level
-            for level in execution_levels:
-                if parallel and len(level) > 1:
-                    level_results = self._execute_level_parallel(
-                        level, step_map, inputs, step_results, failed_steps,
-                        workflow_config.get("error_handling", {})
-                    )
+            if parallel and any(len(level) > 1 for level in execution_levels):
+                if self.executor is not None:
+                    pool = self.executor
+                elif getattr(_pool_worker, "active", False):
+                    # Nested run from inside a shared-pool step: waiting on the
+                    # shared pool here could starve it, so use a private one
+                    pool = ThreadPoolExecutor(max_workers=self.max_workers)
+                    owns_pool = True
                 else:
+                    pool = get_shared_pool(self.max_workers)
+            
+            error_handling = workflow_config.get("error_handling", {})
+            
+            if pool is not None:
+                self._execute_graph_parallel(
+                    dep_graph, execution_levels, step_map, inputs,
+                    step_results, failed_steps, error_handling, pool, result
+                )
+            else:
+                # Execute each level
+                for level in execution_levels:
                     level_results = self._execute_level_sequential(
                         level, step_map, inputs, step_results, failed_steps,
-                        workflow_config.get("error_handling", {})
+                        error_handling
                     )
-                
-                step_results.update(level_results)
-                
-                # Check for failures
-                for step_name, step_result in level_results.items():
-                    if step_result.status == StepStatus.FAILED:
-                        failed_steps.add(step_name)
-                        
-                        # Check error handling strategy
-                        strategy = workflow_config.get("error_handling", {}).get("strategy", "fail-fast")
-                        if strategy == "fail-fast":
-                            result.status = WorkflowStatus.FAILED
-                            result.error = f"Step '{step_name}' failed: {step_result.error}"
+                    
+                    for step_name, step_result in level_results.items():
+                        if self._record_failure(step_name, step_result, failed_steps,
+                                                error_handling, result):
                             break
-                
-                if result.status == WorkflowStatus.FAILED:
-                    break
+                    
+                    if result.status == WorkflowStatus.FAILED:
+                        break
             
-            # Determine final status
-            if result.status != WorkflowStatus.FAILED:
-                if failed_steps:
-                    result.status = WorkflowStatus.PARTIAL_SUCCESS
-                else:
-                    result.status = WorkflowStatus.COMPLETED
+            self._finalize_result(result, workflow_config, inputs, step_results, failed_steps)
             
-            result.steps = step_results
+        except Exception as e:
+            logger.exception(f"Workflow execution failed: {e}")
+            result.status = WorkflowStatus.FAILED
+            result.error = str(e)
+        finally:
+            if owns_pool:
+                pool.shutdown(wait=True)
+        
+        result.completed_at = datetime.utcnow().isoformat()
+        result.total_execution_time_ms = (time.time() - start_time) * 1000
+        
+        return result
+    
+    async def aexecute(self,
+                       workflow_config: Dict[str, Any],
+                       inputs: Optional[Dict[str, Any]] = None,
+                       parallel: bool = True) -> WorkflowResult:
+        """
+        Execute a workflow on the running event loop.
+        
+        Steps start as soon as their dependencies finish, with at most
+        ``max_workers`` in flight (one when ``parallel`` is False). Coroutine
+        agent executors are awaited directly, so independent steps overlap
+        their I/O on one loop; plain callables run via ``asyncio.to_thread``.
+        
+        Args:
+            workflow_config: Workflow configuration dictionary
+            inputs: Input parameters for the workflow
+            parallel: Whether to execute independent steps concurrently
             
-            # Extract outputs
-            output_config = workflow_config.get("outputs", {})
-            resolver = VariableResolver(inputs, step_results)
-            for output_name, output_def in output_config.items():
-                if isinstance(output_def, dict) and "from" in output_def:
-                    result.outputs[output_name] = resolver.resolve(f"${{{output_def['from']}}}")
-                else:
-                    result.outputs[output_name] = resolver.resolve(output_def)
+        Returns:
+            WorkflowResult with execution details
+        """
+        inputs = inputs or {}
+        result = WorkflowResult(
+            workflow_name=workflow_config.get("name", "unnamed"),
+            status=WorkflowStatus.PENDING,
+            started_at=datetime.utcnow().isoformat()
+        )
+        start_time = time.time()
+        
+        try:
+            self._validate_inputs(workflow_config, inputs)
+            
+            steps = workflow_config.get("steps", [])
+            step_map = {s["name"]: s for s in steps}
+            graph = DependencyResolver.build_dependency_graph(steps)
+            levels = DependencyResolver.topological_sort(graph)
+            
+            result.status = WorkflowStatus.RUNNING
+            step_results: Dict[str, StepResult] = {}
+            failed_steps: Set[str] = set()
+            error_handling = workflow_config.get("error_handling", {})
+            limit = max(1, self.max_workers) if parallel else 1
+            
+            order = {name: i for i, name in enumerate(graph)}
+            weight = DependencyResolver.fan_out_weights(graph, levels)
+            remaining = {name: len(deps) for name, deps in graph.items()}
+            dependents: Dict[str, List[str]] = {name: [] for name in graph}
+            for name, deps in graph.items():
+                for dep in deps:
+                    dependents[dep].append(name)
             
+            ready = [(-weight[n], order[n], n) for n in levels[0]] if levels else []
+            heapq.heapify(ready)
+            in_flight: Dict[asyncio.Task, str] = {}
+            stopped = False
+            
+            while ready or in_flight:
+                while ready and not stopped and len(in_flight) < limit:
+                    step_name = heapq.heappop(ready)[2]
+                    task = asyncio.ensure_future(self._aexecute_step(
+                        step_map[step_name], inputs, dict(step_results),
+                        set(failed_steps), error_handling
+                    ))
+                    in_flight[task] = step_name
+                
+                if not in_flight:
+                    break
+                
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step_name = in_flight.pop(task)
+                    try:
+                        step_result = task.result()
+                    except Exception as e:
+                        step_result = StepResult(
+                            step_name=step_name,
+                            status=StepStatus.FAILED,
+                            error=str(e)
+                        )
+                    step_results[step_name] = step_result
+                    
+                    if self._record_failure(step_name, step_result, failed_steps,
+                                            error_handling, result):
+                        stopped = True
+                    
+                    for other in dependents[step_name]:
+                        remaining[other] -= 1
+                        if remaining[other] == 0:
+                            heapq.heappush(ready, (-weight[other], order[other], other))
+            
+            self._finalize_result(result, workflow_config, inputs, step_results, failed_steps)
+        
         except Exception as e:
             logger.exception(f"Workflow execution failed: {e}")
             result.status = WorkflowStatus.FAILED
@@ -380,6 +574,94 @@ class WorkflowEngine:
         
         return result
     
+    def _finalize_result(self,
+                         result: WorkflowResult,
+                         workflow_config: Dict[str, Any],
+                         inputs: Dict[str, Any],
+                         step_results: Dict[str, StepResult],
+                         failed_steps: Set[str]) -> None:
+        """Set the final status, step results and declared outputs."""
+        # Determine final status
+        if result.status != WorkflowStatus.FAILED:
+            if failed_steps:
+                result.status = WorkflowStatus.PARTIAL_SUCCESS
+            else:
+                result.status = WorkflowStatus.COMPLETED
+        
+        result.steps = step_results
+        
+        # Extract outputs
+        output_config = workflow_config.get("outputs", {})
+        resolver = VariableResolver(inputs, step_results)
+        for output_name, output_def in output_config.items():
+            if isinstance(output_def, dict) and "from" in output_def:
+                result.outputs[output_name] = resolver.resolve(f"${{{output_def['from']}}}")
+            else:
+                result.outputs[output_name] = resolver.resolve(output_def)
+    
+    def validate_workflow(self, workflow_config: Dict[str, Any]) -> List[str]:
+        """
+        Validate a workflow definition without executing it.
+        
+        Step definitions are walked once, collecting names, dependencies and
+        ``${steps...}`` references (compiling each parameter template along
+        the way); the dependency graph is then checked for unknown steps and
+        cycles.
+        
+        Returns:
+            List of error messages (empty if the workflow is valid)
+        """
+        errors: List[str] = []
+        steps = workflow_config.get("steps")
+        if not isinstance(steps, list) or not steps:
+            return ["Workflow must define a non-empty 'steps' list"]
+        
+        graph: Dict[str, Set[str]] = {}
+        references: List[Tuple[str, str]] = []
+        
+        for index, step in enumerate(steps):
+            if not isinstance(step, dict):
+                errors.append(f"Step #{index + 1} must be an object")
+                continue
+            name = step.get("name")
+            if not name:
+                errors.append(f"Step #{index + 1} is missing 'name'")
+                continue
+            if name in graph:
+                errors.append(f"Duplicate step name: {name}")
+            for key in ("agent", "action"):
+                if not step.get(key):
+                    errors.append(f"Step '{name}' is missing '{key}'")
+            
+            graph.setdefault(name, set()).update(step.get("depends_on", []))
+            
+            pending = [step.get("params", {})]
+            while pending:
+                value = pending.pop()
+                if isinstance(value, str):
+                    for segment in _compile_template(value):
+                        if isinstance(segment, tuple) and segment[0] == "steps" and len(segment) > 1:
+                            references.append((name, segment[1]))
+                elif isinstance(value, dict):
+                    pending.extend(value.values())
+                elif isinstance(value, list):
+                    pending.extend(value)
+        
+        for name, deps in graph.items():
+            for dep in sorted(deps - graph.keys()):
+                errors.append(f"Step '{name}' depends on unknown step '{dep}'")
+        for name, target in references:
+            if target not in graph:
+                errors.append(f"Step '{name}' references unknown step '{target}'")
+        
+        if not errors:
+            try:
+                DependencyResolver.topological_sort(graph)
+            except ValueError as e:
+                errors.append(str(e))
+        
+        return errors
+    
     def _validate_inputs(self, workflow_config: Dict, inputs: Dict) -> None:
         """Validate workflow inputs against schema."""
         input_schema = workflow_config.get("inputs", {})
@@ -406,51 +688,109 @@ class WorkflowEngine:
             step_results[step_name] = result  # Update for subsequent steps
         return results
     
-    def _execute_level_parallel(self,
-                                 level: List[str],
-                                 step_map: Dict[str, Dict],
-                                 inputs: Dict,
-                                 step_results: Dict[str, StepResult],
-                                 failed_steps: Set[str],
-                                 error_handling: Dict) -> Dict[str, StepResult]:
-        """Execute a level of steps in parallel."""
-        results = {}
+    def _execute_graph_parallel(self,
+                                graph: Dict[str, Set[str]],
+                                levels: List[List[str]],
+                                step_map: Dict[str, Dict],
+                                inputs: Dict,
+                                step_results: Dict[str, StepResult],
+                                failed_steps: Set[str],
+                                error_handling: Dict,
+                                executor: ThreadPoolExecutor,
+                                result: WorkflowResult) -> None:
+        """
+        Execute the step graph on ``executor``, starting each step as soon as
+        its own dependencies have finished rather than waiting for the whole
+        previous level.
+        
+        Ready steps are dispatched highest fan-out weight first. The loop
+        sleeps in ``wait(FIRST_COMPLETED)`` until a step finishes; after a
+        fail-fast failure nothing new is started, but in-flight steps are
+        allowed to finish and are recorded.
+        """
+        order = {name: i for i, name in enumerate(graph)}
+        weight = DependencyResolver.fan_out_weights(graph, levels)
+        remaining = {name: len(deps) for name, deps in graph.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in graph}
+        for name, deps in graph.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        
+        ready = [(-weight[n], order[n], n) for n in levels[0]] if levels else []
+        heapq.heapify(ready)
+        in_flight: Dict[Future, str] = {}
+        stopped = False
         
-        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(level))) as executor:
-            futures = {
-                executor.submit(
+        while ready or in_flight:
+            while ready and not stopped:
+                step_name = heapq.heappop(ready)[2]
+                future = executor.submit(
                     self._execute_step,
-                    step_map[step_name], inputs, step_results.copy(), failed_steps, error_handling
-                ): step_name
-                for step_name in level
-            }
+                    step_map[step_name], inputs, dict(step_results),
+                    set(failed_steps), error_handling
+                )
+                in_flight[future] = step_name
+            
+            if not in_flight:
+                break
             
-            for future in as_completed(futures):
-                step_name = futures[future]
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                step_name = in_flight.pop(future)
                 try:
-                    results[step_name] = future.result()
+                    step_result = future.result()
                 except Exception as e:
-                    results[step_name] = StepResult(
+                    step_result = StepResult(
                         step_name=step_name,
                         status=StepStatus.FAILED,
                         error=str(e)
                     )
+                step_results[step_name] = step_result
+                
+                if self._record_failure(step_name, step_result, failed_steps,
+                                        error_handling, result):
+                    stopped = True
+                
+                for other in dependents[step_name]:
+                    remaining[other] -= 1
+                    if remaining[other] == 0:
+                        heapq.heappush(ready, (-weight[other], order[other], other))
+    
+    @staticmethod
+    def _record_failure(step_name: str,
+                        step_result: StepResult,
+                        failed_steps: Set[str],
+                        error_handling: Dict,
+                        result: WorkflowResult) -> bool:
+        """
+        Track a failed step; returns True if the workflow must stop.
+        """
+        if step_result.status != StepStatus.FAILED:
+            return False
+        failed_steps.add(step_name)
         
-        return results
+        # Check error handling strategy
+        if error_handling.get("strategy", "fail-fast") == "fail-fast":
+            if result.status != WorkflowStatus.FAILED:
+                result.status = WorkflowStatus.FAILED
+                result.error = f"Step '{step_name}' failed: {step_result.error}"
+            return True
+        return False
     
-    def _execute_step(self,
-                      step_config: Dict,
-                      inputs: Dict,
-                      step_results: Dict[str, StepResult],
-                      failed_steps: Set[str],
-                      error_handling: Dict) -> StepResult:
-        """Execute a single workflow step."""
-        step_name = step_config["name"]
-        agent = step_config["agent"]
-        action = step_config["action"]
+    def _begin_step(self,
+                    step_config: Dict,
+                    inputs: Dict,
+                    step_results: Dict[str, StepResult],
+                    failed_steps: Set[str],
+                    error_handling: Dict) -> Tuple[StepResult, Optional[Dict[str, Any]]]:
+        """
+        Create a step's result and resolve its parameters.
         
+        Returns the parameters as None when the step is blocked by a failed
+        dependency; the result is then already final.
+        """
         result = StepResult(
-            step_name=step_name,
+            step_name=step_config["name"],
             status=StepStatus.PENDING,
             started_at=datetime.utcnow().isoformat()
         )
@@ -464,14 +804,34 @@ class WorkflowEngine:
                 result.status = StepStatus.BLOCKED
                 result.error = f"Blocked by failed dependencies: {failed_deps}"
                 result.completed_at = datetime.utcnow().isoformat()
-                return result
+                return result, None
         
-        start_time = time.time()
         result.status = StepStatus.RUNNING
         
         # Resolve parameters
         resolver = VariableResolver(inputs, step_results)
-        params = resolver.resolve(step_config.get("params", {}))
+        return result, resolver.resolve(step_config.get("params", {}))
+    
+    @staticmethod
+    def _retry_delay(backoff: str, attempt: int) -> int:
+        """Seconds to wait before retrying after the given attempt."""
+        if backoff == "exponential":
+            return 2 ** attempt
+        return attempt + 1  # linear
+    
+    def _execute_step(self,
+                      step_config: Dict,
+                      inputs: Dict,
+                      step_results: Dict[str, StepResult],
+                      failed_steps: Set[str],
+                      error_handling: Dict) -> StepResult:
+        """Execute a single workflow step."""
+        start_time = time.time()
+        result, params = self._begin_step(
+            step_config, inputs, step_results, failed_steps, error_handling
+        )
+        if params is None:
+            return result
         
         # Get retry configuration
         retry_config = step_config.get("retry", {})
@@ -481,7 +841,7 @@ class WorkflowEngine:
         last_error = None
         for attempt in range(max_attempts):
             try:
-                output = self.agent_executor(agent, action, params)
+                output = self.agent_executor(step_config["agent"], step_config["action"], params)
                 result.status = StepStatus.COMPLETED
                 result.output = output
                 result.retries = attempt
@@ -491,12 +851,7 @@ class WorkflowEngine:
                 result.retries = attempt + 1
                 
                 if attempt < max_attempts - 1:
-                    # Calculate delay
-                    if backoff == "exponential":
-                        delay = 2 ** attempt
-                    else:  # linear
-                        delay = attempt + 1
-                    time.sleep(delay)
+                    time.sleep(self._retry_delay(backoff, attempt))
         else:
             # All retries exhausted
             result.status = StepStatus.FAILED
@@ -506,6 +861,52 @@ class WorkflowEngine:
         result.execution_time_ms = (time.time() - start_time) * 1000
         
         return result
+    
+    async def _aexecute_step(self,
+                             step_config: Dict,
+                             inputs: Dict,
+                             step_results: Dict[str, StepResult],
+                             failed_steps: Set[str],
+                             error_handling: Dict) -> StepResult:
+        """Execute a single workflow step on the event loop."""
+        start_time = time.time()
+        result, params = self._begin_step(
+            step_config, inputs, step_results, failed_steps, error_handling
+        )
+        if params is None:
+            return result
+        
+        retry_config = step_config.get("retry", {})
+        max_attempts = retry_config.get("max_attempts", 1)
+        backoff = retry_config.get("backoff", "linear")
+        is_async = inspect.iscoroutinefunction(self.agent_executor)
+        
+        last_error = None
+        for attempt in range(max_attempts):
+            try:
+                args = (step_config["agent"], step_config["action"], params)
+                if is_async:
+                    output = await self.agent_executor(*args)
+                else:
+                    output = await asyncio.to_thread(self.agent_executor, *args)
+                result.status = StepStatus.COMPLETED
+                result.output = output
+                result.retries = attempt
+                break
+            except Exception as e:
+                last_error = e
+                result.retries = attempt + 1
+                
+                if attempt < max_attempts - 1:
+                    await asyncio.sleep(self._retry_delay(backoff, attempt))
+        else:
+            result.status = StepStatus.FAILED
+            result.error = str(last_error)
+        
+        result.completed_at = datetime.utcnow().isoformat()
+        result.execution_time_ms = (time.time() - start_time) * 1000
+        
+        return result
 
 
 def load_workflow(path: str) -> Dict[str, Any]:
@@ -515,9 +916,11 @@ def load_workflow(path: str) -> Dict[str, Any]:
     if not file_path.exists():
         raise FileNotFoundError(f"Workflow file not found: {path}")
     
-    with open(file_path, "r") as f:
-        if file_path.suffix in (".yaml", ".yml"):
-            import yaml
+    if file_path.suffix in (".yaml", ".yml"):
+        import yaml
+        with open(file_path, "r") as f:
             return yaml.safe_load(f)
-        else:
-            return json.load(f)
+    
+    with open(file_path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)